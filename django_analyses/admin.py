@@ -14,7 +14,8 @@ import json
 from typing import Union
 
 from django.contrib import admin
-from django.db.models import JSONField
+from django.db.models import JSONField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.forms import widgets
 from django.urls import reverse
 from django.utils.safestring import mark_safe
@@ -40,6 +41,8 @@ from django_analyses.models.pipeline.node import Node
 from django_analyses.models.pipeline.pipe import Pipe
 from django_analyses.models.pipeline.pipeline import Pipeline
 from django_analyses.models.run import Run
+from django_analyses.models.run_status_count import RunStatusCount
+from django_analyses.models.utils.subquery_count import SubqueryCount
 from django_analyses.utils.html import Html
 
 DOWNLOAD_BUTTON = '<span><a href={url} type="button" class="button" id="run-{run_id}-download-button">{text}</a></span>'  # noqa: E501
@@ -80,6 +83,36 @@ def custom_titled_filter(title: str):
     return Wrapper
 
 
+def get_run_count(analysis_version_lookup: str):
+    """
+    Returns an expression annotating the number of runs of the analysis
+    versions referenced by *analysis_version_lookup* (relative to the
+    annotated model). Run status counters are summed if enabled, otherwise
+    runs are counted.
+
+    Parameters
+    ----------
+    analysis_version_lookup : str
+        Analysis version lookup of :class:`RunStatusCount` and :class:`Run`
+
+    Returns
+    -------
+    Expression
+        Run count expression
+    """
+    lookup = {analysis_version_lookup: OuterRef("pk")}
+    if RunStatusCount.objects.enabled:
+        counts = (
+            RunStatusCount.objects.filter(**lookup)
+            .order_by()
+            .values(analysis_version_lookup)
+            .annotate(total=Sum("count"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+    return SubqueryCount(Run.objects.filter(**lookup).order_by().values("id"))
+
+
 class PrettyJSONWidget(widgets.Textarea):
     def format_value(self, value):
         try:
@@ -135,12 +168,19 @@ class AnalysisVersionInline(admin.TabularInline):
         pk = instance.output_specification.id
         return Html.admin_link(model_name, pk)
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        return queryset.select_related(
+            "input_specification", "output_specification"
+        ).annotate(run_count=get_run_count("analysis_version"))
+
     def run_count(self, instance: AnalysisVersion) -> int:
-        return Run.objects.filter(analysis_version=instance).count()
+        return instance.run_count
 
     id_link.short_description = "ID"
     input_specification_link.short_description = "Input Specification"
     output_specification_link.short_description = "Output Specification"
+    run_count.short_description = "Run count"
 
 
 class NodeInline(admin.TabularInline):
@@ -253,8 +293,15 @@ class AnalysisAdmin(admin.ModelAdmin):
     readonly_fields = "run_count", "created", "modified"
     inlines = [AnalysisVersionInline]
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        run_count = get_run_count("analysis_version__analysis")
+        return queryset.annotate(run_count=run_count)
+
     def run_count(self, instance: Analysis) -> int:
-        return Run.objects.filter(analysis_version__analysis=instance).count()
+        return instance.run_count
+
+    run_count.admin_order_field = "run_count"
 
 
 # class NodeRunInline(TabularInlinePaginated, NonrelatedStackedInline):
@@ -568,14 +615,28 @@ class PipelineAdmin(admin.ModelAdmin):
     )
     inlines = (PipeInLine,)
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        in_pipeline = Q(pipe_source_set__pipeline=OuterRef("pk")) | Q(
+            pipe_destination_set__pipeline=OuterRef("pk")
+        )
+        nodes = Node.objects.filter(in_pipeline).order_by().values("id")
+        pipes = Pipe.objects.filter(pipeline=OuterRef("pk")).order_by()
+        return queryset.annotate(
+            node_count=SubqueryCount(nodes.distinct()),
+            pipe_count=SubqueryCount(pipes.values("id")),
+        )
+
     def node_count(self, instance: Pipeline) -> int:
-        return instance.node_set.count()
+        return instance.node_count
 
     def pipe_count(self, instance: Pipeline) -> int:
-        return instance.pipe_set.count()
+        return instance.pipe_count
 
     node_count.short_description = "# Nodes"
+    node_count.admin_order_field = "node_count"
     pipe_count.short_description = "# Pipes"
+    pipe_count.admin_order_field = "pipe_count"
 
 
 class InputInline(admin.TabularInline):
@@ -681,6 +742,9 @@ class AnalysisVersionAdmin(admin.ModelAdmin):
             {
                 "fields": (
                     "max_parallel",
+                    "batch_size",
+                    "interface_pool_size",
+                    "reset_method_key",
                     "run_method_key",
                     "nested_results_attribute",
                     "fixed_run_method_kwargs",
@@ -732,10 +796,17 @@ class AnalysisVersionAdmin(admin.ModelAdmin):
         pk = instance.id
         return Html.admin_link(model_name, pk)
 
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        return queryset.select_related(
+            "analysis", "input_specification", "output_specification"
+        ).annotate(run_count=get_run_count("analysis_version"))
+
     def run_count(self, instance: AnalysisVersion) -> int:
-        return Run.objects.filter(analysis_version=instance).count()
+        return instance.run_count
 
     analysis_link.short_description = "Analysis"
+    run_count.admin_order_field = "run_count"
     input_specification_link.short_description = "Input Specification"
     output_specification_link.short_description = "Output Specification"
     id_link.short_description = "ID"
@@ -3,6 +3,10 @@ Definition of an :class:`~django_analyses.filters.input.input.InputFilter`
 for the :class:`~django_analyses.models.input.input.Input` model.
 """
 
+from django_analyses.filters.utils import (
+    filter_by_definition_key,
+    filter_by_type,
+)
 from django_analyses.models.input.input import Input
 from django_analyses.models.input.types.input_types import InputTypes
 from django_filters import rest_framework as filters
@@ -30,13 +34,8 @@ class InputFilter(filters.FilterSet):
         fields = "run", "key"
 
     def filter_key(self, queryset, name, value):
-        ids = [
-            inpt.id for inpt in queryset.all() if value in inpt.definition.key
-        ]
-        return queryset.filter(id__in=ids)
+        lookup = self.filters["key"].lookup_expr
+        return filter_by_definition_key(queryset, Input, lookup, value)
 
     def filter_input_type(self, queryset, name, value):
-        ids = [
-            inpt.id for inpt in queryset.all() if inpt.get_type().name == value
-        ]
-        return queryset.filter(id__in=ids)
+        return filter_by_type(queryset, Input, value)
@@ -3,6 +3,10 @@ Definition of an :class:`~django_analyses.filters.output.output.OutputFilter`
 for the :class:`~django_analyses.models.output.output.Output` model.
 """
 
+from django_analyses.filters.utils import (
+    filter_by_definition_key,
+    filter_by_type,
+)
 from django_analyses.models.output.output import Output
 from django_analyses.models.output.types.output_types import OutputTypes
 from django_filters import rest_framework as filters
@@ -32,17 +36,8 @@ class OutputFilter(filters.FilterSet):
         fields = "run", "key"
 
     def filter_key(self, queryset, name, value):
-        ids = [
-            output.id
-            for output in queryset.all()
-            if value in output.definition.key
-        ]
-        return queryset.filter(id__in=ids)
+        lookup = self.filters["key"].lookup_expr
+        return filter_by_definition_key(queryset, Output, lookup, value)
 
     def filter_output_type(self, queryset, name, value):
-        ids = [
-            output.id
-            for output in queryset.all()
-            if output.get_type().name == value
-        ]
-        return queryset.filter(id__in=ids)
+        return filter_by_type(queryset, Output, value)
@@ -1,6 +1,11 @@
 """
 Utilities for the :mod:`~django_analyses.filters` module.
 """
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q, QuerySet
 from django_filters import rest_framework as filters
 
 
@@ -13,3 +18,140 @@ DEFAULT_LOOKUP_CHOICES = (
     ("icontains", "Contains (case-insensitive)"),
     ("exact", "Exact"),
 )
+
+
+@lru_cache(maxsize=None)
+def get_typed_subclasses(model: type) -> Tuple[type, ...]:
+    """
+    Returns the concrete subclasses of an input or output base model that
+    define their own *definition* field.
+
+    Parameters
+    ----------
+    model : type
+        :class:`~django_analyses.models.input.input.Input` or
+        :class:`~django_analyses.models.output.output.Output`
+
+    Returns
+    -------
+    Tuple[type, ...]
+        Typed subclasses
+    """
+    subclasses = []
+    for subclass in model.__subclasses__():
+        if subclass._meta.abstract or subclass._meta.proxy:
+            continue
+        try:
+            subclass._meta.get_field("definition")
+        except FieldDoesNotExist:
+            pass
+        else:
+            subclasses.append(subclass)
+        subclasses += get_typed_subclasses(subclass)
+    return tuple(subclasses)
+
+
+@lru_cache(maxsize=None)
+def get_subclasses_by_type(model: type) -> Dict[str, Tuple[type, ...]]:
+    """
+    Returns the typed subclasses of an input or output base model by the
+    name of the type returned by their :meth:`get_type` method.
+
+    Parameters
+    ----------
+    model : type
+        :class:`~django_analyses.models.input.input.Input` or
+        :class:`~django_analyses.models.output.output.Output`
+
+    Returns
+    -------
+    Dict[str, Tuple[type, ...]]
+        Subclasses by type name
+    """
+    subclasses = {}
+    for subclass in get_typed_subclasses(model):
+        type_name = subclass().get_type().name
+        subclasses[type_name] = subclasses.get(type_name, ()) + (subclass,)
+    return subclasses
+
+
+def filter_by_subclasses(queryset: QuerySet, subclass_querysets) -> QuerySet:
+    """
+    Filters a base model queryset to instances included in any of the
+    provided subclass querysets, using a primary key subquery for each.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        Base model queryset
+    subclass_querysets : Iterable[QuerySet]
+        Subclass querysets
+
+    Returns
+    -------
+    QuerySet
+        Filtered queryset
+    """
+    condition = Q(pk__in=[])
+    for subclass_queryset in subclass_querysets:
+        condition |= Q(pk__in=subclass_queryset.values("pk"))
+    return queryset.filter(condition)
+
+
+def filter_by_definition_key(
+    queryset: QuerySet, model: type, lookup: str, value: str
+) -> QuerySet:
+    """
+    Filters an input or output queryset by the key of the instances'
+    definitions.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        :class:`~django_analyses.models.input.input.Input` or
+        :class:`~django_analyses.models.output.output.Output` queryset
+    model : type
+        The queryset's base model
+    lookup : str
+        Key field lookup (e.g. "icontains")
+    value : str
+        Lookup value
+
+    Returns
+    -------
+    QuerySet
+        Filtered queryset
+    """
+    key_filter = {f"definition__key__{lookup}": value}
+    return filter_by_subclasses(
+        queryset,
+        (
+            subclass.objects.filter(**key_filter)
+            for subclass in get_typed_subclasses(model)
+        ),
+    )
+
+
+def filter_by_type(queryset: QuerySet, model: type, value: str) -> QuerySet:
+    """
+    Filters an input or output queryset by the instances' type.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        :class:`~django_analyses.models.input.input.Input` or
+        :class:`~django_analyses.models.output.output.Output` queryset
+    model : type
+        The queryset's base model
+    value : str
+        Type name
+
+    Returns
+    -------
+    QuerySet
+        Filtered queryset
+    """
+    subclasses = get_subclasses_by_type(model).get(value, ())
+    return filter_by_subclasses(
+        queryset, (subclass.objects.all() for subclass in subclasses)
+    )
@@ -0,0 +1,88 @@
+"""
+Definition of the :mod:`backfill_run_fingerprints` management command.
+"""
+from django.core.management.base import BaseCommand
+from django_analyses.models.run import Run
+from django_analyses.utils.progressbar import create_progressbar
+
+#: Default number of runs updated per query.
+DEFAULT_BATCH_SIZE = 500
+
+FINISHED = "Updated the configuration fingerprints of {n_runs} runs."
+
+
+class Command(BaseCommand):
+    """
+    Computes and stores the
+    :attr:`~django_analyses.models.run.Run.configuration_fingerprint` of runs
+    created before fingerprints were introduced.
+    """
+
+    help = "Computes configuration fingerprints for existing runs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--analysis-version",
+            type=int,
+            nargs="*",
+            dest="analysis_version_ids",
+            help="Only update runs of the analysis versions with these IDs.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of runs to update per query.",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            dest="recompute",
+            help="Recompute existing fingerprints as well.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        # Failed runs with no inputs have no configuration to fingerprint.
+        runs = Run.objects.exclude_failed_without_inputs().with_inputs()
+        if not options["recompute"]:
+            runs = runs.filter(configuration_fingerprint__isnull=True)
+        if options["analysis_version_ids"]:
+            runs = runs.filter(
+                analysis_version__in=options["analysis_version_ids"]
+            )
+        iterable = create_progressbar(
+            runs.iterator(chunk_size=batch_size),
+            disable=options["verbosity"] < 1,
+            unit="run",
+            desc="Fingerprinting runs",
+        )
+        batch = []
+        n_runs = 0
+        for run in iterable:
+            run.configuration_fingerprint = run.get_configuration_fingerprint()
+            batch.append(run)
+            if len(batch) >= batch_size:
+                n_runs += self.update(batch)
+                batch = []
+        n_runs += self.update(batch)
+        if options["verbosity"] > 0:
+            self.stdout.write(FINISHED.format(n_runs=n_runs))
+
+    def update(self, runs: list) -> int:
+        """
+        Saves the fingerprints of the provided runs using a single query.
+
+        Parameters
+        ----------
+        runs : list
+            Runs with updated fingerprints
+
+        Returns
+        -------
+        int
+            Number of updated runs
+        """
+        if runs:
+            Run.objects.bulk_update(runs, ["configuration_fingerprint"])
+        return len(runs)
@@ -0,0 +1,171 @@
+"""
+Definition of the :mod:`cleanup_run_directories` management command.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django_analyses.models.run import Run
+from django_analyses.utils.run_cleanup import remove_directories
+
+#: Default number of directories checked per query.
+DEFAULT_BATCH_SIZE = 1000
+
+#: Default number of threads used to inspect and remove directories.
+DEFAULT_JOBS = 4
+
+#: Default minimal age (in hours) of removed directories.
+DEFAULT_MIN_AGE = 1
+
+DRY_RUN_FINISHED = "Found {n_orphans} orphaned run directories (dry run)."
+FINISHED = "Removed {n_removed} orphaned run directories."
+MISSING_BASE_PATH = "{path} does not exist."
+
+
+class Command(BaseCommand):
+    """
+    Removes directories under *ANALYSIS_BASE_PATH* that do not belong to
+    any existing :class:`~django_analyses.models.run.Run` instance, e.g.
+    directories left behind by runs deleted before their directories were
+    removed. Directories modified recently are kept, as they may belong to
+    runs created within uncommitted transactions.
+    """
+
+    help = "Removes run directories with no matching run."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List orphaned directories without removing them.",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=DEFAULT_JOBS,
+            help="Number of threads used to inspect and remove directories.",
+        )
+        parser.add_argument(
+            "--min-age",
+            type=float,
+            default=DEFAULT_MIN_AGE,
+            help="Only remove directories not modified for this many hours.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of directories checked per query.",
+        )
+
+    def handle(self, *args, **options):
+        base_path = Path(settings.ANALYSIS_BASE_PATH)
+        if not base_path.is_dir():
+            self.stderr.write(MISSING_BASE_PATH.format(path=base_path))
+            return
+        jobs = options["jobs"]
+        max_mtime = time.time() - options["min_age"] * 3600
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            orphans = []
+            for paths in self.iterate_batches(
+                base_path, options["batch_size"]
+            ):
+                paths = self.get_orphans(paths)
+                is_old = executor.map(
+                    lambda path: self.get_mtime(path) < max_mtime, paths
+                )
+                orphans += [path for path, old in zip(paths, is_old) if old]
+            if options["dry_run"]:
+                for path in orphans:
+                    self.stdout.write(str(path))
+                message = DRY_RUN_FINISHED.format(n_orphans=len(orphans))
+            else:
+                chunks = [orphans[index::jobs] for index in range(jobs)]
+                n_removed = sum(executor.map(remove_directories, chunks))
+                message = FINISHED.format(n_removed=n_removed)
+        if options["verbosity"] > 0:
+            self.stdout.write(message)
+
+    def iterate_batches(
+        self, base_path: Path, batch_size: int
+    ) -> Iterator[List[Path]]:
+        """
+        Yields batches of the run directories found under the base path
+        (directories named by an integer).
+
+        Parameters
+        ----------
+        base_path : Path
+            *ANALYSIS_BASE_PATH*
+        batch_size : int
+            Number of directories per batch
+
+        Yields
+        ------
+        List[Path]
+            Run directories
+        """
+        batch = []
+        with os.scandir(base_path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if entry.name.isdigit() and is_dir:
+                    batch.append(Path(entry.path))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        if batch:
+            yield batch
+
+    def get_orphans(self, paths: List[Path]) -> List[Path]:
+        """
+        Returns the directories with no matching run.
+
+        Parameters
+        ----------
+        paths : List[Path]
+            Run directories
+
+        Returns
+        -------
+        List[Path]
+            Orphaned directories
+        """
+        run_ids = [int(path.name) for path in paths]
+        existing = set(
+            Run.objects.filter(id__in=run_ids).values_list("id", flat=True)
+        )
+        return [
+            path
+            for run_id, path in zip(run_ids, paths)
+            if run_id not in existing
+        ]
+
+    def get_mtime(self, path: Path) -> float:
+        """
+        Returns the latest modification time of a directory or any of the
+        files within it.
+
+        Parameters
+        ----------
+        path : Path
+            Directory
+
+        Returns
+        -------
+        float
+            Modification timestamp
+        """
+        mtime = path.stat().st_mtime
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    file_mtime = os.stat(os.path.join(root, name)).st_mtime
+                except FileNotFoundError:
+                    continue
+                mtime = max(mtime, file_mtime)
+        return mtime
@@ -0,0 +1,26 @@
+"""
+Definition of the :mod:`rebuild_run_status_counts` management command.
+"""
+from django.core.management.base import BaseCommand
+from django_analyses.models.run_status_count import RunStatusCount
+
+FINISHED = "Rebuilt {n_counters} run status counters."
+
+
+class Command(BaseCommand):
+    """
+    Recomputes all
+    :class:`~django_analyses.models.run_status_count.RunStatusCount`
+    counters and
+    :class:`~django_analyses.models.run_duration_count.RunDurationCount`
+    histograms from the runs table. Should be run after enabling
+    *ANALYSIS_RUN_STATUS_COUNTERS* or updating runs in bulk (which does not
+    send signals).
+    """
+
+    help = "Recomputes run status counters and duration histograms."
+
+    def handle(self, *args, **options):
+        n_counters = RunStatusCount.objects.rebuild()
+        if options["verbosity"] > 0:
+            self.stdout.write(FINISHED.format(n_counters=n_counters))
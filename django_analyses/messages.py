@@ -2,5 +2,6 @@
 General message strings.
 """
 RUN_EXECUTION_FAILURE: str = "\n\n{run} execution failed!\nFor more information, see the traceback."
+BATCH_EXECUTION_FAILURE: str = "\n\n{n_failed} of {n_inputs} executions of node #{node_id} failed:\n{failures}"
 
 # flake8: noqa: E501
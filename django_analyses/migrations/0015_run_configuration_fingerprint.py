@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0014_auto_20220130_1027'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='run',
+            name='configuration_fingerprint',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='run',
+            index=models.Index(fields=['analysis_version', 'configuration_fingerprint'], name='run_configuration_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0015_run_configuration_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisversion',
+            name='batch_size',
+            field=models.PositiveIntegerField(blank=True, help_text='Number of inputs executed per task when running a list of inputs (derived from the maximal number of parallel executions if not set)', null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0016_analysisversion_batch_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analysisversion',
+            name='interface_pool_size',
+            field=models.PositiveIntegerField(default=0, help_text='Maximal number of initialized interface instances kept for reuse by each worker process (0 disables pooling)'),
+        ),
+        migrations.AddField(
+            model_name='analysisversion',
+            name='reset_method_key',
+            field=models.CharField(blank=True, help_text='Interface method called to reset any per-run state before a pooled instance is reused', max_length=100, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0017_analysisversion_interface_pool'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='run',
+            index=models.Index(fields=['created', 'id'], name='run_created_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_celery_results', '0007_remove_taskresult_hidden'),
+        ('django_analyses', '0018_run_created_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='run',
+            name='task_result',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='django_celery_results.taskresult'),
+        ),
+    ]
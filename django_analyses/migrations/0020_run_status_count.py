@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:48
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0019_run_task_result_foreign_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RunStatusCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('STARTED', 'Started'), ('SUCCESS', 'Success'), ('FAILURE', 'Failure')], max_length=7)),
+                ('count', models.BigIntegerField(default=0)),
+                ('analysis_version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='run_status_count_set', to='django_analyses.analysisversion')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='runstatuscount',
+            constraint=models.UniqueConstraint(fields=('analysis_version', 'status'), name='unique_run_status_count'),
+        ),
+    ]
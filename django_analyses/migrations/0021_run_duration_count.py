@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:54
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_analyses', '0020_run_status_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='runstatuscount',
+            name='duration_count',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='runstatuscount',
+            name='duration_total',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='runstatuscount',
+            name='status',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('STARTED', 'Started'), ('SUCCESS', 'Success'), ('FAILURE', 'Failure')], max_length=7),
+        ),
+        migrations.CreateModel(
+            name='RunDurationCount',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('STARTED', 'Started'), ('SUCCESS', 'Success'), ('FAILURE', 'Failure')], max_length=7)),
+                ('bucket', models.PositiveSmallIntegerField()),
+                ('count', models.BigIntegerField(default=0)),
+                ('analysis_version', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='run_duration_count_set', to='django_analyses.analysisversion')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='rundurationcount',
+            constraint=models.UniqueConstraint(fields=('analysis_version', 'status', 'bucket'), name='unique_run_duration_count'),
+        ),
+    ]
@@ -29,3 +29,5 @@ from django_analyses.models.output.output_specification import \
 from django_analyses.models.output.types import FileOutput, FloatOutput
 from django_analyses.models.pipeline import Node, Pipe, Pipeline
 from django_analyses.models.run import Run
+from django_analyses.models.run_duration_count import RunDurationCount
+from django_analyses.models.run_status_count import RunStatusCount
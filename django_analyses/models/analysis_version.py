@@ -1,6 +1,8 @@
 """
 Definition of the :class:`AnalysisVersion` class.
 """
+import math
+from contextlib import contextmanager
 from typing import Any
 
 from django.db import models
@@ -8,7 +10,13 @@ from django_analyses.models import help_text
 from django_analyses.models.managers.analysis_version import (
     AnalysisVersionManager,
 )
-from django_analyses.models.utils import get_analysis_version_interface
+from django_analyses.models.utils import (
+    get_analysis_version_interface,
+    interface_pool,
+)
+from django_analyses.models.utils.configuration_fingerprint import (
+    get_instance_key,
+)
 from django_analyses.models.utils.json_field import DefaultJSONField
 from django_extensions.db.models import TimeStampedModel, TitleDescriptionModel
 
@@ -135,8 +143,48 @@ class AnalysisVersion(TitleDescriptionModel, TimeStampedModel):
        https://docs.celeryproject.org/en/stable/userguide/canvas.html#chunks
     """
 
+    batch_size = models.PositiveIntegerField(
+        blank=True, null=True, help_text=help_text.BATCH_SIZE
+    )
+    """
+    Number of inputs executed by each
+    :func:`~django_analyses.tasks.execute_node_batch` task when a node is run
+    with a list of inputs. Batching amortizes the per-task overhead of short
+    executions. If not set, the inputs are split into at most
+    :attr:`max_parallel` batches.
+    """
+
+    interface_pool_size = models.PositiveIntegerField(
+        default=0, help_text=help_text.INTERFACE_POOL_SIZE
+    )
+    """
+    Maximal number of initialized interface instances kept for reuse by each
+    worker process. Pooling is meant for interfaces with expensive
+    initialization (e.g. loading templates or model weights), so that only
+    the *run* method is called for every input. Instances are reused only for
+    identical initialization parameters, and the least recently used ones are
+    evicted first. Pooling is disabled by default.
+    """
+
+    reset_method_key = models.CharField(
+        max_length=100,
+        blank=True,
+        null=True,
+        help_text=help_text.RESET_METHOD_KEY,
+    )
+    """
+    Name of an interface method to call after each execution of a pooled
+    instance in order to reset any per-run state. Setting a reset method also
+    enables reusing interface instances across the executions of a batch
+    (see :meth:`reuse_interface_instances`).
+    """
+
     objects = AnalysisVersionManager()
 
+    # Interface instances reused within a
+    # :meth:`reuse_interface_instances` block, by initialization kwargs.
+    _interface_instances = None
+
     class Meta:
         unique_together = "analysis", "title"
         ordering = (
@@ -186,10 +234,11 @@ class AnalysisVersion(TitleDescriptionModel, TimeStampedModel):
         dict
             Initialization parameters as a keyword arguments dict
         """
+        specification = self.input_specification
         return {
             key: value
             for key, value in kwargs.items()
-            if not self.input_definitions.get(key=key).run_method_input
+            if not specification.get_definition(key).run_method_input
         }
 
     def get_run_method_kwargs(self, **kwargs) -> dict:
@@ -202,12 +251,122 @@ class AnalysisVersion(TitleDescriptionModel, TimeStampedModel):
         dict
             :meth:`run` method parameters as a keyword arguments dict
         """
+        specification = self.input_specification
         return {
             key: value
             for key, value in kwargs.items()
-            if self.input_definitions.get(key=key).run_method_input
+            if specification.get_definition(key).run_method_input
         }
 
+    def get_batch_size(self, n_inputs: int) -> int:
+        """
+        Returns the number of inputs to execute per task when running this
+        analysis version with *n_inputs* inputs.
+
+        Parameters
+        ----------
+        n_inputs : int
+            Total number of inputs
+
+        Returns
+        -------
+        int
+            Number of inputs per batch
+        """
+        if self.batch_size:
+            return self.batch_size
+        elif self.max_parallel:
+            return max(math.ceil(n_inputs / self.max_parallel), 1)
+        return 1
+
+    @contextmanager
+    def reuse_interface_instances(self):
+        """
+        Reuses interface instances created by :meth:`run_interface` with
+        identical initialization parameters within the block. Reuse is only
+        enabled if a :attr:`reset_method_key` is set, as instances may
+        otherwise carry state over from previous executions.
+        """
+        previous = self._interface_instances
+        if previous is None:
+            self._interface_instances = {}
+        try:
+            yield
+        finally:
+            self._interface_instances = previous
+
+    def reset_interface_instance(self, instance: object) -> None:
+        """
+        Calls the interface's reset method (see :attr:`reset_method_key`), if
+        defined, to clear any per-run state of a pooled instance.
+
+        Parameters
+        ----------
+        instance : object
+            Interface instance
+        """
+        if self.reset_method_key:
+            getattr(instance, self.reset_method_key)()
+
+    @contextmanager
+    def checkout_reused_instance(self, key: str, **init_kwargs):
+        """
+        Yields an interface instance reused within a
+        :meth:`reuse_interface_instances` block (or a new one outside of
+        it or if no :attr:`reset_method_key` is set). Reused instances are
+        reset (see :meth:`reset_interface_instance`) at the end of the block,
+        and discarded if resetting fails or the block raises an exception.
+
+        Parameters
+        ----------
+        key : str
+            Instance key, as returned by
+            :func:`~django_analyses.models.utils.configuration_fingerprint.get_instance_key`
+        """
+        if self._interface_instances is None or not self.reset_method_key:
+            yield self.interface(**init_kwargs)
+            return
+        instance = self._interface_instances.pop(key, None)
+        if instance is None:
+            instance = self.interface(**init_kwargs)
+        yield instance
+        try:
+            self.reset_interface_instance(instance)
+        except Exception:
+            return
+        self._interface_instances[key] = instance
+
+    @contextmanager
+    def checkout_interface_instance(self, **init_kwargs):
+        """
+        Yields an interface instance initialized with the provided keyword
+        arguments. If :attr:`interface_pool_size` is set and all arguments
+        are primitive (see
+        :func:`~django_analyses.models.utils.configuration_fingerprint.get_instance_key`),
+        the instance is checked out of the worker process's interface pool and
+        returned to it at the end of the block. Otherwise, instances are
+        reused within :meth:`reuse_interface_instances` blocks (see
+        :meth:`checkout_reused_instance`).
+        """
+        key = get_instance_key(init_kwargs)
+        if key is None:
+            # Instances initialized with non-primitive arguments are never
+            # reused, as their arguments can not be reliably compared.
+            yield self.interface(**init_kwargs)
+            return
+        if not self.interface_pool_size or self.pk is None:
+            with self.checkout_reused_instance(key, **init_kwargs) as instance:
+                yield instance
+            return
+        with interface_pool.checkout(
+            self.pk,
+            key,
+            factory=lambda: self.interface(**init_kwargs),
+            max_size=self.interface_pool_size,
+            reset=self.reset_interface_instance,
+        ) as instance:
+            yield instance
+
     def run_interface(self, **kwargs) -> dict:
         """
         Call the interface class's :meth:`run` method with the given keyword
@@ -218,9 +377,7 @@ class AnalysisVersion(TitleDescriptionModel, TimeStampedModel):
         dict
             Dictionary of results
         """
-        # Initialize the interface class
         init_kwargs = self.get_interface_initialization_kwargs(**kwargs)
-        instance = self.interface(**init_kwargs)
 
         # Prepare run method kwargs
         run_method_kwargs = {
@@ -229,8 +386,9 @@ class AnalysisVersion(TitleDescriptionModel, TimeStampedModel):
         }
 
         # Run the analysis and return the results dictionary
-        run_method = getattr(instance, self.run_method_key)
-        return run_method(**run_method_kwargs)
+        with self.checkout_interface_instance(**init_kwargs) as instance:
+            run_method = getattr(instance, self.run_method_key)
+            return run_method(**run_method_kwargs)
 
     def extract_results(self, results: Any) -> dict:
         """
@@ -1,8 +1,11 @@
+BATCH_SIZE = "Number of inputs executed per task when running a list of inputs (derived from the maximal number of parallel executions if not set)"
 DB_VALUE_PREPROCESSING = "Calls or returns the specified input value's attribute when saved to the database"
 FIXED_KWARGS = "Fixed run method keyword arguments"
+INTERFACE_POOL_SIZE = "Maximal number of initialized interface instances kept for reuse by each worker process (0 disables pooling)"
 IS_CONFIGURATION = "Whether this definition represents a configuration of the analysis (rather than data input)"
 MAX_PARALLEL = "Maximal number of parallel executions"
 NESTED_RESULTS_ATTRIBUTE = "Name of an attribute to be returned or called in order to retreive the output dictionary"
+RESET_METHOD_KEY = "Interface method called to reset any per-run state before a pooled instance is reused"
 RUN_METHOD_INPUT = "Pass this input when calling the run method (and not at interface initialization)"
 RUN_METHOD_KEY = "Custom run method name"
 VALUE_ATTRIBUTE = "Calls or returns the specified input value's attribute when passed to the interface"
@@ -207,6 +207,27 @@ class InputDefinition(models.Model):
             self.check_input_class_definition()
             raise
 
+    def build_input_instance(self, **kwargs) -> Input:
+        """
+        Returns an unsaved instance of the appropriate
+        :class:`django_analyses.models.input.input.Input` subclass.
+
+        Returns
+        -------
+        Input
+            Unsaved instance
+
+        See Also
+        --------
+        * :meth:`get_or_create_input_instance`
+        """
+        kwargs["value"] = self.get_db_value(kwargs.get("value"))
+        try:
+            return self.input_class(definition=self, **kwargs)
+        except TypeError:
+            self.check_input_class_definition()
+            raise
+
     def validate(self) -> None:
         """
         Validates input definition instances before calling :func:`save`.
@@ -2,13 +2,17 @@
 Definition of the :class:`InputSpecification` class.
 """
 
-from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from django_analyses.models.input.definitions.input_definition import (
+    InputDefinition,
+)
 from django_analyses.models.input.messages import REQUIRED_VALUE_MISSING
 from django_analyses.models.managers.input_specification import (
     InputSpecificationManager,
 )
+from django_analyses.models.utils.definition_cache import definition_cache
 from django_extensions.db.models import TimeStampedModel
 
 
@@ -24,33 +28,84 @@ class InputSpecification(TimeStampedModel):
 
     def __str__(self) -> str:
         formatted_definitions = "\n\t".join(
-            [str(definition) for definition in self.input_definitions]
+            [
+                str(definition)
+                for definition in self.get_definitions_by_key().values()
+            ]
         )
         return f"\n[{self.analysis}]\n\t{formatted_definitions}\n"
 
+    def get_definitions_by_key(self) -> dict:
+        """
+        Returns this specification's input definitions as a dictionary with
+        their keys as keys.
+
+        Definitions are queried once per process and cached until the
+        specification or any of its definitions change (see
+        :class:`~django_analyses.models.utils.definition_cache.DefinitionCache`).
+
+        Returns
+        -------
+        dict
+            Input definitions by key
+        """
+        return definition_cache.get(self, self.get_input_definitions)
+
+    def get_definition(self, key: str) -> InputDefinition:
+        """
+        Returns the input definition with the provided key.
+
+        Parameters
+        ----------
+        key : str
+            Input definition key
+
+        Returns
+        -------
+        InputDefinition
+            Matching input definition
+
+        Raises
+        ------
+        InputDefinition.DoesNotExist
+            No input definition with the provided key
+        """
+        try:
+            return self.get_definitions_by_key()[key]
+        except KeyError:
+            raise InputDefinition.DoesNotExist(
+                f"Invalid input key: '{key}'!"
+            )
+
+    def get_input_definitions(self) -> models.QuerySet:
+        return self.base_input_definitions.select_subclasses()
+
     def get_default_input_configurations(self) -> dict:
         return {
             definition.key: definition.default
-            for definition in self.input_definitions
+            for definition in self.get_definitions_by_key().values()
             if definition.default is not None
         }
 
     def get_configuration_keys(self) -> set:
         return {
             definition.key
-            for definition in self.input_definitions
+            for definition in self.get_definitions_by_key().values()
             if definition.is_configuration
         }
 
     def validate_keys(self, **kwargs) -> None:
+        definitions = self.get_definitions_by_key()
         for key in kwargs:
-            try:
-                self.input_definitions.get(key=key)
-            except ObjectDoesNotExist:
+            if key not in definitions:
                 raise ValidationError(_(f"Invalid input key: '{key}'!"))
 
     def validate_required(self, **kwargs) -> None:
-        required = self.input_definitions.filter(required=True)
+        required = [
+            definition
+            for definition in self.get_definitions_by_key().values()
+            if definition.required
+        ]
         for definition in required:
             if definition.key not in kwargs:
                 message = REQUIRED_VALUE_MISSING.format(
@@ -68,7 +123,7 @@ class InputSpecification(TimeStampedModel):
 
     @property
     def input_definitions(self) -> models.QuerySet:
-        return self.base_input_definitions.select_subclasses()
+        return self.get_input_definitions()
 
     @property
     def configuration_keys(self) -> set:
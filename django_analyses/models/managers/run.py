@@ -1,29 +1,264 @@
 """
 Definition of the :class:`RunManager` class.
 """
-from typing import Any, Dict, Iterable, Union
+import operator
+from functools import reduce
+from typing import Any, Dict, Iterable, Optional, Union
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.utils import timezone
 from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.input.input import Input
 from django_analyses.models.managers.messages import (
     INVALID_INPUT_DEFINITION_KEY,
 )
+from django_analyses.models.output.output import Output
+from django_analyses.models.utils import get_configuration_fingerprint
 from django_analyses.utils.input_manager import InputManager
 from django_analyses.utils.output_manager import OutputManager
+from django_analyses.utils.results_export import (
+    DEFAULT_CHUNK_SIZE,
+    ResultsExporter,
+)
 
 User = get_user_model()
 
 
-class RunManager(models.Manager):
+class RunQuerySet(models.QuerySet):
+    """
+    Custom :class:`~django.db.models.query.QuerySet` for the
+    :class:`~django_analyses.models.run.Run` model.
+    """
+
+    def with_io(self) -> models.QuerySet:
+        """
+        Prefetches the runs' inputs and outputs (as their subclasses'
+        instances), as well as the runs' analysis versions and
+        specifications. Definitions are then assigned from the process-wide
+        definition cache, so that reading the inputs and outputs of any
+        number of runs requires a fixed number of queries.
+
+        Returns
+        -------
+        models.QuerySet
+            Runs with prefetched inputs and outputs
+
+        See Also
+        --------
+        * :meth:`~django_analyses.models.run.Run.get_inputs_by_key`
+        * :meth:`~django_analyses.models.run.Run.get_outputs_by_key`
+        """
+        return (
+            self.with_inputs()
+            .select_related("analysis_version__output_specification")
+            .prefetch_related(
+                models.Prefetch(
+                    "base_output_set",
+                    queryset=Output.objects.select_subclasses(),
+                )
+            )
+        )
+
+    def with_inputs(self) -> models.QuerySet:
+        """
+        Prefetches the runs' inputs (as their subclasses' instances), as well
+        as the runs' analysis versions and input specifications, so that
+        reading the input configurations of any number of runs requires a
+        fixed number of queries.
+
+        Returns
+        -------
+        models.QuerySet
+            Runs with prefetched inputs
+        """
+        return self.select_related(
+            "analysis_version__input_specification"
+        ).prefetch_related(
+            models.Prefetch(
+                "base_input_set", queryset=Input.objects.select_subclasses()
+            )
+        )
+
+    def exclude_failed_without_inputs(self) -> models.QuerySet:
+        """
+        Excludes failed runs with no inputs (i.e. runs for which input
+        creation failed), which have no configuration to compare or
+        fingerprint.
+
+        Returns
+        -------
+        models.QuerySet
+            Runs with inputs or that did not fail
+        """
+        has_inputs = models.Exists(
+            Input.objects.filter(run=models.OuterRef("pk"))
+        )
+        return self.filter(has_inputs | ~models.Q(status="FAILURE"))
+
+    def export_results(
+        self,
+        destination,
+        file_format: str = "csv",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Writes the outputs of the runs as a table with one row per run and
+        one column per output definition key.
+
+        Parameters
+        ----------
+        destination : Union[str, Path, IO]
+            Destination path or writable file object (text for CSV, binary
+            otherwise)
+        file_format : str, optional
+            One of "csv", "parquet" or "arrow", by default "csv"
+        chunk_size : int, optional
+            Number of runs read and written at a time, by default 1000
+
+        See Also
+        --------
+        * :class:`~django_analyses.utils.results_export.ResultsExporter`
+        """
+        exporter = ResultsExporter(self, chunk_size=chunk_size)
+        exporter.export(destination, file_format=file_format)
+
+
+class RunManager(models.Manager.from_queryset(RunQuerySet)):
     """
     Manager for the :class:`~django_analyses.models.run.Run` model. Handles the
     creation and retrieval of runs when
     :class:`~django_analyses.models.pipeline.node.Node` are executed.
     """
 
+    def get_input_condition(self, definition, value) -> models.Exists:
+        """
+        Returns a condition matching runs with an input of the provided
+        definition and value.
+
+        Parameters
+        ----------
+        definition : InputDefinition
+            Input definition
+        value : Any
+            Input value
+
+        Returns
+        -------
+        models.Exists
+            Input condition
+        """
+        inputs = definition.input_class.objects.filter(
+            run=models.OuterRef("pk"), definition=definition, value=value
+        )
+        return models.Exists(inputs)
+
+    def get_null_configuration_condition(
+        self, analysis_version: AnalysisVersion
+    ) -> models.Q:
+        """
+        Returns a condition matching runs with default values for all
+        configuration inputs (see
+        :meth:`~django_analyses.models.run.Run.check_null_configuration`),
+        using a single subquery per input subclass.
+
+        Parameters
+        ----------
+        analysis_version : AnalysisVersion
+            Queried analysis version
+
+        Returns
+        -------
+        models.Q
+            Null configuration condition
+        """
+        specification = analysis_version.input_specification
+        non_default = {}
+        for definition in specification.get_definitions_by_key().values():
+            # Inputs excluded from the raw input configuration.
+            excluded = getattr(
+                definition, "is_output_directory", False
+            ) or getattr(definition, "dynamic_default", None)
+            if not definition.is_configuration or excluded:
+                continue
+            condition = models.Q(definition=definition)
+            if definition.default is not None:
+                default = models.Q(value=definition.default)
+                if getattr(definition, "is_output_path", False):
+                    # Output paths are compared by their file name.
+                    default |= models.Q(
+                        value__endswith=f"/{definition.default}"
+                    )
+                condition &= ~default
+            input_class = definition.input_class
+            non_default[input_class] = (
+                non_default.get(input_class, models.Q()) | condition
+            )
+        return models.Q(
+            *[
+                ~models.Exists(
+                    input_class.objects.filter(
+                        condition, run=models.OuterRef("pk")
+                    )
+                )
+                for input_class, condition in non_default.items()
+            ]
+        )
+
+    def get_configuration_condition(
+        self,
+        analysis_version: AnalysisVersion,
+        configuration: Dict[str, Any],
+        strict: bool = False,
+        ignore_non_config: bool = False,
+    ) -> Optional[models.Q]:
+        """
+        Returns a condition matching runs with the provided *configuration*
+        (see :meth:`filter_by_configuration`).
+
+        Parameters
+        ----------
+        analysis_version : AnalysisVersion
+            Queried analysis version
+        configuration : Dict[str, Any]
+            Configuration options to filter by
+        strict : bool, optional
+            Whether to match unspecified keys' default values, by default
+            False
+        ignore_non_config : bool, optional
+            Whether to exclude non-configuration keys, by default False
+
+        Returns
+        -------
+        Optional[models.Q]
+            Configuration condition, or None if no run may match
+        """
+        if strict:
+            configuration = analysis_version.update_input_with_defaults(
+                configuration
+            )
+        # If the configuration dictionary is empty, match runs with default
+        # values only.
+        if not configuration:
+            return self.get_null_configuration_condition(analysis_version)
+        specification = analysis_version.input_specification
+        key_set = set(configuration)
+        if ignore_non_config:
+            key_set &= specification.configuration_keys
+        conditions = []
+        for key in sorted(key_set):
+            try:
+                definition = specification.get_definition(key)
+            except ObjectDoesNotExist:
+                # If an invalid input definition key was passed, there can be
+                # no matching runs.
+                return None
+            conditions.append(
+                self.get_input_condition(definition, configuration[key])
+            )
+        return models.Q(*conditions)
+
     def filter_by_configuration(
         self,
         analysis_version: AnalysisVersion,
@@ -33,7 +268,9 @@ class RunManager(models.Manager):
     ) -> models.QuerySet:
         """
         Returns a queryset of *analysis_version* runs matching the provided
-        *configuration*.
+        *configuration*, or any of the provided configurations. Each
+        configuration option is matched by an *EXISTS* subquery, so that
+        runs are filtered in a single query.
 
         Parameters
         ----------
@@ -54,108 +291,61 @@ class RunManager(models.Manager):
         models.QuerySet
             Matching runs
         """
-        # Filter by single configuration dictionary.
         if isinstance(configuration, dict):
-            if strict:
-                configuration = analysis_version.update_input_with_defaults(
-                    configuration
-                )
-            # Determine queried key set.
-            key_set = set(configuration.keys())
-            if ignore_non_config:
-                configuration_keys = (
-                    analysis_version.input_specification.configuration_keys
-                )
-                key_set = key_set.intersection(configuration_keys)
-            # Keep track of runs matching each configuration specification.
-            potential_runs = {key: [] for key in key_set}
-            # In case *strict* is True, keep a reference to the full key set.
-            if configuration:
-                # Update potential_runs with runs matching each specification
-                # in the provided configuration dictionary.
-                for key in key_set:
-                    value = configuration[key]
-                    try:
-                        definition = analysis_version.input_definitions.get(
-                            key=key
-                        )
-                    except ObjectDoesNotExist:
-                        # If an invalid input definition key was passed, there
-                        # can be no matching runs.
-                        return self.none()
-                    else:
-                        matching_input = definition.input_set.filter(
-                            value=value
-                        )
-                        if matching_input.exists():
-                            matching_runs = [
-                                inpt.run.id for inpt in matching_input
-                            ]
-                            potential_runs[key] += matching_runs
-                        else:
-                            # If no matches were found for any given input
-                            # value, it means no existing runs can exist for
-                            # the entire provided configuration.
-                            return self.none()
-                # Extract a set of runs satisfying all provided criteria.
-                run_ids = set.intersection(*map(set, potential_runs.values()))
-            # If the configuration dictionary is empty, the full queryset can
-            # be returned automatically.
-            else:
-                run_ids = (
-                    run.id
-                    for run in self.all()
-                    if run.check_null_configuration()
-                )
-            return self.filter(id__in=run_ids)
-        # Filter by multiple configuration dictionaries.
-        elif isinstance(configuration, Iterable):
-            run_ids = [
-                run.id
-                for run in filter(
-                    None,
-                    [
-                        self.filter_by_configuration(specification)
-                        for specification in configuration
-                    ],
-                )
-            ]
-            return self.filter(id__in=run_ids)
+            configuration = [configuration]
+        conditions = [
+            self.get_configuration_condition(
+                analysis_version,
+                specification,
+                strict=strict,
+                ignore_non_config=ignore_non_config,
+            )
+            for specification in configuration
+        ]
+        conditions = [
+            condition for condition in conditions if condition is not None
+        ]
+        if not conditions:
+            return self.none()
+        runs = self.filter(analysis_version=analysis_version)
+        # An empty condition matches all runs.
+        if not all(conditions):
+            return runs
+        return runs.filter(reduce(operator.or_, conditions))
 
-    def get_existing(
+    def prepare_configuration(
         self, analysis_version: AnalysisVersion, configuration: dict
-    ):
+    ) -> dict:
         """
-        Returns an existing run of the provided *analysis_version* with the
-        specified *configuration*.
+        Returns a copy of the provided *configuration* with values converted
+        to their database representation and updated with the analysis
+        version's default values.
 
         Parameters
         ----------
         analysis_version : AnalysisVersion
-            The desired AnalysisVersion instance for which a run is queried
+            The analysis version to which the configuration belongs
         configuration : dict
             Full input configuration (excluding default values)
 
         Returns
         -------
-        Run
-            Existing run with the specified *analysis_version* and
-            *configuration*
+        dict
+            Full input configuration as it is represented in the database
 
         Raises
         ------
         ObjectDoesNotExist
-            No matching run exists
+            Invalid input definition key
         """
-        runs = self.filter(analysis_version=analysis_version)
-
+        prepared = {}
         # ForeignKey fields are serialized to the database as the primary keys
         # of the associated instances, so in order to compare configurations
         # with model instances, we convert the value to primary key.
         for key, value in configuration.items():
             try:
-                input_definition = analysis_version.input_definitions.get(
-                    key=key
+                input_definition = (
+                    analysis_version.input_specification.get_definition(key)
                 )
             except ObjectDoesNotExist:
                 message = INVALID_INPUT_DEFINITION_KEY.format(
@@ -163,20 +353,86 @@ class RunManager(models.Manager):
                 )
                 raise ObjectDoesNotExist(message)
             if input_definition.db_value_preprocessing:
-                configuration[key] = input_definition.get_db_value(value)
+                value = input_definition.get_db_value(value)
             elif isinstance(value, models.Model):
-                configuration[key] = value.id
+                value = value.id
+            prepared[key] = value
         # Update with the analysis version's input specification deafults in
         # order to compare the full configuration.
-        configuration = analysis_version.update_input_with_defaults(
-            configuration
+        return analysis_version.update_input_with_defaults(prepared)
+
+    def get_configuration_fingerprint(
+        self, analysis_version: AnalysisVersion, configuration: dict
+    ) -> str:
+        """
+        Returns the fingerprint of the provided *configuration* as it would be
+        stored for a run of *analysis_version*.
+
+        Parameters
+        ----------
+        analysis_version : AnalysisVersion
+            The analysis version to which the configuration belongs
+        configuration : dict
+            Full input configuration (excluding default values)
+
+        Returns
+        -------
+        str
+            Input configuration fingerprint
+        """
+        prepared = self.prepare_configuration(analysis_version, configuration)
+        return get_configuration_fingerprint(prepared)
+
+    def get_existing(
+        self, analysis_version: AnalysisVersion, configuration: dict
+    ):
+        """
+        Returns an existing run of the provided *analysis_version* with the
+        specified *configuration*.
+
+        Parameters
+        ----------
+        analysis_version : AnalysisVersion
+            The desired AnalysisVersion instance for which a run is queried
+        configuration : dict
+            Full input configuration (excluding default values)
+
+        Returns
+        -------
+        Run
+            Existing run with the specified *analysis_version* and
+            *configuration*
+
+        Raises
+        ------
+        ObjectDoesNotExist
+            No matching run exists
+        """
+        configuration = self.prepare_configuration(
+            analysis_version, configuration
+        )
+        fingerprint = get_configuration_fingerprint(configuration)
+        runs = self.filter(analysis_version=analysis_version)
+        # Runs created before configuration fingerprints were introduced
+        # (and not backfilled yet) are compared in Python. Failed runs with
+        # no inputs keep a null fingerprint but have no configuration to
+        # compare.
+        legacy_runs = (
+            runs.filter(configuration_fingerprint__isnull=True)
+            .exclude_failed_without_inputs()
+            .with_inputs()
         )
-        # Find a matching run instance (only one should exist) and return it
-        # or None.
         matching = [
-            run.id for run in runs if run.input_configuration == configuration
+            run.id
+            for run in legacy_runs
+            if run.input_configuration == configuration
         ]
-        return self.get(id__in=matching)
+        # Find a matching run instance (only one should exist) and return it
+        # or None.
+        return runs.get(
+            models.Q(configuration_fingerprint=fingerprint)
+            | models.Q(id__in=matching)
+        )
 
     def create_and_execute(
         self,
@@ -202,13 +458,22 @@ class RunManager(models.Manager):
         Run
             Resulting run instance
         """
+        try:
+            fingerprint = self.get_configuration_fingerprint(
+                analysis_version, configuration
+            )
+        except (ObjectDoesNotExist, ValueError):
+            # Invalid configurations are recorded as failed runs below.
+            fingerprint = None
         run = self.create(
             analysis_version=analysis_version,
             user=user,
             status="STARTED",
             start_time=timezone.now(),
+            configuration_fingerprint=fingerprint,
         )
         update_fields = []
+        inputs = None
         try:
             input_manager = InputManager(run=run, configuration=configuration)
             inputs = input_manager.create_input_instances()
@@ -223,6 +488,11 @@ class RunManager(models.Manager):
             run.traceback = str(e)
             run.end_time = timezone.now()
             update_fields = ["status", "traceback", "end_time"]
+            if inputs is None:
+                # The fingerprint must match the run's inputs, which were
+                # not created.
+                run.configuration_fingerprint = None
+                update_fields.append("configuration_fingerprint")
         else:
             run.status = "SUCCESS"
             run.end_time = timezone.now()
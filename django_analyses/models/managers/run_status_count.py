@@ -0,0 +1,331 @@
+"""
+Definition of a custom :class:`~django.db.models.Manager` for the
+:class:`~django_analyses.models.run_status_count.RunStatusCount` class.
+"""
+from typing import Dict, Iterable, List
+
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.db.models import Count, F, FloatField, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce
+from django_analyses.models.run import Run
+from django_analyses.models.run_duration_count import RunDurationCount
+from django_analyses.models.utils.duration_histogram import (
+    get_bucket_expression,
+    get_duration_bucket,
+    get_duration_expression,
+    get_percentile,
+)
+from django_analyses.models.utils.run_status import PENDING, RunStatus
+
+INCREMENT_SQL = """
+INSERT INTO {table}
+(analysis_version_id, status, count, duration_count, duration_total)
+VALUES (%s, %s, %s, %s, %s)
+ON CONFLICT (analysis_version_id, status)
+DO UPDATE SET
+count = {table}.count + EXCLUDED.count,
+duration_count = {table}.duration_count + EXCLUDED.duration_count,
+duration_total = {table}.duration_total + EXCLUDED.duration_total
+"""
+
+BUCKET_INCREMENT_SQL = """
+INSERT INTO {table} (analysis_version_id, status, bucket, count)
+VALUES (%s, %s, %s, %s)
+ON CONFLICT (analysis_version_id, status, bucket)
+DO UPDATE SET count = {table}.count + EXCLUDED.count
+"""
+
+#: Statuses reported by :meth:`RunStatusCountManager.get_summary`.
+SUMMARY_STATUSES = [PENDING] + [status.name for status in RunStatus]
+
+#: Duration percentile reported by :meth:`RunStatusCountManager.get_summary`.
+SUMMARY_PERCENTILE = 0.95
+
+
+class RunStatusCountManager(models.Manager):
+    """
+    Custom :class:`~django.db.models.Manager` for the
+    :class:`~django_analyses.models.run_status_count.RunStatusCount` class.
+    """
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether run status counters are maintained (as set by
+        *ANALYSIS_RUN_STATUS_COUNTERS*).
+
+        Returns
+        -------
+        bool
+            Whether counters are enabled
+        """
+        return getattr(settings, "ANALYSIS_RUN_STATUS_COUNTERS", False)
+
+    def increment(
+        self,
+        analysis_version_id: int,
+        status: str,
+        delta: int = 1,
+        duration: float = None,
+    ) -> None:
+        """
+        Adds *delta* to a counter (and to its duration histogram if a
+        duration is provided) using upsert queries, so that concurrent
+        updates of the same counter are not lost.
+
+        Parameters
+        ----------
+        analysis_version_id : int
+            Counted runs' analysis version ID
+        status : str
+            Counted runs' status
+        delta : int, optional
+            Counter change, by default 1
+        duration : float, optional
+            Counted runs' duration (in seconds), by default None
+        """
+        using = router.db_for_write(self.model)
+        has_duration = duration is not None
+        params = [
+            analysis_version_id,
+            status,
+            delta,
+            delta if has_duration else 0,
+            delta * duration if has_duration else 0,
+        ]
+        with connections[using].cursor() as cursor:
+            sql = INCREMENT_SQL.format(table=self.model._meta.db_table)
+            cursor.execute(sql, params)
+            if has_duration:
+                table = RunDurationCount._meta.db_table
+                bucket = get_duration_bucket(duration)
+                sql = BUCKET_INCREMENT_SQL.format(table=table)
+                cursor.execute(
+                    sql, [analysis_version_id, status, bucket, delta]
+                )
+
+    def get_run_counts(self) -> QuerySet:
+        """
+        Returns run counts and duration totals grouped by analysis version
+        and status, computed from the runs table.
+
+        Returns
+        -------
+        QuerySet
+            Run counts
+        """
+        return (
+            Run.objects.annotate(
+                counted_status=Coalesce("status", Value(PENDING)),
+                duration=get_duration_expression(),
+            )
+            .order_by()
+            .values("analysis_version", "counted_status")
+            .annotate(
+                count=Count("id"),
+                duration_count=Count("duration"),
+                duration_total=Coalesce(
+                    Sum("duration"), Value(0.0), output_field=FloatField()
+                ),
+            )
+        )
+
+    def get_run_duration_counts(self) -> QuerySet:
+        """
+        Returns run duration histograms grouped by analysis version and
+        status, computed from the runs table.
+
+        Returns
+        -------
+        QuerySet
+            Run counts by histogram bucket
+        """
+        return (
+            Run.objects.annotate(
+                counted_status=Coalesce("status", Value(PENDING)),
+                duration=get_duration_expression(),
+            )
+            .filter(duration__isnull=False)
+            .annotate(bucket=get_bucket_expression(F("duration")))
+            .order_by()
+            .values("analysis_version", "counted_status", "bucket")
+            .annotate(count=Count("id"))
+        )
+
+    def rebuild(self) -> int:
+        """
+        Recomputes all counters and duration histograms from the runs
+        table, e.g. after enabling counters or updating run statuses in
+        bulk.
+
+        Returns
+        -------
+        int
+            Number of counters
+        """
+        counters = [
+            self.model(
+                analysis_version_id=row["analysis_version"],
+                status=row["counted_status"],
+                count=row["count"],
+                duration_count=row["duration_count"],
+                duration_total=row["duration_total"],
+            )
+            for row in self.get_run_counts()
+        ]
+        buckets = [
+            RunDurationCount(
+                analysis_version_id=row["analysis_version"],
+                status=row["counted_status"],
+                bucket=row["bucket"],
+                count=row["count"],
+            )
+            for row in self.get_run_duration_counts()
+        ]
+        with transaction.atomic():
+            self.all().delete()
+            RunDurationCount.objects.all().delete()
+            self.bulk_create(counters)
+            RunDurationCount.objects.bulk_create(buckets)
+        return len(counters)
+
+    def get_count_rows(
+        self, analysis_version_ids: Iterable[int] = None
+    ) -> QuerySet:
+        """
+        Returns run counts and duration totals by analysis version and
+        status. Counters are used if enabled, otherwise runs are counted.
+
+        Parameters
+        ----------
+        analysis_version_ids : Iterable[int], optional
+            Analysis version IDs to include, by default None (all)
+
+        Returns
+        -------
+        QuerySet
+            Analysis version ID, status, count, duration count and duration
+            total tuples
+        """
+        fields = "count", "duration_count", "duration_total"
+        if self.enabled:
+            rows = self.filter(count__gt=0).values_list(
+                "analysis_version", "status", *fields
+            )
+        else:
+            rows = self.get_run_counts().values_list(
+                "analysis_version", "counted_status", *fields
+            )
+        if analysis_version_ids is not None:
+            rows = rows.filter(analysis_version__in=analysis_version_ids)
+        return rows
+
+    def get_bucket_rows(
+        self, analysis_version_ids: Iterable[int] = None
+    ) -> QuerySet:
+        """
+        Returns run counts by analysis version and duration histogram
+        bucket. Histograms are used if counters are enabled, otherwise run
+        durations are counted.
+
+        Parameters
+        ----------
+        analysis_version_ids : Iterable[int], optional
+            Analysis version IDs to include, by default None (all)
+
+        Returns
+        -------
+        QuerySet
+            Analysis version ID, bucket and count tuples
+        """
+        if self.enabled:
+            rows = RunDurationCount.objects.filter(count__gt=0)
+        else:
+            rows = self.get_run_duration_counts()
+        rows = rows.values_list("analysis_version", "bucket", "count")
+        if analysis_version_ids is not None:
+            rows = rows.filter(analysis_version__in=analysis_version_ids)
+        return rows
+
+    def get_counts(
+        self, analysis_version_ids: Iterable[int] = None
+    ) -> Dict[int, Dict[str, int]]:
+        """
+        Returns run counts by status by analysis version ID. Counters are
+        used if enabled, otherwise runs are counted.
+
+        Parameters
+        ----------
+        analysis_version_ids : Iterable[int], optional
+            Analysis version IDs to include, by default None (all)
+
+        Returns
+        -------
+        Dict[int, Dict[str, int]]
+            Run counts by status by analysis version ID
+        """
+        counts = {}
+        rows = self.get_count_rows(analysis_version_ids)
+        for analysis_version_id, status, count, _, _ in rows:
+            counts.setdefault(analysis_version_id, {})[status] = count
+        return counts
+
+    def get_summary(
+        self, analysis_version_ids: Iterable[int] = None
+    ) -> List[dict]:
+        """
+        Returns the number of runs of each status along with the mean and
+        95th percentile duration (in seconds) of the finished runs of each
+        analysis version. Percentiles are approximated from duration
+        histograms (see
+        :func:`~django_analyses.models.utils.duration_histogram.get_percentile`).
+
+        Parameters
+        ----------
+        analysis_version_ids : Iterable[int], optional
+            Analysis version IDs to include, by default None (all)
+
+        Returns
+        -------
+        List[dict]
+            Run statistics by analysis version, ordered by ID
+        """
+        summaries = {}
+        rows = self.get_count_rows(analysis_version_ids)
+        for analysis_version_id, status, count, n_durations, total in rows:
+            summary = summaries.setdefault(
+                analysis_version_id,
+                {"counts": {}, "duration_count": 0, "duration_total": 0},
+            )
+            summary["counts"][status] = count
+            summary["duration_count"] += n_durations
+            summary["duration_total"] += total
+        buckets = {}
+        rows = self.get_bucket_rows(analysis_version_ids)
+        for analysis_version_id, bucket, count in rows:
+            version_buckets = buckets.setdefault(analysis_version_id, {})
+            version_buckets[bucket] = version_buckets.get(bucket, 0) + count
+        results = []
+        for analysis_version_id, summary in sorted(summaries.items()):
+            counts = summary["counts"]
+            n_durations = summary["duration_count"]
+            mean_duration = None
+            if n_durations > 0:
+                mean_duration = summary["duration_total"] / n_durations
+            p95_duration = get_percentile(
+                buckets.get(analysis_version_id, {}), SUMMARY_PERCENTILE
+            )
+            results.append(
+                {
+                    "analysis_version": analysis_version_id,
+                    "total": sum(counts.values()),
+                    **{
+                        status: counts.get(status, 0)
+                        for status in SUMMARY_STATUSES
+                    },
+                    "mean_duration": mean_duration,
+                    "p95_duration": p95_duration,
+                }
+            )
+        return results
@@ -43,6 +43,14 @@ class OutputDefinition(models.Model):
     def pre_output_instance_create(self, kwargs: dict) -> None:
         pass
 
+    def build_output_instance(self, **kwargs) -> Output:
+        self.pre_output_instance_create(kwargs)
+        try:
+            return self.output_class(definition=self, **kwargs)
+        except TypeError:
+            self.check_output_class_definition()
+            raise
+
     def create_output_instance(self, **kwargs) -> Output:
         self.pre_output_instance_create(kwargs)
         try:
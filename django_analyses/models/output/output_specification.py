@@ -2,6 +2,10 @@ from django.db import models
 from django_analyses.models.managers.output_specification import (
     OutputSpecificationManager,
 )
+from django_analyses.models.output.definitions.output_definition import (
+    OutputDefinition,
+)
+from django_analyses.models.utils.definition_cache import definition_cache
 from django_extensions.db.models import TimeStampedModel
 
 
@@ -16,12 +20,57 @@ class OutputSpecification(TimeStampedModel):
     objects = OutputSpecificationManager()
 
     def __str__(self) -> str:
-        definitions = self.output_definitions.select_subclasses()
+        definitions = self.get_definitions_by_key().values()
         formatted_definitions = "\n\t".join(
             [str(definition) for definition in definitions]
         )
         return f"\n[{self.analysis}]\n\t{formatted_definitions}\n"
 
+    def get_definitions_by_key(self) -> dict:
+        """
+        Returns this specification's output definitions as a dictionary with
+        their keys as keys.
+
+        Definitions are queried once per process and cached until the
+        specification or any of its definitions change (see
+        :class:`~django_analyses.models.utils.definition_cache.DefinitionCache`).
+
+        Returns
+        -------
+        dict
+            Output definitions by key
+        """
+        return definition_cache.get(self, self.get_output_definitions)
+
+    def get_definition(self, key: str) -> OutputDefinition:
+        """
+        Returns the output definition with the provided key.
+
+        Parameters
+        ----------
+        key : str
+            Output definition key
+
+        Returns
+        -------
+        OutputDefinition
+            Matching output definition
+
+        Raises
+        ------
+        OutputDefinition.DoesNotExist
+            No output definition with the provided key
+        """
+        try:
+            return self.get_definitions_by_key()[key]
+        except KeyError:
+            raise OutputDefinition.DoesNotExist(
+                f"Invalid output key: '{key}'!"
+            )
+
+    def get_output_definitions(self) -> models.QuerySet:
+        return self.base_output_definitions.select_subclasses()
+
     @property
     def output_definitions(self) -> models.QuerySet:
-        return self.base_output_definitions.select_subclasses()
+        return self.get_output_definitions()
@@ -78,7 +78,8 @@ class Node(TimeStampedModel):
 
         configuration = {}
         for key, value in self.configuration.items():
-            definition = self.analysis_version.input_definitions.get(key=key)
+            specification = self.analysis_version.input_specification
+            definition = specification.get_definition(key)
             value_field = definition.input_class._meta.get_field("value")
             is_foreign_key = isinstance(value_field, models.ForeignKey)
             if is_foreign_key:
@@ -6,6 +6,10 @@ Definition of the
 from django.db.models import QuerySet
 from django_analyses.models.managers.pipeline import PipelineManager
 from django_analyses.models.pipeline.node import Node
+from django_analyses.utils.execution_plan import (
+    ExecutionPlan,
+    get_execution_plan,
+)
 from django_extensions.db.models import TimeStampedModel, TitleDescriptionModel
 
 
@@ -96,6 +100,23 @@ class Pipeline(TitleDescriptionModel, TimeStampedModel):
         max_index = max(source_run_indices + destination_run_indices)
         return max_index + 1
 
+    def get_execution_plan(self) -> ExecutionPlan:
+        """
+        Returns this pipeline's compiled execution plan. Plans are cached per
+        pipeline and invalidated whenever its pipes change.
+
+        Returns
+        -------
+        ExecutionPlan
+            Compiled execution plan
+
+        See Also
+        --------
+        * :class:`~django_analyses.utils.execution_plan.ExecutionPlan`
+        """
+
+        return get_execution_plan(self)
+
     @property
     def node_set(self) -> QuerySet:
         """
@@ -130,3 +151,20 @@ class Pipeline(TitleDescriptionModel, TimeStampedModel):
         """
 
         return self.get_entry_nodes()
+
+    @property
+    def execution_plan(self) -> ExecutionPlan:
+        """
+        Returns this pipeline's compiled execution plan.
+
+        Returns
+        -------
+        ExecutionPlan
+            Compiled execution plan
+
+        See Also
+        --------
+        * :meth:`get_execution_plan`
+        """
+
+        return self.get_execution_plan()
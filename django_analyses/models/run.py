@@ -11,6 +11,7 @@ from django.contrib.auth import get_user_model
 from django.db import models
 from django.utils import timezone
 from django_analyses.models.managers.run import RunManager
+from django_analyses.models.utils import get_configuration_fingerprint
 from django_analyses.models.utils.run_status import RunStatus
 from django_analyses.utils import get_output_parser
 from django_analyses.utils.get_visualizers import get_visualizer
@@ -38,12 +39,14 @@ class Run(TimeStampedModel):
     )
 
     #: The :class:`~django_celery_results.models.task_result.TaskResult`
-    #: instance associated with this run.
-    task_result = models.OneToOneField(
+    #: instance associated with this run. Batch and chunk executions
+    #: associate all of their runs with a single task result. Runs are kept
+    #: when their task result is deleted (e.g. by result expiry).
+    task_result = models.ForeignKey(
         "django_celery_results.TaskResult",
         blank=True,
         null=True,
-        on_delete=models.CASCADE,
+        on_delete=models.SET_NULL,
     )
 
     #: The status of this run.
@@ -60,10 +63,23 @@ class Run(TimeStampedModel):
     #: Traceback saved in case of run failure.
     traceback = models.TextField(blank=True, null=True)
 
+    #: A stable hash of the full input configuration, used to efficiently
+    #: query existing runs.
+    configuration_fingerprint = models.CharField(
+        max_length=64, blank=True, null=True, editable=False
+    )
+
     objects = RunManager()
 
     class Meta:
         ordering = ("-created",)
+        indexes = [
+            models.Index(
+                fields=["analysis_version", "configuration_fingerprint"],
+                name="run_configuration_idx",
+            ),
+            models.Index(fields=["created", "id"], name="run_created_idx"),
+        ]
 
     def __str__(self) -> str:
         """
@@ -104,6 +120,154 @@ class Run(TimeStampedModel):
         """
         return self.base_output_set.select_subclasses()
 
+    def attach_definitions(self, instances: list, specification) -> list:
+        """
+        Assigns the provided inputs or outputs their definitions from the
+        specification's cached definitions, so that accessing the
+        *definition* attribute doesn't query the database for each instance.
+
+        Parameters
+        ----------
+        instances : list
+            :class:`~django_analyses.models.input.input.Input` or
+            :class:`~django_analyses.models.output.output.Output` subclasses'
+            instances
+        specification : Union[InputSpecification, OutputSpecification]
+            The specification the instances' definitions belong to
+
+        Returns
+        -------
+        list
+            The provided instances
+        """
+        if specification is None:
+            return instances
+        definitions = {
+            definition.id: definition
+            for definition in specification.get_definitions_by_key().values()
+        }
+        for instance in instances:
+            definition_id = getattr(instance, "definition_id", None)
+            definition = definitions.get(definition_id)
+            if definition is None:
+                continue
+            field = instance._meta.get_field("definition")
+            if isinstance(definition, field.related_model):
+                instance.definition = definition
+        return instances
+
+    def get_related_instances(self, related_name: str, specification) -> list:
+        """
+        Returns this run's inputs or outputs (by the base model's related
+        name), using prefetched instances if available (see
+        :meth:`~django_analyses.models.managers.run.RunQuerySet.with_io`).
+
+        Parameters
+        ----------
+        related_name : str
+            *base_input_set* or *base_output_set*
+        specification : Union[InputSpecification, OutputSpecification]
+            The specification the instances' definitions belong to
+
+        Returns
+        -------
+        list
+            Inputs or outputs with their definitions assigned
+        """
+        prefetched = getattr(self, "_prefetched_objects_cache", {})
+        try:
+            instances = list(prefetched[related_name])
+        except KeyError:
+            instances = list(getattr(self, related_name).select_subclasses())
+        return self.attach_definitions(instances, specification)
+
+    def get_related_instances_by_key(
+        self, related_name: str, specification
+    ) -> dict:
+        """
+        Returns this run's inputs or outputs by their definition's key.
+        Indices of prefetched instances are cached on the run.
+
+        Parameters
+        ----------
+        related_name : str
+            *base_input_set* or *base_output_set*
+        specification : Union[InputSpecification, OutputSpecification]
+            The specification the instances' definitions belong to
+
+        Returns
+        -------
+        dict
+            Inputs or outputs by key
+        """
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get(
+            related_name
+        )
+        indices = self.__dict__.setdefault("_related_instance_indices", {})
+        cached = indices.get(related_name)
+        if prefetched is not None and cached and cached[0] is prefetched:
+            return cached[1]
+        index = {}
+        for instance in self.get_related_instances(
+            related_name, specification
+        ):
+            index.setdefault(instance.key, instance)
+        if prefetched is not None:
+            indices[related_name] = prefetched, index
+        return index
+
+    def get_inputs(self) -> list:
+        """
+        Returns this run's inputs with their definitions assigned.
+
+        Returns
+        -------
+        list
+            This run's inputs
+        """
+        specification = self.analysis_version.input_specification
+        return self.get_related_instances("base_input_set", specification)
+
+    def get_outputs(self) -> list:
+        """
+        Returns this run's outputs with their definitions assigned.
+
+        Returns
+        -------
+        list
+            This run's outputs
+        """
+        specification = self.analysis_version.output_specification
+        return self.get_related_instances("base_output_set", specification)
+
+    def get_inputs_by_key(self) -> dict:
+        """
+        Returns this run's inputs by their definition's key.
+
+        Returns
+        -------
+        dict
+            Inputs by key
+        """
+        specification = self.analysis_version.input_specification
+        return self.get_related_instances_by_key(
+            "base_input_set", specification
+        )
+
+    def get_outputs_by_key(self) -> dict:
+        """
+        Returns this run's outputs by their definition's key.
+
+        Returns
+        -------
+        dict
+            Outputs by key
+        """
+        specification = self.analysis_version.output_specification
+        return self.get_related_instances_by_key(
+            "base_output_set", specification
+        )
+
     def get_input(self, key: str) -> Any:
         """
         Returns a particular output created in this run according to its
@@ -122,11 +286,9 @@ class Run(TimeStampedModel):
         Any
             Input value
         """
-        match = [
-            inpt for inpt in self.input_set.all() if inpt.definition.key == key
-        ]
-        if match:
-            return match[0].value
+        inpt = self.get_inputs_by_key().get(key)
+        if inpt is not None:
+            return inpt.value
 
     def get_output(self, key: str) -> Any:
         """
@@ -146,13 +308,9 @@ class Run(TimeStampedModel):
         Any
             Output value
         """
-        match = [
-            output
-            for output in self.output_set.all()
-            if output.definition.key == key
-        ]
-        if match:
-            return match[0].value
+        output = self.get_outputs_by_key().get(key)
+        if output is not None:
+            return output.value
 
     def get_input_configuration(
         self,
@@ -188,19 +346,19 @@ class Run(TimeStampedModel):
             }
         elif not include_non_configuration and include_defaults:
             full = {**defaults, **self.raw_input_configuration}
-            definitions = self.analysis_version.input_definitions
+            specification = self.analysis_version.input_specification
             return {
                 key: value
                 for key, value in full.items()
-                if definitions.get(key=key).is_configuration
+                if specification.get_definition(key).is_configuration
             }
         else:
-            definitions = self.analysis_version.input_definitions
+            specification = self.analysis_version.input_specification
             return {
                 key: value
                 for key, value in self.raw_input_configuration.items()
                 if (key not in defaults or defaults.get(key) != value)
-                and definitions.get(key=key).is_configuration
+                and specification.get_definition(key).is_configuration
             }
 
     def get_output_configuration(self) -> dict:
@@ -212,7 +370,10 @@ class Run(TimeStampedModel):
         dict
             Output configuration
         """
-        return {output.key: output.value for output in self.output_set}
+        return {
+            key: output.value
+            for key, output in self.get_outputs_by_key().items()
+        }
 
     def fix_input_value(self, inpt) -> Any:
         """
@@ -232,8 +393,9 @@ class Run(TimeStampedModel):
         """
         if getattr(inpt.definition, "is_output_path", False):
             return Path(inpt.value).name
-        elif isinstance(inpt._meta.get_field("value"), models.ForeignKey):
-            return inpt.value.id
+        value_field = inpt._meta.get_field("value")
+        if isinstance(value_field, models.ForeignKey):
+            return getattr(inpt, value_field.attname)
         return inpt.value
 
     def get_raw_input_configuration(self) -> dict:
@@ -250,7 +412,7 @@ class Run(TimeStampedModel):
         """
         return {
             inpt.key: self.fix_input_value(inpt)
-            for inpt in self.input_set
+            for inpt in self.get_inputs()
             if not (
                 getattr(inpt.definition, "is_output_directory", False)
                 or getattr(inpt.definition, "dynamic_default", False)
@@ -267,10 +429,25 @@ class Run(TimeStampedModel):
             JSON serializable output dictionary
         """
         return {
-            output.definition.key: output.json_value
-            for output in self.output_set.all()
+            key: output.json_value
+            for key, output in self.get_outputs_by_key().items()
         }
 
+    def get_configuration_fingerprint(self) -> str:
+        """
+        Returns the fingerprint of this run's full input configuration.
+
+        Returns
+        -------
+        str
+            Input configuration fingerprint
+
+        See Also
+        --------
+        * :func:`~django_analyses.models.utils.get_configuration_fingerprint`
+        """
+        return get_configuration_fingerprint(self.input_configuration)
+
     def check_null_configuration(self) -> bool:
         """
         Checks whether this run's configuration is equivalent to the input
@@ -0,0 +1,54 @@
+"""
+Definition of the :class:`RunDurationCount` class.
+"""
+from django.db import models
+from django_analyses.models.utils.run_status import COUNTED_STATUS_CHOICES
+
+
+class RunDurationCount(models.Model):
+    """
+    A :class:`~django.db.models.Model` representing a single bucket of the
+    histogram of run durations of an analysis version with a given status
+    (see :mod:`~django_analyses.models.utils.duration_histogram`).
+    Histograms are maintained alongside the
+    :class:`~django_analyses.models.run_status_count.RunStatusCount`
+    counters and used to approximate duration percentiles.
+    """
+
+    #: The counted runs' analysis version.
+    analysis_version = models.ForeignKey(
+        "django_analyses.AnalysisVersion",
+        on_delete=models.CASCADE,
+        related_name="run_duration_count_set",
+    )
+
+    #: The counted runs' status.
+    status = models.CharField(max_length=7, choices=COUNTED_STATUS_CHOICES)
+
+    #: Histogram bucket index.
+    bucket = models.PositiveSmallIntegerField()
+
+    #: Number of runs.
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["analysis_version", "status", "bucket"],
+                name="unique_run_duration_count",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the instance.
+
+        Returns
+        -------
+        str
+            This instance's string representation
+        """
+        return (
+            f"{self.analysis_version}: {self.count} {self.status} runs "
+            f"in bucket #{self.bucket}"
+        )
@@ -0,0 +1,59 @@
+"""
+Definition of the :class:`RunStatusCount` class.
+"""
+from django.db import models
+from django_analyses.models.managers.run_status_count import (
+    RunStatusCountManager,
+)
+from django_analyses.models.utils.run_status import COUNTED_STATUS_CHOICES
+
+
+class RunStatusCount(models.Model):
+    """
+    A :class:`~django.db.models.Model` representing the number of runs of an
+    analysis version with a given status, along with the total duration of
+    the finished ones. Counters are maintained by signals if
+    *ANALYSIS_RUN_STATUS_COUNTERS* is set, so that run counts and statistics
+    do not require scanning the runs table.
+    """
+
+    #: The counted runs' analysis version.
+    analysis_version = models.ForeignKey(
+        "django_analyses.AnalysisVersion",
+        on_delete=models.CASCADE,
+        related_name="run_status_count_set",
+    )
+
+    #: The counted runs' status.
+    status = models.CharField(max_length=7, choices=COUNTED_STATUS_CHOICES)
+
+    #: Number of runs.
+    count = models.BigIntegerField(default=0)
+
+    #: Number of runs with both a start and an end time.
+    duration_count = models.BigIntegerField(default=0)
+
+    #: Total duration of the runs with both a start and an end time (in
+    #: seconds).
+    duration_total = models.FloatField(default=0)
+
+    objects = RunStatusCountManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["analysis_version", "status"],
+                name="unique_run_status_count",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns the string representation of the instance.
+
+        Returns
+        -------
+        str
+            This instance's string representation
+        """
+        return f"{self.analysis_version}: {self.count} {self.status} runs"
@@ -1,9 +1,22 @@
+from django_analyses.models.utils.bulk_create import (
+    bulk_create_subclass_instances,
+)
+from django_analyses.models.utils.configuration_fingerprint import (
+    get_configuration_fingerprint,
+)
+from django_analyses.models.utils.definition_cache import definition_cache
 from django_analyses.models.utils.get_analysis_interfaces import (
     get_analysis_interfaces,
     get_analysis_version_interface,
 )
 from django_analyses.models.utils.get_media_root import get_media_root
 from django_analyses.models.utils.get_subject_model import get_subject_model
+from django_analyses.models.utils.interface_pool import interface_pool
+from django_analyses.models.utils.interface_registry import (
+    interface_registry,
+)
 from django_analyses.models.utils.json_field import DefaultJSONField
+from django_analyses.models.utils.preview_cache import preview_cache
+from django_analyses.models.utils.subquery_count import SubqueryCount
 
 # flake8: noqa: F401
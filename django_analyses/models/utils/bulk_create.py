@@ -0,0 +1,123 @@
+"""
+Utility functions for the bulk creation of multi-table inheritance model
+instances.
+"""
+from collections import defaultdict
+from typing import List
+
+from django.db import connections, models, router, transaction
+
+
+def get_inheritance_chain(model: models.base.ModelBase) -> list:
+    """
+    Returns the concrete models in *model*\'s inheritance chain, ordered from
+    the root (base) model to *model* itself.
+
+    Parameters
+    ----------
+    model : ModelBase
+        Concrete model
+
+    Returns
+    -------
+    list
+        Inheritance chain
+    """
+    return list(reversed(model._meta.get_parent_list())) + [model]
+
+
+def bulk_create_subclass_instances(
+    base_model: models.base.ModelBase,
+    instances: List[models.Model],
+    batch_size: int = None,
+) -> List[models.Model]:
+    """
+    Saves unsaved instances of (possibly different) multi-table inheritance
+    subclasses of *base_model*, issuing a single insert per table rather than
+    a query per instance.
+
+    Django's :meth:`~django.db.models.query.QuerySet.bulk_create` doesn't
+    support multi-table inheritance, so the *base_model* rows are created
+    first and the returned primary keys are then used to insert the rows of
+    each subclass table.
+
+    Note
+    ----
+    Like :meth:`~django.db.models.query.QuerySet.bulk_create`, this function
+    does not call the instances' :meth:`save` method and does not send any
+    *pre_save* or *post_save* signals.
+
+    Parameters
+    ----------
+    base_model : ModelBase
+        The root model of the inheritance hierarchy
+    instances : List[models.Model]
+        Unsaved subclass instances
+    batch_size : int, optional
+        Maximal number of rows per insert query, by default None (all rows
+        at once)
+
+    Returns
+    -------
+    List[models.Model]
+        Saved instances
+    """
+    if not instances:
+        return instances
+    using = router.db_for_write(base_model)
+    connection = connections[using]
+    with transaction.atomic(using=using, savepoint=False):
+        # Without primary keys returned from bulk inserts, fall back to
+        # saving each instance separately.
+        if not connection.features.can_return_rows_from_bulk_insert:
+            for instance in instances:
+                models.Model.save(instance, using=using)
+            return instances
+        # Create the base model rows.
+        pk_attname = base_model._meta.pk.attname
+        base_fields = [
+            field
+            for field in base_model._meta.local_concrete_fields
+            if not field.primary_key
+        ]
+        parents = [
+            base_model(
+                **{
+                    field.attname: getattr(instance, field.attname)
+                    for field in base_fields
+                }
+            )
+            for instance in instances
+        ]
+        base_model._base_manager.using(using).bulk_create(
+            parents, batch_size=batch_size
+        )
+        # Group instances by each of the subclass tables they require a row
+        # in.
+        tables = defaultdict(list)
+        for instance, parent in zip(instances, parents):
+            setattr(instance, pk_attname, parent.pk)
+            chain = get_inheritance_chain(type(instance))
+            base_index = chain.index(base_model)
+            for model in chain[base_index + 1:]:
+                tables[model].append(instance)
+        # Insert rows from the top of the hierarchy down.
+        for model in sorted(
+            tables, key=lambda model: len(model._meta.get_parent_list())
+        ):
+            objs = tables[model]
+            for obj in objs:
+                for parent_link in model._meta.parents.values():
+                    setattr(obj, parent_link.attname, getattr(obj, pk_attname))
+            step = batch_size or len(objs)
+            for start in range(0, len(objs), step):
+                stop = start + step
+                model._base_manager._insert(
+                    objs[start:stop],
+                    fields=model._meta.local_concrete_fields,
+                    using=using,
+                )
+    for instance in instances:
+        instance._state.adding = False
+        instance._state.db = using
+    return instances
@@ -0,0 +1,124 @@
+"""
+Utility functions for the generation of stable input configuration
+fingerprints.
+"""
+import hashlib
+import json
+import numbers
+from pathlib import Path
+from typing import Any, Optional
+
+from django.db.models import Model
+
+#: Hash function used to generate configuration fingerprints.
+FINGERPRINT_ALGORITHM = "sha256"
+
+
+def normalize_configuration_value(value: Any) -> Any:
+    """
+    Converts a configuration value to a canonical JSON-serializable
+    representation, so that equal configurations always produce identical
+    serializations.
+
+    Parameters
+    ----------
+    value : Any
+        Configuration value
+
+    Returns
+    -------
+    Any
+        Canonical representation of the provided value
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    elif isinstance(value, dict):
+        return {
+            str(key): normalize_configuration_value(element)
+            for key, element in value.items()
+        }
+    elif isinstance(value, (list, tuple)):
+        return [normalize_configuration_value(element) for element in value]
+    elif isinstance(value, numbers.Integral):
+        return int(value)
+    elif isinstance(value, numbers.Real):
+        # Integral floats are converted to integers so that 1 and 1.0 (which
+        # are considered equal in Python) share the same fingerprint.
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    elif isinstance(value, Model):
+        return value.pk
+    elif isinstance(value, Path):
+        return str(value)
+    return str(value)
+
+
+def get_configuration_fingerprint(configuration: dict) -> str:
+    """
+    Returns a stable hash of the provided input configuration.
+
+    Parameters
+    ----------
+    configuration : dict
+        Full input configuration (including default values)
+
+    Returns
+    -------
+    str
+        Hexadecimal configuration fingerprint
+    """
+    normalized = normalize_configuration_value(configuration)
+    serialized = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.new(FINGERPRINT_ALGORITHM, serialized.encode()).hexdigest()
+
+
+def is_primitive_value(value: Any) -> bool:
+    """
+    Checks whether a value is fully represented by its normalized
+    configuration value (see :func:`normalize_configuration_value`), i.e.
+    consists of JSON primitives, paths and model instances only. Other
+    objects (e.g. arrays) fall back to :func:`str`, which may be identical
+    for different values.
+
+    Parameters
+    ----------
+    value : Any
+        Configuration value
+
+    Returns
+    -------
+    bool
+        Whether the value is primitive
+    """
+    if value is None or isinstance(value, (bool, str, numbers.Real, Path)):
+        return True
+    elif isinstance(value, Model):
+        return value.pk is not None
+    elif isinstance(value, dict):
+        return all(
+            isinstance(key, str) and is_primitive_value(element)
+            for key, element in value.items()
+        )
+    elif isinstance(value, (list, tuple)):
+        return all(is_primitive_value(element) for element in value)
+    return False
+
+
+def get_instance_key(init_kwargs: dict) -> Optional[str]:
+    """
+    Returns a key identifying interface instances initialized with the
+    provided keyword arguments, used to reuse them safely.
+
+    Parameters
+    ----------
+    init_kwargs : dict
+        Interface initialization keyword arguments
+
+    Returns
+    -------
+    Optional[str]
+        Instance key, or None if any of the arguments is not primitive (in
+        which case instances should not be reused)
+    """
+    if is_primitive_value(init_kwargs):
+        return get_configuration_fingerprint(init_kwargs)
@@ -0,0 +1,123 @@
+"""
+Definition of the :class:`DefinitionCache` class, used to memoize the
+key-indexed definitions of input and output specifications.
+"""
+import threading
+import time
+from typing import Callable, Dict, Iterable
+
+from django.conf import settings
+from django.db.models import Model
+
+#: Default number of seconds cached definitions are reused for (see
+#: *ANALYSIS_DEFINITION_CACHE_TTL*).
+DEFINITION_CACHE_TTL = 60
+
+
+class DefinitionCache:
+    """
+    Process-wide cache of specification definitions, indexed by the
+    specification's model and primary key.
+
+    Entries are invalidated by the signal receivers registered in
+    :mod:`django_analyses.signals` whenever a specification or any definition
+    is saved, deleted, or has its relations changed. Changes made by other
+    processes (e.g. by the web server while Celery workers execute runs) are
+    only picked up once entries expire, i.e. after
+    *ANALYSIS_DEFINITION_CACHE_TTL* seconds (60 by default, None disables
+    expiry).
+    """
+
+    def __init__(self):
+        self._definitions = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        specification: Model,
+        loader: Callable[[], Iterable[Model]],
+    ) -> Dict[str, Model]:
+        """
+        Returns the provided specification's definitions as a dictionary with
+        their keys as keys, calling *loader* to query them on a cache miss.
+
+        Parameters
+        ----------
+        specification : Model
+            Input or output specification
+        loader : Callable[[], Iterable[Model]]
+            Callable returning the specification's definitions
+
+        Returns
+        -------
+        Dict[str, Model]
+            Definitions by key
+        """
+        if specification.pk is None:
+            return {definition.key: definition for definition in loader()}
+        cache_key = (specification._meta.label_lower, specification.pk)
+        ttl = self.ttl
+        now = time.monotonic()
+        definitions, loaded = self._definitions.get(cache_key, (None, None))
+        if definitions is None or (ttl is not None and now - loaded >= ttl):
+            generation = self._generation
+            definitions = {
+                definition.key: definition for definition in loader()
+            }
+            with self._lock:
+                # Avoid storing definitions that were invalidated while
+                # being queried.
+                if generation == self._generation:
+                    self._definitions[cache_key] = definitions, now
+        # Return a shallow copy to protect the cached dictionary.
+        return dict(definitions)
+
+    @property
+    def ttl(self) -> float:
+        """
+        Returns the number of seconds cached definitions are reused for, as
+        set by *ANALYSIS_DEFINITION_CACHE_TTL* (None disables expiry).
+
+        Returns
+        -------
+        float
+            Cached definitions time-to-live
+        """
+        return getattr(
+            settings, "ANALYSIS_DEFINITION_CACHE_TTL", DEFINITION_CACHE_TTL
+        )
+
+    def invalidate(self, model: type, pk: int = None) -> None:
+        """
+        Removes cached definitions of the provided specification model.
+
+        Parameters
+        ----------
+        model : type
+            Input or output specification model
+        pk : int, optional
+            Specification primary key, by default None (all specifications of
+            the given model)
+        """
+        label = model._meta.label_lower
+        with self._lock:
+            self._generation += 1
+            if pk is None:
+                for cache_key in list(self._definitions):
+                    if cache_key[0] == label:
+                        del self._definitions[cache_key]
+            else:
+                self._definitions.pop((label, pk), None)
+
+    def clear(self) -> None:
+        """
+        Removes all cached definitions.
+        """
+        with self._lock:
+            self._generation += 1
+            self._definitions.clear()
+
+
+#: Shared definition cache instance.
+definition_cache = DefinitionCache()
@@ -0,0 +1,144 @@
+"""
+Utilities used to approximate run duration statistics from histograms of
+run durations, so that they may be maintained incrementally.
+"""
+from bisect import bisect_left
+from typing import Dict, Optional
+
+from django.db.models import (
+    Case,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    IntegerField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Extract
+from django.db.models.lookups import LessThanOrEqual
+
+#: Upper bounds (in seconds) of the run duration histogram buckets. Durations
+#: exceeding the last bound are counted in an additional overflow bucket.
+#: Changing the bounds requires rebuilding the stored histograms (see the
+#: *rebuild_run_status_counts* management command).
+DURATION_BUCKETS = (
+    1,
+    2,
+    5,
+    10,
+    15,
+    30,
+    60,
+    120,
+    300,
+    600,
+    900,
+    1800,
+    3600,
+    7200,
+    14400,
+    28800,
+    43200,
+    86400,
+)
+
+
+def get_duration_bucket(duration: float) -> int:
+    """
+    Returns the index of the histogram bucket of a run duration.
+
+    Parameters
+    ----------
+    duration : float
+        Run duration (in seconds)
+
+    Returns
+    -------
+    int
+        Bucket index
+    """
+    return bisect_left(DURATION_BUCKETS, duration)
+
+
+def get_duration_expression() -> Cast:
+    """
+    Returns an expression evaluating to a run's duration in seconds, or NULL
+    if its start or end time is not set.
+
+    Returns
+    -------
+    Cast
+        Run duration expression
+    """
+    duration = ExpressionWrapper(
+        F("end_time") - F("start_time"), output_field=DurationField()
+    )
+    return Cast(Extract(duration, "epoch"), output_field=FloatField())
+
+
+def get_bucket_expression(duration) -> Case:
+    """
+    Returns an expression evaluating to the histogram bucket index of the
+    provided duration expression (see :func:`get_duration_bucket`).
+
+    Parameters
+    ----------
+    duration : Expression
+        Duration expression (in seconds)
+
+    Returns
+    -------
+    Case
+        Bucket index expression
+    """
+    whens = [
+        When(LessThanOrEqual(duration, bound), then=Value(index))
+        for index, bound in enumerate(DURATION_BUCKETS)
+    ]
+    return Case(
+        *whens,
+        default=Value(len(DURATION_BUCKETS)),
+        output_field=IntegerField(),
+    )
+
+
+def get_percentile(
+    bucket_counts: Dict[int, int], percentile: float
+) -> Optional[float]:
+    """
+    Approximates a percentile from a duration histogram by linear
+    interpolation within the bucket containing it. Percentiles falling in
+    the overflow bucket are reported as the last bucket bound.
+
+    Parameters
+    ----------
+    bucket_counts : Dict[int, int]
+        Run counts by bucket index
+    percentile : float
+        Percentile (between 0 and 1)
+
+    Returns
+    -------
+    Optional[float]
+        Approximated percentile (in seconds), or None if the histogram is
+        empty
+    """
+    total = sum(bucket_counts.values())
+    if total <= 0:
+        return None
+    rank = percentile * total
+    cumulative = 0
+    for index in sorted(bucket_counts):
+        count = bucket_counts[index]
+        if count <= 0:
+            continue
+        if cumulative + count >= rank:
+            if index >= len(DURATION_BUCKETS):
+                return float(DURATION_BUCKETS[-1])
+            lower = DURATION_BUCKETS[index - 1] if index else 0
+            upper = DURATION_BUCKETS[index]
+            fraction = (rank - cumulative) / count
+            return lower + (upper - lower) * fraction
+        cumulative += count
+    return float(DURATION_BUCKETS[-1])
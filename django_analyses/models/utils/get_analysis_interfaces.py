@@ -1,26 +1,51 @@
 """
 Utility functions for analysis version interfaces retrieval.
 """
-from django.conf import settings
-
-NO_INTERFACES = (
-    "Failed to find ANALYSIS_INTERFACES dictionary in project settings!"
+from django_analyses.models.utils.interface_registry import (  # noqa: F401
+    MISSING_INTERFACE,
+    NO_INTERFACES,
+    interface_registry,
 )
-MISSING_INTERFACE = "No interface detected for {analysis_version}!"
 
 
 def get_analysis_interfaces() -> dict:
-    try:
-        return settings.ANALYSIS_INTERFACES
-    except AttributeError:
-        raise RuntimeError(NO_INTERFACES)
+    """
+    Returns the project's *ANALYSIS_INTERFACES* setting. Interfaces may be
+    registered as classes or dotted import paths (see
+    :class:`~django_analyses.models.utils.interface_registry.InterfaceRegistry`).
+
+    Returns
+    -------
+    dict
+        Interfaces by analysis version title by analysis title
+    """
+    return interface_registry.definitions
 
 
 def get_analysis_version_interface(analysis_version) -> type:
+    """
+    Returns an analysis version's interface class, resolved and cached by
+    the process's
+    :class:`~django_analyses.models.utils.interface_registry.InterfaceRegistry`.
+
+    Parameters
+    ----------
+    analysis_version : AnalysisVersion
+        Analysis version
+
+    Returns
+    -------
+    type
+        Interface class
+
+    Raises
+    ------
+    NotImplementedError
+        No interface is registered for the analysis version
+    """
     analysis_title = analysis_version.analysis.title
     try:
-        interfaces = get_analysis_interfaces()
-        return interfaces[analysis_title][analysis_version.title]
+        return interface_registry.get(analysis_title, analysis_version.title)
     except KeyError:
         message = MISSING_INTERFACE.format(analysis_version=analysis_version)
         raise NotImplementedError(message)
@@ -1,38 +1,106 @@
+"""
+File preview rendering utilities.
+
+Rendering dependencies (nibabel, nilearn and pandas) are imported by the
+renderers themselves, so that importing the models does not load them in
+processes that never render previews.
+"""
+import math
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Callable, List, Optional, Union
+
+from django.conf import settings
+from django_analyses.models.utils.preview_cache import preview_cache
 
-import nibabel as nib
-import pandas as pd
-from nilearn.plotting import cm, view_img, view_surf
+if TYPE_CHECKING:
+    import nibabel as nib
 
 DEFAULT_NIFTI_SIZE = {"width": 1000, "height": 500}
 
+#: Default maximal number of voxels in rendered volume previews.
+DEFAULT_PREVIEW_MAX_VOXELS = 4_000_000
 
-def plot_nii(path: Path) -> str:
-    html_doc = view_img(
-        str(path), bg_img=False, cmap=cm.black_blue, symmetric_cmap=False,
-    )
-    return html_doc.get_iframe(**DEFAULT_NIFTI_SIZE)
 
+def get_preview_max_voxels() -> int:
+    """
+    Returns the maximal number of voxels in rendered volume previews, as set
+    by *ANALYSIS_PREVIEW_MAX_VOXELS*. Volumes are downsampled by an integer
+    step along each spatial axis to fit this budget.
 
-def plot_mgz(path: Path) -> str:
-    mgz = nib.load(path)
-    data = mgz.get_fdata()
-    nii = nib.Nifti1Image(
-        data, mgz.affine, mgz.header, mgz.extra, mgz.file_map
+    Returns
+    -------
+    int
+        Maximal number of voxels
+    """
+    return getattr(
+        settings, "ANALYSIS_PREVIEW_MAX_VOXELS", DEFAULT_PREVIEW_MAX_VOXELS
     )
-    title = Path(path).name
+
+
+def load_preview_volume(
+    path: Path, max_voxels: int = None
+) -> "nib.Nifti1Image":
+    """
+    Loads a volume for preview, downsampling it to at most *max_voxels*
+    voxels. The image's data is memory-mapped where possible and only the
+    sampled voxels of the first volume are read, keeping their stored data
+    type rather than converting the entire image to float64.
+
+    Parameters
+    ----------
+    path : Path
+        NIfTI or MGH image
+    max_voxels : int, optional
+        Maximal number of voxels, by default None (use
+        :func:`get_preview_max_voxels`)
+
+    Returns
+    -------
+    nib.Nifti1Image
+        Downsampled 3D image
+    """
+    import nibabel as nib
+    import numpy as np
+
+    max_voxels = max_voxels or get_preview_max_voxels()
+    image = nib.load(str(path), mmap=True)
+    n_voxels = np.prod(image.shape[:3])
+    step = max(math.ceil((n_voxels / max_voxels) ** (1 / 3)), 1)
+    # Step through the spatial axes and take the first volume of 4D images.
+    index = (slice(None, None, step),) * 3 + (0,) * (len(image.shape) - 3)
+    data = np.asanyarray(image.dataobj[index])
+    data = data.astype(data.dtype.newbyteorder("="), copy=False)
+    affine = image.affine.copy()
+    affine[:3, :3] *= step
+    return nib.Nifti1Image(data, affine, dtype=data.dtype)
+
+
+def plot_volume(path: Path, **kwargs) -> str:
+    from nilearn.plotting import cm, view_img
+
+    volume = load_preview_volume(path)
     html_doc = view_img(
-        nii,
+        volume,
         bg_img=False,
         cmap=cm.black_blue,
         symmetric_cmap=False,
-        title=title,
+        resampling_interpolation="nearest",
+        **kwargs,
     )
     return html_doc.get_iframe(**DEFAULT_NIFTI_SIZE)
 
 
+def plot_nii(path: Path) -> str:
+    return plot_volume(path)
+
+
+def plot_mgz(path: Path) -> str:
+    return plot_volume(path, title=Path(path).name)
+
+
 def plot_gii(path: Path) -> str:
+    from nilearn.plotting import view_surf
+
     html_doc = view_surf(str(path), symmetric_cmap=False)
     return html_doc.get_iframe(**DEFAULT_NIFTI_SIZE)
 
@@ -60,6 +128,8 @@ FREESURFER_MESHES = (
 
 
 def plot_freesurfer_surface(path: Path) -> str:
+    from nilearn.plotting import cm, view_surf
+
     suffix = path.suffix
     if suffix in FREESURFER_MESHES:
         return view_surf(str(path)).get_iframe(**DEFAULT_NIFTI_SIZE)
@@ -94,6 +164,8 @@ def read_col_headers(path: Path) -> List[str]:
 
 
 def freesurfer_stats_repr(path: Path) -> str:
+    import pandas as pd
+
     try:
         column_names = read_col_headers(path)
         df = pd.read_csv(
@@ -128,19 +200,101 @@ SUPPORTED_FILE_TYPES = {
 }
 
 
-def html_repr(path: Path) -> str:
+def get_renderer(path: Path) -> Optional[Callable[[Path], str]]:
+    """
+    Returns the function used to render a file's preview.
+
+    Parameters
+    ----------
+    path : Path
+        Previewed file
+
+    Returns
+    -------
+    Optional[Callable[[Path], str]]
+        Renderer, or None if the file type is not supported
+    """
     suffix = tuple(Path(path).suffixes)
-    match = None
     if suffix in SUPPORTED_FILE_TYPES:
-        match = suffix
-    else:
-        for key in SUPPORTED_FILE_TYPES:
-            key_len = len(key)
-            if suffix[-key_len:] == key:
-                match = key
-                break
-    if match is not None:
+        return SUPPORTED_FILE_TYPES[suffix]
+    for key in SUPPORTED_FILE_TYPES:
+        key_len = len(key)
+        if suffix[-key_len:] == key:
+            return SUPPORTED_FILE_TYPES[key]
+
+
+def get_preview_parameters(renderer: Callable[[Path], str]) -> dict:
+    """
+    Returns the parameters identifying a renderer's output, used to key
+    cached previews.
+
+    Parameters
+    ----------
+    renderer : Callable[[Path], str]
+        Preview renderer
+
+    Returns
+    -------
+    dict
+        Rendering parameters
+    """
+    return {
+        "renderer": renderer.__name__,
+        "max_voxels": get_preview_max_voxels(),
+        **DEFAULT_NIFTI_SIZE,
+    }
+
+
+def get_preview_key(path: Path) -> Optional[str]:
+    """
+    Returns the cache key of a file's preview.
+
+    Parameters
+    ----------
+    path : Path
+        Previewed file
+
+    Returns
+    -------
+    Optional[str]
+        Cache key, or None if the file type is not supported
+    """
+    renderer = get_renderer(path)
+    if renderer is not None:
+        return preview_cache.get_key(path, **get_preview_parameters(renderer))
+
+
+def get_preview_paths(value: Union[str, list]) -> List[Path]:
+    """
+    Returns the existing files with supported types within a file or file
+    list input or output value.
+
+    Parameters
+    ----------
+    value : Union[str, list]
+        Input or output value
+
+    Returns
+    -------
+    List[Path]
+        Previewable files
+    """
+    values = value if isinstance(value, list) else [value]
+    paths = [Path(path) for path in values if isinstance(path, str)]
+    return [
+        path
+        for path in paths
+        if get_renderer(path) is not None and path.is_file()
+    ]
+
+
+def html_repr(path: Path) -> str:
+    renderer = get_renderer(path)
+    if renderer is not None:
+        parameters = get_preview_parameters(renderer)
         try:
-            return SUPPORTED_FILE_TYPES[match](path)
+            return preview_cache.get_or_render(
+                path, lambda: renderer(path), **parameters
+            )
         except ValueError:
             return "Preview generation failed!"
@@ -0,0 +1,148 @@
+"""
+Definition of the :class:`InterfacePool` class, used to reuse initialized
+analysis interface instances within a worker process.
+"""
+import threading
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Callable, Hashable
+
+
+class InterfacePool:
+    """
+    Process-wide pool of idle interface instances, indexed by the analysis
+    version's primary key and a key representing the instance's
+    initialization parameters.
+
+    Instances are checked out for the duration of a single execution, so an
+    instance is never used by two threads at once, and instances whose
+    execution raises an exception are discarded. Each analysis version's
+    idle instances are bounded and the least recently used ones are evicted
+    first.
+    """
+
+    def __init__(self):
+        self._instances = defaultdict(OrderedDict)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def checkout(
+        self,
+        analysis_version_id: int,
+        key: Hashable,
+        factory: Callable[[], object],
+        max_size: int,
+        reset: Callable[[object], None] = None,
+    ):
+        """
+        Yields an idle instance matching *key*, calling *factory* to create
+        one if none is available, and returns it to the pool at the end of the
+        block.
+
+        Parameters
+        ----------
+        analysis_version_id : int
+            The primary key of the instance's analysis version
+        key : Hashable
+            Initialization parameters key
+        factory : Callable[[], object]
+            Callable returning a new interface instance
+        max_size : int
+            Maximal number of idle instances kept for the analysis version
+        reset : Callable[[object], None], optional
+            Callable used to reset any per-run state before the instance is
+            returned to the pool, by default None
+        """
+        with self._lock:
+            idle = self._instances[analysis_version_id].get(key)
+            instance = idle.pop() if idle else None
+        if instance is None:
+            instance = factory()
+        yield instance
+        if reset is not None:
+            try:
+                reset(instance)
+            except Exception:
+                # Instances that fail to reset are discarded, without failing
+                # the execution that already completed.
+                return
+        self.checkin(analysis_version_id, key, instance, max_size)
+
+    def checkin(
+        self,
+        analysis_version_id: int,
+        key: Hashable,
+        instance: object,
+        max_size: int,
+    ) -> None:
+        """
+        Returns an instance to the pool, evicting the least recently used
+        idle instances of the analysis version if it exceeds *max_size*.
+
+        Parameters
+        ----------
+        analysis_version_id : int
+            The primary key of the instance's analysis version
+        key : Hashable
+            Initialization parameters key
+        instance : object
+            Interface instance
+        max_size : int
+            Maximal number of idle instances kept for the analysis version
+        """
+        with self._lock:
+            pool = self._instances[analysis_version_id]
+            pool.setdefault(key, []).append(instance)
+            pool.move_to_end(key)
+            size = sum(len(idle) for idle in pool.values())
+            while size > max_size:
+                oldest_key = next(iter(pool))
+                idle = pool[oldest_key]
+                idle.pop(0)
+                if not idle:
+                    del pool[oldest_key]
+                size -= 1
+
+    def count(self, analysis_version_id: int = None) -> int:
+        """
+        Returns the number of idle instances in the pool.
+
+        Parameters
+        ----------
+        analysis_version_id : int, optional
+            Count only the provided analysis version's instances, by default
+            None
+
+        Returns
+        -------
+        int
+            Number of idle instances
+        """
+        with self._lock:
+            if analysis_version_id is None:
+                pools = list(self._instances.values())
+            else:
+                pools = [self._instances.get(analysis_version_id, {})]
+            return sum(
+                len(idle) for pool in pools for idle in pool.values()
+            )
+
+    def clear(self, analysis_version_id: int = None) -> None:
+        """
+        Removes idle instances from the pool.
+
+        Parameters
+        ----------
+        analysis_version_id : int, optional
+            Remove only the provided analysis version's instances, by default
+            None (all instances)
+        """
+        with self._lock:
+            if analysis_version_id is None:
+                self._instances.clear()
+            else:
+                self._instances.pop(analysis_version_id, None)
+
+
+#: Worker process interface instance pool.
+interface_pool = InterfacePool()
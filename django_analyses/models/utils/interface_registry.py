@@ -0,0 +1,147 @@
+"""
+Definition of the :class:`InterfaceRegistry` class, used to resolve and
+cache the analysis interfaces registered in the project's settings.
+"""
+import threading
+from typing import Dict, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+NO_INTERFACES = (
+    "Failed to find ANALYSIS_INTERFACES dictionary in project settings!"
+)
+MISSING_INTERFACE = "No interface detected for {analysis_version}!"
+
+
+class InterfaceRegistry:
+    """
+    Process-wide registry of the interfaces registered in the project's
+    *ANALYSIS_INTERFACES* setting, by analysis title and analysis version
+    title.
+
+    Interfaces may be registered either as classes or as dotted import paths
+    (e.g. *"nipype.interfaces.fsl.SUSAN"*), in which case they are only
+    imported when first used, so that heavy interface dependencies do not
+    slow down process startup. Resolved interfaces are cached, and the cache
+    is cleared whenever the setting is changed.
+    """
+
+    def __init__(self):
+        self._interfaces = {}
+        self._lock = threading.Lock()
+
+    @property
+    def definitions(self) -> Dict[str, Dict[str, object]]:
+        """
+        Returns the registered interfaces (classes or dotted import paths).
+
+        Returns
+        -------
+        Dict[str, Dict[str, object]]
+            Interfaces by analysis version title by analysis title
+
+        Raises
+        ------
+        RuntimeError
+            *ANALYSIS_INTERFACES* is not set
+        """
+        try:
+            return settings.ANALYSIS_INTERFACES
+        except AttributeError:
+            raise RuntimeError(NO_INTERFACES)
+
+    @property
+    def resolved(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Returns the keys of the resolved interfaces.
+
+        Returns
+        -------
+        Tuple[Tuple[str, str], ...]
+            Analysis and analysis version titles
+        """
+        return tuple(self._interfaces)
+
+    def get(self, analysis_title: str, version_title: str) -> type:
+        """
+        Returns an analysis version's interface, importing it if registered
+        as a dotted import path.
+
+        Parameters
+        ----------
+        analysis_title : str
+            Analysis title
+        version_title : str
+            Analysis version title
+
+        Returns
+        -------
+        type
+            Interface class
+
+        Raises
+        ------
+        KeyError
+            No interface is registered for the analysis version
+        ImportError
+            The registered import path could not be imported
+        """
+        key = analysis_title, version_title
+        try:
+            return self._interfaces[key]
+        except KeyError:
+            pass
+        interface = self.definitions[analysis_title][version_title]
+        if isinstance(interface, str):
+            interface = import_string(interface)
+        with self._lock:
+            self._interfaces[key] = interface
+        return interface
+
+    def warm(self) -> int:
+        """
+        Resolves all registered interfaces, e.g. when a worker process
+        starts, so that the first executions do not pay for their imports.
+
+        Returns
+        -------
+        int
+            Number of resolved interfaces
+        """
+        keys = [
+            (analysis_title, version_title)
+            for analysis_title, versions in self.definitions.items()
+            for version_title in versions
+        ]
+        for analysis_title, version_title in keys:
+            self.get(analysis_title, version_title)
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        Clears all resolved interfaces.
+        """
+        with self._lock:
+            self._interfaces = {}
+
+
+#: Analysis interface registry.
+interface_registry = InterfaceRegistry()
+
+
+@receiver(setting_changed)
+def clear_interface_registry(setting: str, **kwargs) -> None:
+    """
+    Clears resolved interfaces whenever *ANALYSIS_INTERFACES* is changed
+    (e.g. by :func:`~django.test.override_settings`).
+
+    Parameters
+    ----------
+    setting : str
+        Changed setting name
+    """
+    if setting == "ANALYSIS_INTERFACES":
+        interface_registry.clear()
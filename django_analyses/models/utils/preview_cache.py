@@ -0,0 +1,224 @@
+"""
+Definition of the :class:`PreviewCache` class, used to store rendered file
+previews on disk.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from django.conf import settings
+
+#: Default maximal total size of the cached previews (in bytes).
+DEFAULT_PREVIEW_CACHE_SIZE = 1024 ** 3
+
+#: Cached preview file suffix.
+PREVIEW_SUFFIX = ".html"
+
+#: Version of the cache key scheme. Incrementing it invalidates all
+#: previously cached previews.
+PREVIEW_CACHE_VERSION = 1
+
+
+class PreviewCache:
+    """
+    Disk-backed cache of rendered previews. Previews are keyed by the
+    previewed file's path, modification time and size, as well as the
+    parameters used to render them, so modified files are rendered again.
+
+    The cache is enabled by setting *ANALYSIS_PREVIEW_CACHE_DIR* and its total
+    size is bounded by *ANALYSIS_PREVIEW_CACHE_SIZE* (in bytes). Reading a
+    preview updates its modification time, and the least recently used
+    previews are evicted first.
+    """
+
+    @property
+    def directory(self) -> Optional[Path]:
+        """
+        Returns the cache directory, or None if the cache is disabled.
+
+        Returns
+        -------
+        Optional[Path]
+            Cache directory
+        """
+        directory = getattr(settings, "ANALYSIS_PREVIEW_CACHE_DIR", None)
+        return Path(directory) if directory else None
+
+    @property
+    def max_size(self) -> int:
+        """
+        Returns the maximal total size of the cached previews.
+
+        Returns
+        -------
+        int
+            Maximal size (in bytes)
+        """
+        return getattr(
+            settings, "ANALYSIS_PREVIEW_CACHE_SIZE", DEFAULT_PREVIEW_CACHE_SIZE
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def get_key(self, path: Union[str, Path], **parameters) -> str:
+        """
+        Returns the cache key of a file's preview.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Previewed file
+        parameters
+            Rendering parameters
+
+        Returns
+        -------
+        str
+            Cache key
+        """
+        path = Path(path)
+        stat = path.stat()
+        identifier = [
+            PREVIEW_CACHE_VERSION,
+            str(path.absolute()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            parameters,
+        ]
+        serialized = json.dumps(identifier, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """
+        Returns the path of a cached preview.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        Path
+            Cached preview path
+        """
+        return self.directory / key[:2] / f"{key}{PREVIEW_SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns a cached preview, or None if it is not cached.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        Optional[str]
+            Cached preview
+        """
+        if not self.enabled:
+            return None
+        path = self.get_path(key)
+        try:
+            content = path.read_text()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        """
+        Caches a preview and evicts the least recently used previews if the
+        cache exceeds its maximal size.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        content : str
+            Rendered preview
+        """
+        if not self.enabled:
+            return
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that concurrent readers never
+        # read a partially written preview.
+        handle, temp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(handle, "w") as temp_file:
+            temp_file.write(content)
+        os.replace(temp_path, path)
+        self.evict()
+
+    def get_or_render(
+        self, path: Union[str, Path], render: Callable[[], str], **parameters
+    ) -> str:
+        """
+        Returns a file's cached preview, rendering and caching it if
+        required.
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            Previewed file
+        render : Callable[[], str]
+            Callable returning the rendered preview
+        parameters
+            Rendering parameters
+
+        Returns
+        -------
+        str
+            Rendered preview
+        """
+        if not self.enabled:
+            return render()
+        key = self.get_key(path, **parameters)
+        content = self.get(key)
+        if content is None:
+            content = render()
+            if content:
+                self.set(key, content)
+        return content
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used previews until the cache does not
+        exceed its maximal size.
+        """
+        entries = []
+        for path in self.directory.glob(f"*/*{PREVIEW_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= entry_size
+
+    def clear(self) -> None:
+        """
+        Removes all cached previews.
+        """
+        if not self.enabled:
+            return
+        for path in self.directory.glob(f"*/*{PREVIEW_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+#: Rendered preview cache.
+preview_cache = PreviewCache()
@@ -8,3 +8,11 @@ class RunStatus(ChoiceEnum):
     STARTED = "Started"
     SUCCESS = "Success"
     FAILURE = "Failure"
+
+
+#: Status under which runs with no status set are counted (see
+#: :class:`~django_analyses.models.run_status_count.RunStatusCount`).
+PENDING = "PENDING"
+
+#: Counted run statuses, including runs with no status set.
+COUNTED_STATUS_CHOICES = ((PENDING, "Pending"),) + RunStatus.choices()
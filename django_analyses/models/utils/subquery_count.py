@@ -0,0 +1,15 @@
+"""
+Definition of the :class:`SubqueryCount` class.
+"""
+from django.db import models
+
+
+class SubqueryCount(models.Subquery):
+    """
+    Annotates the number of rows returned by a correlated subquery (filtered
+    using :class:`~django.db.models.OuterRef`), without joining or grouping
+    the outer query.
+    """
+
+    template = "(SELECT COUNT(*) FROM (%(subquery)s) _count)"
+    output_field = models.BigIntegerField()
@@ -3,20 +3,138 @@ Definition of the :class:`PipelineRunner` class.
 """
 
 import json
+import os
+from collections import defaultdict, deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from typing import Any, Dict, List, Union
 
-from django.db.models import QuerySet
+import django
+from celery import chain, current_task, group
+from celery.canvas import Signature
+from django.db import connections
 from django_analyses.models.input.definitions.list_input_definition import \
     ListInputDefinition
 from django_analyses.models.pipeline.node import Node
 from django_analyses.models.pipeline.pipe import Pipe
 from django_analyses.models.pipeline.pipeline import Pipeline
-from django_analyses.utils.messages import (BAD_SOURCE_PORT,
+from django_analyses.models.run import Run
+from django_analyses.utils.execution_plan import ExecutionPlan
+from django_analyses.utils.messages import (BAD_CONCURRENCY_BACKEND,
+                                            BAD_SOURCE_PORT,
+                                            CELERY_BACKEND_IN_TASK,
                                             BAD_USER_INPUT_KEYS,
                                             BAD_USER_NODE_INPUT_TYPE,
                                             FAILED_NODE_RUN,
+                                            FAILED_PIPELINE_STEPS,
                                             MISSING_ENTRY_POINT_INPUTS,
-                                            NODE_RUN_FINISHED, NODE_RUN_START)
+                                            NODE_RUN_FINISHED, NODE_RUN_START,
+                                            SKIPPED_PIPELINE_STEP)
+
+#: Database connections inherited by forked worker processes. References are
+#: kept so that they are never garbage collected (and closed) in the child,
+#: which would terminate the parent process's connections.
+_inherited_connections = []
+
+
+def initialize_worker_process() -> None:
+    """
+    Prepares a local worker process for the execution of pipeline nodes by
+    making sure it opens its own database connections.
+    """
+
+    django.setup()
+    for connection in connections.all():
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+
+
+def run_pipeline_step(node_id: int, inputs: dict) -> int:
+    """
+    Executes a single pipeline node with the provided inputs in a worker
+    process.
+
+    Parameters
+    ----------
+    node_id : int
+        The executed node's ID
+    inputs : dict
+        Node inputs
+
+    Returns
+    -------
+    int
+        The resulting :class:`~django_analyses.models.run.Run` instance's ID
+    """
+
+    node = Node.objects.select_related("analysis_version").get(id=node_id)
+    return node.run(inputs).id
+
+
+def run_pipeline_step_task(node_id: int, inputs: dict) -> int:
+    """
+    Executes a single pipeline node with the provided inputs as a Celery
+    task and waits for it to finish. Blocking on another task's result may
+    deadlock a worker, so this is only called outside of Celery tasks (see
+    :meth:`PipelineRunner.run_concurrently`).
+
+    Parameters
+    ----------
+    node_id : int
+        The executed node's ID
+    inputs : dict
+        Node inputs
+
+    Returns
+    -------
+    int
+        The resulting :class:`~django_analyses.models.run.Run` instance's ID
+    """
+
+    from django_analyses.tasks import execute_pipeline_step
+
+    result = execute_pipeline_step.delay(node_id, inputs)
+    return result.get()
+
+
+def merge_execution_states(
+    previous: Union[None, dict, List[dict]]
+) -> Dict[str, dict]:
+    """
+    Merges the execution states returned by the preceding tasks of a
+    compiled pipeline canvas (see :meth:`PipelineRunner.get_canvas`).
+
+    Parameters
+    ----------
+    previous : Union[None, dict, List[dict]]
+        No state (for the first level of the canvas), a single state, or a
+        list of states returned by a group of tasks (or nested lists, for
+        groups of independent branches)
+
+    Returns
+    -------
+    Dict[str, dict]
+        Run IDs and failures by step key
+    """
+
+    merged = {"runs": {}, "failed": {}}
+    if previous is None:
+        return merged
+    if isinstance(previous, dict):
+        previous = [previous]
+    for state in previous:
+        if isinstance(state, list):
+            state = merge_execution_states(state)
+        merged["runs"].update(state["runs"])
+        merged["failed"].update(state["failed"])
+    return merged
 
 
 class PipelineRunner:
@@ -26,6 +144,10 @@ class PipelineRunner:
 
     _RUN_SEP = "─" * 20
 
+    #: Backends available for the concurrent execution of independent
+    #: pipeline steps.
+    CONCURRENCY_BACKENDS = "process", "celery"
+
     def __init__(self, pipeline: Pipeline, quiet: bool = False):
         """
         Moderates the execution of a pipeline by iterating through the nodes
@@ -48,7 +170,7 @@ class PipelineRunner:
         Resets the :attr:`runs` dictionary before a new execution.
         """
 
-        self.runs = {node: [] for node in self.pipeline.node_set}
+        self.runs = {node: [] for node in self.plan.nodes.values()}
 
     def standardize_user_input(
         self,
@@ -79,7 +201,7 @@ class PipelineRunner:
                 for node, node_inputs in user_input.items():
                     # Convert node IDs to nodes.
                     if isinstance(node, int):
-                        node = Node.objects.get(id=node)
+                        node = self.plan.get_node(node)
                     # Standardize as a list of input dictionaries.
                     if isinstance(node_inputs, dict):
                         inputs[node] = [node_inputs]
@@ -89,7 +211,7 @@ class PipelineRunner:
                         raise TypeError(BAD_USER_NODE_INPUT_TYPE)
             else:
                 # Handles an input dictionary passed to a single entry node.
-                entry_nodes = self.pipeline.entry_nodes
+                entry_nodes = self.plan.entry_nodes
                 if len(entry_nodes) == 1:
                     inputs = {entry_nodes[0]: [inputs]}
                 else:
@@ -100,7 +222,7 @@ class PipelineRunner:
         elif isinstance(user_input, list):
             # Handles a list of input dictionaries passed to a single entry
             # node.
-            entry_nodes = self.pipeline.entry_nodes
+            entry_nodes = self.plan.entry_nodes
             if len(entry_nodes) == 1:
                 inputs[entry_nodes[0]] = user_input
             else:
@@ -173,10 +295,11 @@ class PipelineRunner:
                 pass
         return {}
 
-    def get_incoming_pipes(self, node: Node, run_index: int) -> QuerySet:
+    def get_incoming_pipes(self, node: Node, run_index: int) -> List[Pipe]:
         """
         Returns all pipes in the pipeline that declare the given node instance
-        as their destination.
+        as their destination, ordered by their
+        :attr:`~django_analyses.models.pipeline.pipe.Pipe.index`.
 
         Parameters
         ----------
@@ -187,13 +310,11 @@ class PipelineRunner:
 
         Returns
         -------
-        QuerySet
+        List[Pipe]
             Pipes with the provided node as destination
         """
 
-        return self.pipeline.pipe_set.filter(
-            destination=node, destination_run_index=run_index
-        )
+        return self.plan.get_incoming_pipes(node, run_index)
 
     def get_destination_kwarg(self, pipe: Pipe) -> dict:
         """
@@ -212,16 +333,13 @@ class PipelineRunner:
         """
 
         run = self.runs[pipe.source][pipe.source_run_index]
-        key = pipe.destination_port.key
+        key = self.plan.get_destination_port(pipe).key
+        source_key = self.plan.get_source_port(pipe).key
         # Find the source node's output the will be used as the destination
         # node's input.
         try:
-            value = [
-                output.value
-                for output in run.output_set
-                if output.key == pipe.source_port.key
-            ][0]
-        except IndexError:
+            value = run.get_outputs_by_key()[source_key].value
+        except KeyError:
             message = BAD_SOURCE_PORT.format(
                 key=key, source=pipe.source, output_set=run.output_set
             )
@@ -253,14 +371,40 @@ class PipelineRunner:
         """
 
         kwargs = self.get_node_user_inputs(user_inputs, node, run_index)
+        return self.add_piped_inputs(node, run_index, kwargs)
+
+    def add_piped_inputs(
+        self, node: Node, run_index: int, kwargs: dict
+    ) -> dict:
+        """
+        Returns a copy of the provided input configuration updated with the
+        outputs piped to the node's execution from preceding nodes.
+
+        Parameters
+        ----------
+        node : Node
+            Node for which to compose an input configuration
+        run_index : int
+            The index of the node's run
+        kwargs : dict
+            User provided input configuration
+
+        Returns
+        -------
+        dict
+            Input configuration
+        """
+
+        kwargs = dict(kwargs)
         input_pipes = self.get_incoming_pipes(node, run_index=run_index)
         # In case there are destination ports that expect a list of separately
         # generated inputs, pipes are ordered by the (optional) *index* field.
-        for pipe in input_pipes.order_by("index"):
+        for pipe in input_pipes:
             kwarg = self.get_destination_kwarg(pipe)
             key, value = list(kwarg.items())[0]
             # Handle list inputs by creating or appending to a list.
-            if isinstance(pipe.destination_port, ListInputDefinition):
+            destination_port = self.plan.get_destination_port(pipe)
+            if isinstance(destination_port, ListInputDefinition):
                 try:
                     kwargs[key].append(value)
                 except KeyError:
@@ -335,7 +479,12 @@ class PipelineRunner:
         print(message + self._RUN_SEP)
 
     def report_node_execution_failure(
-        self, node: Node, user_inputs: dict, node_inputs: dict, exception: str
+        self,
+        node: Node,
+        user_inputs: dict,
+        node_inputs: dict,
+        exception: str,
+        run_index: int = 0,
     ) -> None:
         """
         Reports a failure in a *node*'s execution.
@@ -350,11 +499,13 @@ class PipelineRunner:
             The complete input configuration for this node's execution
         exception : str
             The raised exception
+        run_index : int, optional
+            The index of the node's run in this pipeline, by default 0
 
         Raises
         ------
         RuntimeError
-            [description]
+            Node execution failure
         """
 
         formatted_user_inputs = self.generate_user_inputs_string(user_inputs)
@@ -364,7 +515,7 @@ class PipelineRunner:
         message = FAILED_NODE_RUN.format(
             node_id=node.id,
             analysis_version=node.analysis_version,
-            run_index=0,
+            run_index=run_index,
             exception=exception,
             user_inputs=formatted_user_inputs,
             node_inputs=formatted_node_inputs,
@@ -385,7 +536,7 @@ class PipelineRunner:
         """
 
         first = True
-        for node in self.pipeline.entry_nodes:
+        for node in self.plan.entry_nodes:
             # Get input configuration.
             node_inputs = self.get_node_user_inputs(user_inputs, node, 0)
             # Report execution start.
@@ -423,15 +574,9 @@ class PipelineRunner:
             Whether all required nodes have been executed or not
         """
 
-        preceding_nodes = node.get_required_nodes(
-            pipeline=self.pipeline, run_index=run_index
-        )
-        for preceding_node in preceding_nodes:
-            node_id = preceding_node["source"]
-            run_index = preceding_node["source_run_index"]
-            node = Node.objects.get(id=node_id)
+        for pipe in self.get_incoming_pipes(node, run_index):
             try:
-                _ = self.runs[node][run_index]
+                _ = self.runs[pipe.source][pipe.source_run_index]
             except IndexError:
                 return False
         return True
@@ -460,13 +605,454 @@ class PipelineRunner:
             run = node.run(node_inputs)
         except Exception as e:
             self.report_node_execution_failure(
-                node, user_inputs, node_inputs, e
+                node, user_inputs, node_inputs, e, run_index
             )
         self.runs[node].append(run)
         if not self.quiet:
             self.report_node_execution_end(run)
 
-    def run(self, inputs: dict) -> dict:
+    def create_executor(self, backend: str, max_workers: int) -> Executor:
+        """
+        Returns an executor for the concurrent execution of pipeline steps.
+
+        Parameters
+        ----------
+        backend : str
+            Concurrency backend, either "process" (a local process pool) or
+            "celery" (Celery tasks awaited by a thread pool)
+        max_workers : int
+            Maximal number of concurrently executed steps
+
+        Returns
+        -------
+        Executor
+            Pipeline step executor
+        """
+
+        if backend == "process":
+            return ProcessPoolExecutor(
+                max_workers=max_workers, initializer=initialize_worker_process
+            )
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def submit_step(
+        self, executor: Executor, backend: str, node: Node, inputs: dict
+    ) -> Future:
+        """
+        Submits a single node execution to the provided executor.
+
+        Parameters
+        ----------
+        executor : Executor
+            Pipeline step executor
+        backend : str
+            Concurrency backend
+        node : Node
+            Node to be executed
+        inputs : dict
+            Node inputs
+
+        Returns
+        -------
+        Future
+            Future resolving to the created run's ID
+        """
+
+        if backend == "process":
+            return executor.submit(run_pipeline_step, node.id, inputs)
+        return executor.submit(run_pipeline_step_task, node.id, inputs)
+
+    def get_execution_key(self, node: Node, inputs: dict) -> str:
+        """
+        Returns a key identifying the execution of *node* with the provided
+        *inputs*.
+
+        Parameters
+        ----------
+        node : Node
+            Executed node
+        inputs : dict
+            Node inputs
+
+        Returns
+        -------
+        str
+            Execution key
+        """
+
+        serialized_inputs = json.dumps(inputs, sort_keys=True, default=str)
+        return f"{node.id}:{serialized_inputs}"
+
+    def is_at_max_parallel(self, node: Node, running: Dict[int, int]) -> bool:
+        """
+        Checks whether the provided node's analysis version has reached its
+        :attr:`~django_analyses.models.analysis_version.AnalysisVersion.max_parallel`
+        number of concurrent executions.
+
+        Parameters
+        ----------
+        node : Node
+            Node to evaluate
+        running : Dict[int, int]
+            Number of running executions by analysis version ID
+
+        Returns
+        -------
+        bool
+            Whether the node's execution should be deferred
+        """
+
+        max_parallel = node.analysis_version.max_parallel
+        running_count = running[node.analysis_version_id]
+        return bool(max_parallel) and running_count >= max_parallel
+
+    def queue_dependent_steps(
+        self,
+        node: Node,
+        run_index: int,
+        remaining: Dict[tuple, int],
+        ready: deque,
+    ) -> None:
+        """
+        Updates the remaining requirements count of a finished step's
+        dependents and queues the ones with all of their requirements met.
+
+        Parameters
+        ----------
+        node : Node
+            Finished node
+        run_index : int
+            The index of the finished node's run
+        remaining : Dict[tuple, int]
+            Number of unfinished required steps by step
+        ready : deque
+            Steps ready for execution
+        """
+
+        plan = self.plan
+        dependents = plan.get_dependent_steps(node, run_index)
+        for dependent in sorted(dependents, key=plan.steps.index):
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                ready.append(dependent)
+
+    def run_concurrently(
+        self, inputs: dict, max_workers: int = None, backend: str = "process"
+    ) -> dict:
+        """
+        Runs :attr:`pipeline` with the provided *inputs*, executing all steps
+        whose requirements are met concurrently. Each finished step's outputs
+        are piped to its dependents as soon as it completes.
+
+        Note
+        ----
+        Nodes are executed by other processes, so any required data must be
+        committed to the database beforehand.
+
+        Parameters
+        ----------
+        inputs : dict
+            Input configurations to be passed to the nodes (see :meth:`run`)
+        max_workers : int, optional
+            Maximal number of concurrently executed steps, by default None
+            (the number of CPUs)
+        backend : str, optional
+            Concurrency backend, either "process" (a local process pool) or
+            "celery" (separate Celery tasks awaited by the calling process,
+            which may not be a Celery task itself), by default "process"
+
+        Returns
+        -------
+        dict
+            Resulting run instances
+
+        Raises
+        ------
+        ValueError
+            Invalid concurrency backend
+        RuntimeError
+            The "celery" backend is used from within a Celery task
+        """
+
+        if backend not in self.CONCURRENCY_BACKENDS:
+            message = BAD_CONCURRENCY_BACKEND.format(
+                backend=backend, backends=self.CONCURRENCY_BACKENDS
+            )
+            raise ValueError(message)
+        if backend == "celery" and current_task:
+            raise RuntimeError(CELERY_BACKEND_IN_TASK)
+        max_workers = max_workers or os.cpu_count() or 1
+        plan = self.plan
+        # Runs may finish out of order, so each node's runs list is
+        # preallocated.
+        self.runs = {
+            node: [None] * plan.count_node_runs(node)
+            for node in plan.nodes.values()
+        }
+        user_inputs = self.standardize_user_input(inputs)
+        remaining = {
+            step: len(plan.get_required_steps(*step)) for step in plan.steps
+        }
+        ready = deque(step for step in plan.steps if not remaining[step])
+        # Steps awaiting each submitted future, and submitted futures by
+        # execution key.
+        in_flight = defaultdict(list)
+        submitted = {}
+        running = defaultdict(int)
+        failure = None
+        first = True
+        with self.create_executor(backend, max_workers) as executor:
+            while ready or in_flight:
+                # Submit ready steps, unless a failure occured.
+                deferred = deque()
+                while failure is None and ready:
+                    if len(in_flight) >= max_workers:
+                        break
+                    node, run_index = step = ready.popleft()
+                    node_inputs = self.get_node_inputs(
+                        node, user_inputs, run_index
+                    )
+                    # Identical executions are only submitted once, to avoid
+                    # creating duplicate runs.
+                    key = self.get_execution_key(node, node_inputs)
+                    if key in submitted:
+                        in_flight[submitted[key]].append((step, node_inputs))
+                        continue
+                    if self.is_at_max_parallel(node, running):
+                        deferred.append(step)
+                        continue
+                    if not self.quiet:
+                        self.report_node_execution_start(
+                            node, run_index, node_inputs, first
+                        )
+                        first = False
+                    future = self.submit_step(
+                        executor, backend, node, node_inputs
+                    )
+                    in_flight[future].append((step, node_inputs))
+                    submitted[key] = future
+                    running[node.analysis_version_id] += 1
+                ready.extendleft(reversed(deferred))
+                if not in_flight:
+                    break
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    steps = in_flight.pop(future)
+                    (node, run_index), node_inputs = steps[0]
+                    del submitted[self.get_execution_key(node, node_inputs)]
+                    running[node.analysis_version_id] -= 1
+                    try:
+                        run = Run.objects.get(id=future.result())
+                        if run.status == "FAILURE":
+                            raise RuntimeError(run.traceback)
+                    except Exception as e:
+                        if failure is None:
+                            failure = node, node_inputs, e, run_index
+                        continue
+                    if not self.quiet:
+                        self.report_node_execution_end(run)
+                    for (node, run_index), _ in steps:
+                        self.runs[node][run_index] = run
+                        self.queue_dependent_steps(
+                            node, run_index, remaining, ready
+                        )
+        if failure is not None:
+            node, node_inputs, exception, run_index = failure
+            self.report_node_execution_failure(
+                node, user_inputs, node_inputs, exception, run_index
+            )
+        return self.runs
+
+    def get_step_key(self, node: Node, run_index: int) -> str:
+        """
+        Returns a JSON-serializable key identifying a pipeline step.
+
+        Parameters
+        ----------
+        node : Node
+            Executed node
+        run_index : int
+            The index of the node's run
+
+        Returns
+        -------
+        str
+            Step key
+        """
+
+        return f"{node.id}:{run_index}"
+
+    def load_runs(self, state: dict, steps: list = None) -> None:
+        """
+        Populates :attr:`runs` with the runs listed in an execution state
+        returned by the tasks of a compiled pipeline canvas.
+
+        Parameters
+        ----------
+        state : dict
+            Execution state
+        steps : list, optional
+            (node, run index) pairs to load, by default None (all runs)
+        """
+
+        plan = self.plan
+        self.runs = {
+            node: [None] * plan.count_node_runs(node)
+            for node in plan.nodes.values()
+        }
+        if steps is None:
+            steps = plan.steps
+        run_ids = {
+            step: state["runs"][self.get_step_key(*step)]
+            for step in steps
+            if self.get_step_key(*step) in state["runs"]
+        }
+        runs = Run.objects.with_io().in_bulk(run_ids.values())
+        for (node, run_index), run_id in run_ids.items():
+            self.runs[node][run_index] = runs[run_id]
+
+    def get_canvas(self, inputs: dict) -> Signature:
+        """
+        Compiles :attr:`pipeline` and the provided *inputs* into a Celery
+        canvas, executing each node's run as a separate task.
+
+        Independent branches of the pipeline (see
+        :meth:`~django_analyses.utils.execution_plan.ExecutionPlan.get_branches`)
+        are executed concurrently, each as a chain of levels, so that one
+        branch never waits for another. Within a branch, each level's tasks
+        are executed concurrently once the entire previous level has
+        finished, so a step may wait for steps it does not depend on (Celery
+        canvases can't express shared fan-out and fan-in without duplicating
+        tasks). Created runs are passed between the tasks by ID. A failed
+        step only causes the steps depending on it to be skipped, and the
+        final task raises a `RuntimeError` listing all failures.
+
+        Parameters
+        ----------
+        inputs : dict
+            Input configurations to be passed to the nodes (see :meth:`run`),
+            which must be JSON-serializable
+
+        Returns
+        -------
+        Signature
+            Pipeline execution canvas
+        """
+
+        from django_analyses.tasks import (
+            execute_pipeline_node,
+            finalize_pipeline_execution,
+        )
+
+        user_inputs = self.standardize_user_input(inputs)
+        branches = [
+            chain(
+                *(
+                    group(
+                        execute_pipeline_node.s(
+                            pipeline_id=self.pipeline.id,
+                            node_id=node.id,
+                            run_index=run_index,
+                            inputs=self.get_node_user_inputs(
+                                user_inputs, node, run_index
+                            ),
+                        )
+                        for node, run_index in level
+                    )
+                    for level in self.plan.get_levels(steps)
+                )
+            )
+            for steps in self.plan.get_branches()
+        ]
+        finalize = finalize_pipeline_execution.s(pipeline_id=self.pipeline.id)
+        if len(branches) == 1:
+            return chain(*branches, finalize)
+        return chain(group(branches), finalize)
+
+    def run_step(
+        self, state: dict, node_id: int, run_index: int, inputs: dict
+    ) -> dict:
+        """
+        Executes a single step of a compiled pipeline canvas, unless any of
+        its requirements failed.
+
+        Parameters
+        ----------
+        state : dict
+            Execution state merged from preceding tasks
+        node_id : int
+            The executed node's ID
+        run_index : int
+            The index of the node's run
+        inputs : dict
+            User provided input configuration
+
+        Returns
+        -------
+        dict
+            Updated execution state
+        """
+
+        node = self.plan.get_node(node_id)
+        key = self.get_step_key(node, run_index)
+        state["run_id"] = None
+        required_steps = self.plan.get_required_steps(node, run_index)
+        required_keys = {self.get_step_key(*step) for step in required_steps}
+        if any(
+            required_key not in state["runs"]
+            for required_key in required_keys
+        ):
+            state["failed"][key] = SKIPPED_PIPELINE_STEP
+            return state
+        self.load_runs(state, steps=required_steps)
+        node_inputs = self.add_piped_inputs(node, run_index, inputs)
+        try:
+            run = node.run(node_inputs)
+        except Exception as e:
+            state["failed"][key] = str(e)
+            return state
+        if run.status == "FAILURE":
+            state["failed"][key] = run.traceback
+        else:
+            state["runs"][key] = run.id
+            state["run_id"] = run.id
+        return state
+
+    def collect_results(self, state: dict) -> dict:
+        """
+        Returns the JSON-serializable results of a compiled pipeline canvas
+        execution.
+
+        Parameters
+        ----------
+        state : dict
+            Final execution state
+
+        Returns
+        -------
+        dict
+            Results dictionary (see :meth:`get_safe_results`)
+
+        Raises
+        ------
+        RuntimeError
+            Failed pipeline steps
+        """
+
+        if state["failed"]:
+            failures = "\n".join(
+                f"{key}: {failure}" for key, failure in state["failed"].items()
+            )
+            message = FAILED_PIPELINE_STEPS.format(
+                pipeline_id=self.pipeline.id, failures=failures
+            )
+            raise RuntimeError(message)
+        self.load_runs(state)
+        return self.get_safe_results()
+
+    def run(
+        self, inputs: dict, max_workers: int = None, backend: str = None
+    ) -> dict:
         """
         Runs :attr:`pipeline` with the provided *inputs*.
 
@@ -477,6 +1063,13 @@ class PipelineRunner:
             provided as a dictionary with nodes as keys and configurations as
             values or simply an input configuration if there's only one entry
             node
+        max_workers : int, optional
+            Maximal number of concurrently executed steps if a *backend* is
+            specified, by default None
+        backend : str, optional
+            If specified, independent pipeline branches are executed
+            concurrently using this backend (see :meth:`run_concurrently`), by
+            default None (sequential execution in the calling process)
 
         Returns
         -------
@@ -484,14 +1077,18 @@ class PipelineRunner:
             Resulting run instances
         """
 
+        if backend is not None:
+            return self.run_concurrently(
+                inputs, max_workers=max_workers, backend=backend
+            )
         self.reset_runs_dict()
         inputs = self.standardize_user_input(inputs)
         self.run_entry_nodes(inputs)
-        while self.pending_nodes:
-            for node in self.pending_nodes:
-                run_index = len(self.runs[node])
-                if self.has_required_runs(node, run_index):
-                    self.run_node(node, inputs)
+        # Steps are topologically sorted, so each node's requirements have
+        # always been executed by the time it is reached.
+        for node, run_index in self.plan.steps:
+            if len(self.runs[node]) == run_index:
+                self.run_node(node, inputs)
         return self.runs
 
     def get_safe_results(self) -> dict:
@@ -524,5 +1121,18 @@ class PipelineRunner:
         return [
             node
             for node in self.runs
-            if len(self.runs[node]) != self.pipeline.count_node_runs(node)
+            if len(self.runs[node]) != self.plan.count_node_runs(node)
         ]
+
+    @property
+    def plan(self) -> ExecutionPlan:
+        """
+        The pipeline's compiled execution plan.
+
+        Returns
+        -------
+        ExecutionPlan
+            Execution plan
+        """
+
+        return self.pipeline.get_execution_plan()
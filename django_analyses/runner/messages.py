@@ -24,9 +24,18 @@ class bcolors:
     UNDERLINE = "\033[4m"
 
 
+#: Report dispatching a batch in streaming mode.
+BATCH_DISPATCHED = "Dispatched batch #{index} ({n_inputs} input specifications)."
+
 #: Batch run start messsage.
 BATCH_RUN_START = f"{bcolors.UNDERLINE}{bcolors.HEADER}{bcolors.BOLD}{{analysis_version}}{bcolors.ENDC}{bcolors.UNDERLINE}{bcolors.HEADER}: Batch Execution{bcolors.ENDC}"
 
+#: Report waiting for an in-flight batch to finish in streaming mode.
+BATCH_WAIT = "Waiting for batch {batch_id} to finish..."
+
+#: Report attempting to wait for in-flight batches from within a Celery task.
+BATCH_WAIT_IN_TASK = "In-flight batches can't be awaited from within a Celery task, as blocking on other tasks may deadlock the worker! Please run without a maximal number of in-flight batches, or outside of a task."
+
 #: Base queryset generation message.
 BASE_QUERY_START = "Querying {model_name} instances..."
 
@@ -2,17 +2,21 @@
 Definition of the :class:`QuerySetRunner` class.
 """
 import logging
-from typing import Any, Dict, List, Tuple
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Tuple
 
+from celery import current_task, group
+from celery.result import GroupResult
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Model, Q, QuerySet
+from django.db.models import Exists, Model, OuterRef, Q, QuerySet
 from django_analyses.models.analysis import Analysis
 from django_analyses.models.analysis_version import AnalysisVersion
 from django_analyses.models.input.definitions.input_definition import \
     InputDefinition
 from django_analyses.models.pipeline.node import Node
 from django_analyses.runner import messages
-from django_analyses.tasks import execute_node
+from django_analyses.tasks import execute_node, execute_node_batch
 from django_analyses.utils.progressbar import create_progressbar
 
 _LOGGER = logging.getLogger("analysis_exection")
@@ -65,13 +69,53 @@ class QuerySetRunner:
     --------
     * :func:`get_base_queryset`
     """
+    INPUT_VALUE_FIELD: str = None
+    """
+    The name of the data model field matching the
+    :attr:`~django_analyses.models.input.input.Input.value` generated by
+    :func:`get_instance_representation`. If set (or if
+    :func:`get_instance_representation` is not overridden), existing runs are
+    detected in the database rather than in Python.
+
+    See Also
+    --------
+    * :func:`get_representation_field`
+    """
+
+    #
+    # Streaming Execution
+    #
+    BATCH_SIZE: int = None
+    """
+    If set, pending instances are streamed from the database and dispatched
+    for execution in batches of this size rather than all at once.
+
+    See Also
+    --------
+    * :func:`run_in_batches`
+    """
+    MAX_IN_FLIGHT_BATCHES: int = None
+    """
+    Maximal number of dispatched batches that may be executing at the same
+    time in streaming mode. If none is provided, the number of in-flight
+    batches is not limited. Limiting in-flight batches blocks the calling
+    process while waiting for them, so it may not be used within a Celery
+    task.
+    """
+    ITERATOR_CHUNK_SIZE: int = 2000
+    """
+    Number of instances fetched from the database at a time in streaming mode.
+    """
 
     #
     # Messages
     #
     BASE_QUERY_START: str = messages.BASE_QUERY_START
     BASE_QUERY_END: str = messages.BASE_QUERY_END
+    BATCH_DISPATCHED: str = messages.BATCH_DISPATCHED
     BATCH_RUN_START: str = messages.BATCH_RUN_START
+    BATCH_WAIT: str = messages.BATCH_WAIT
+    BATCH_WAIT_IN_TASK: str = messages.BATCH_WAIT_IN_TASK
     DEFAULT_QUERYSET_QUERY: str = messages.DEFAULT_QUERYSET_QUERY
     EXECUTION_STARTED: str = messages.EXECUTION_STARTED
     FILTER_QUERYSET_START: str = messages.FILTER_QUERYSET_START
@@ -295,7 +339,8 @@ class QuerySetRunner:
         InputDefinition
             Instance input definition
         """
-        return self.analysis_version.input_definitions.get(key=self.INPUT_KEY)
+        specification = self.analysis_version.input_specification
+        return specification.get_definition(self.INPUT_KEY)
 
     def query_input_set(self, log_level: int = logging.DEBUG) -> QuerySet:
         """
@@ -368,6 +413,126 @@ class QuerySetRunner:
         else:
             return True
 
+    def get_representation_field(self) -> str:
+        """
+        Returns the name of the data model field that matches existing inputs'
+        values, or *None* if instance representations can only be resolved
+        in Python.
+
+        Returns
+        -------
+        str
+            Data model field name
+
+        See Also
+        --------
+        * :attr:`INPUT_VALUE_FIELD`
+        """
+        if self.INPUT_VALUE_FIELD:
+            return self.INPUT_VALUE_FIELD
+        representation_getter = type(self).get_instance_representation
+        if representation_getter is QuerySetRunner.get_instance_representation:
+            return "pk"
+
+    def get_hashable_value(self, value: Any) -> Hashable:
+        """
+        Converts an input value (or instance representation) to a hashable
+        object that may be compared against existing input values.
+
+        Parameters
+        ----------
+        value : Any
+            Input value
+
+        Returns
+        -------
+        Hashable
+            Hashable input value
+        """
+        if isinstance(value, Model):
+            return value.pk
+        elif isinstance(value, Path):
+            return str(value)
+        elif isinstance(value, (list, tuple)):
+            return tuple(self.get_hashable_value(element) for element in value)
+        return value
+
+    def query_existing_values(self) -> set:
+        """
+        Returns the values of the existing inputs of the execution node as a
+        set.
+
+        Returns
+        -------
+        set
+            Existing input values
+        """
+        values = self.input_set.values_list("value", flat=True)
+        return {self.get_hashable_value(value) for value in values}
+
+    def split_by_field(
+        self, queryset: QuerySet, field: str
+    ) -> Tuple[QuerySet, QuerySet]:
+        """
+        Splits *queryset* to instances with and without existing runs in the
+        database, using an :class:`~django.db.models.Exists` subquery over the
+        existing inputs.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            Queryset to split by run status
+        field : str
+            Data model field matching the existing inputs' values
+
+        Returns
+        -------
+        Tuple[QuerySet, QuerySet]
+            Existing, Pending
+        """
+        # Sliced querysets can't be filtered, so they are evaluated to a
+        # list of primary keys first.
+        if queryset.query.is_sliced:
+            ids = list(queryset.values_list("pk", flat=True))
+            queryset = self.DATA_MODEL.objects.filter(pk__in=ids)
+        matching_input = self.input_set.filter(value=OuterRef(field))
+        existing = queryset.filter(Exists(matching_input))
+        pending = queryset.filter(~Exists(matching_input))
+        return existing, pending
+
+    def split_by_representation(
+        self, iterable
+    ) -> Tuple[QuerySet, QuerySet]:
+        """
+        Splits the instances in *iterable* to instances with and without
+        existing runs by comparing their representations against a set of the
+        existing input values.
+
+        Parameters
+        ----------
+        iterable : Iterable[Model]
+            Data instances to split by run status
+
+        Returns
+        -------
+        Tuple[QuerySet, QuerySet]
+            Existing, Pending
+        """
+        existing_values = self.query_existing_values()
+        existing_ids, pending_ids = [], []
+        for instance in iterable:
+            value = self.get_instance_representation(instance)
+            if self.get_hashable_value(value) in existing_values:
+                existing_ids.append(instance.id)
+            else:
+                pending_ids.append(instance.id)
+        # self.DATA_MODEL should be used rather than the queryset because the
+        # queryset can be a slice, in which case Django will raise an
+        # AssertionError.
+        existing = self.DATA_MODEL.objects.filter(id__in=existing_ids)
+        pending = self.DATA_MODEL.objects.filter(id__in=pending_ids)
+        return existing, pending
+
     def evaluate_queryset(
         self,
         queryset: QuerySet,
@@ -430,32 +595,22 @@ class QuerySetRunner:
             Existing, Pending
         """
         self.log_progress_query_start(log_level)
-        # Evaluate queryset and prepare for progressbar if used
+        # Evaluate queryset.
         queryset = self.evaluate_queryset(
             queryset, apply_filter=apply_filter, log_level=log_level
         )
-        iterable = create_progressbar(
-            queryset,
-            disable=not progressbar,
-            **self.STATUS_QUERY_PROGRESSBAR_KWARGS,
-        )
 
         # Split to existing and pending.
-        existing_ids = [
-            instance.id for instance in iterable if self.has_run(instance)
-        ]
-        # A list comprehension is used here (rather than a query) because the
-        # queryset can be a slice, in which case Django will raise an
-        # AssertionError.
-        pending_ids = [
-            instance.id
-            for instance in queryset
-            if instance.id not in existing_ids
-        ]
-        # self.DATA_MODEL should be used rather than the queryset for the same
-        # reason mentioned above.
-        existing = self.DATA_MODEL.objects.filter(id__in=existing_ids)
-        pending = self.DATA_MODEL.objects.filter(id__in=pending_ids)
+        field = self.get_representation_field()
+        if field is None:
+            iterable = create_progressbar(
+                queryset,
+                disable=not progressbar,
+                **self.STATUS_QUERY_PROGRESSBAR_KWARGS,
+            )
+            existing, pending = self.split_by_representation(iterable)
+        else:
+            existing, pending = self.split_by_field(queryset, field)
 
         self.log_progress_query_end(
             queryset, existing, pending, log_level=log_level
@@ -596,6 +751,216 @@ class QuerySetRunner:
         _LOGGER.info(end_message)
         return inputs
 
+    def iterate_inputs(
+        self,
+        queryset: QuerySet,
+        progressbar: bool = True,
+        max_total: int = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generates input specifications for the instances in
+        *queryset*, fetching them from the database in chunks of
+        :attr:`ITERATOR_CHUNK_SIZE` instances.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            Instances to run the analysis over
+        progressbar : bool, optional
+            Whether to display a progressbar, by default True
+        max_total : int, optional
+            Maximal total number of instances, by default None
+
+        Yields
+        ------
+        Dict[str, Any]
+            Input specification
+
+        See Also
+        --------
+        :func:`create_input_specification`
+        """
+        instances = queryset[:max_total].iterator(
+            chunk_size=self.ITERATOR_CHUNK_SIZE
+        )
+        iterable = create_progressbar(
+            instances,
+            disable=not progressbar,
+            **self.INPUT_GENERATION_PROGRESSBAR_KWARGS,
+        )
+        for instance in iterable:
+            specification = self.create_input_specification(instance)
+            if specification is not None:
+                yield specification
+
+    def dispatch_batch(self, inputs: List[Dict[str, Any]]) -> GroupResult:
+        """
+        Dispatches the execution of a single batch of input specifications.
+        If the analysis version's
+        :attr:`~django_analyses.models.analysis_version.AnalysisVersion.batch_size`
+        is set, the batch is split into
+        :func:`~django_analyses.tasks.execute_node_batch` tasks of that size,
+        otherwise each input specification is executed by a separate task.
+
+        Parameters
+        ----------
+        inputs : List[Dict[str, Any]]
+            Input specifications
+
+        Returns
+        -------
+        GroupResult
+            Batch execution result
+        """
+        node_id = self.node.id
+        task_size = self.analysis_version.batch_size
+        if not task_size or task_size == 1:
+            return group(
+                execute_node.s(node_id, specification)
+                for specification in inputs
+            ).apply_async()
+        return group(
+            execute_node_batch.s(node_id, inputs[start:start + task_size])
+            for start in range(0, len(inputs), task_size)
+        ).apply_async()
+
+    def wait_for_batch(
+        self, result: GroupResult, log_level: int = logging.DEBUG
+    ) -> None:
+        """
+        Blocks until the execution of a dispatched batch is finished. Must be
+        called by the dispatching process, as blocking on other tasks from
+        within a Celery task may deadlock the worker.
+
+        Parameters
+        ----------
+        result : GroupResult
+            Dispatched batch execution result
+        log_level : int, optional
+            Logging level to use, by default 10 (DEBUG)
+
+        Raises
+        ------
+        RuntimeError
+            Called from within a Celery task
+        """
+        if current_task:
+            raise RuntimeError(self.BATCH_WAIT_IN_TASK)
+        _LOGGER.log(log_level, self.BATCH_WAIT.format(batch_id=result.id))
+        result.join(propagate=False)
+
+    def run_in_batches(
+        self,
+        queryset: QuerySet,
+        batch_size: int,
+        max_in_flight: int = None,
+        max_total: int = None,
+        progressbar: bool = True,
+        log_level: int = logging.INFO,
+        dry: bool = False,
+    ) -> int:
+        """
+        Streams input specifications for the instances in *queryset* and
+        dispatches them for execution in fixed-size batches, so that memory
+        usage and message size remain bounded regardless of the size of the
+        queryset.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            Pending instances to run the analysis over
+        batch_size : int
+            Number of input specifications per batch
+        max_in_flight : int, optional
+            Maximal number of batches executing at the same time, by default
+            None (unlimited). Limiting in-flight batches requires waiting for
+            them (see :func:`wait_for_batch`), which is not possible from
+            within a Celery task
+        max_total : int, optional
+            Maximal total number of runs, by default None
+        progressbar : bool, optional
+            Whether to display a progressbar, by default True
+        log_level : int, optional
+            Logging level to use, by default 20 (INFO)
+        dry : bool, optional
+            Whether this is a dry run (no execution) or not, by default False
+
+        Returns
+        -------
+        int
+            Number of dispatched input specifications
+
+        Raises
+        ------
+        RuntimeError
+            *max_in_flight* is set from within a Celery task
+        """
+        # Fail before dispatching any batch rather than once the in-flight
+        # limit is reached.
+        if max_in_flight and not dry and current_task:
+            raise RuntimeError(self.BATCH_WAIT_IN_TASK)
+        _LOGGER.info(self.INPUT_GENERATION)
+        in_flight = deque()
+        n_inputs = n_batches = 0
+        batch = []
+        inputs = self.iterate_inputs(
+            queryset, progressbar=progressbar, max_total=max_total
+        )
+        for specification in inputs:
+            batch.append(specification)
+            if len(batch) < batch_size:
+                continue
+            n_batches += 1
+            n_inputs += len(batch)
+            self.run_batch(batch, n_batches, in_flight, max_in_flight, dry)
+            batch = []
+        if batch:
+            n_batches += 1
+            n_inputs += len(batch)
+            self.run_batch(batch, n_batches, in_flight, max_in_flight, dry)
+        end_message = self.INPUT_GENERATION_FINISHED.format(n_inputs=n_inputs)
+        _LOGGER.log(log_level, end_message)
+        return n_inputs
+
+    def run_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        index: int,
+        in_flight: deque,
+        max_in_flight: int = None,
+        dry: bool = False,
+        log_level: int = logging.DEBUG,
+    ) -> None:
+        """
+        Dispatches a single batch in streaming mode, waiting for the oldest
+        in-flight batch to finish first if *max_in_flight* is reached.
+
+        Parameters
+        ----------
+        inputs : List[Dict[str, Any]]
+            Input specifications
+        index : int
+            Batch index (starting from 1)
+        in_flight : deque
+            Results of the batches dispatched so far
+        max_in_flight : int, optional
+            Maximal number of batches executing at the same time, by default
+            None (unlimited)
+        dry : bool, optional
+            Whether this is a dry run (no execution) or not, by default False
+        log_level : int, optional
+            Logging level to use, by default 10 (DEBUG)
+        """
+        if dry:
+            return
+        while max_in_flight and len(in_flight) >= max_in_flight:
+            self.wait_for_batch(in_flight.popleft())
+        in_flight.append(self.dispatch_batch(inputs))
+        message = self.BATCH_DISPATCHED.format(
+            index=index, n_inputs=len(inputs)
+        )
+        _LOGGER.log(log_level, message)
+
     def run(
         self,
         queryset: QuerySet = None,
@@ -603,6 +968,8 @@ class QuerySetRunner:
         prep_progressbar: bool = True,
         log_level: int = logging.INFO,
         dry: bool = False,
+        batch_size: int = None,
+        max_in_flight: int = None,
     ):
         """
         Execute this class's :attr:`node` in batch over all data instances in
@@ -621,7 +988,16 @@ class QuerySetRunner:
             Logging level to use, by default 20 (INFO)
         dry : bool, optional
             Whether this is a dry run (no execution) or not, by default False
+        batch_size : int, optional
+            If provided, streams pending instances and dispatches them in
+            batches of this size (see :func:`run_in_batches`), by default
+            :attr:`BATCH_SIZE`
+        max_in_flight : int, optional
+            Maximal number of batches executing at the same time in streaming
+            mode, by default :attr:`MAX_IN_FLIGHT_BATCHES`
         """
+        batch_size = batch_size or self.BATCH_SIZE
+        max_in_flight = max_in_flight or self.MAX_IN_FLIGHT_BATCHES
         self.log_run_start(log_level=log_level)
         queryset_message = self.INPUT_QUERYSET_VALIDATION
         if queryset is None:
@@ -633,15 +1009,31 @@ class QuerySetRunner:
         existing, pending = self.query_progress(
             queryset, apply_filter=False, log_level=log_level
         )
-        if pending:
+        if not pending.exists():
+            return
+        if batch_size:
+            n_pending = pending.count()
+            if max_total is not None:
+                n_pending = min(n_pending, max_total)
+            self.log_execution_start(n_instances=n_pending)
+            self.run_in_batches(
+                pending,
+                batch_size,
+                max_in_flight=max_in_flight,
+                max_total=max_total,
+                progressbar=prep_progressbar,
+                log_level=log_level,
+                dry=dry,
+            )
+        else:
             inputs = self.create_inputs(
                 pending, prep_progressbar, max_total=max_total
             )
             inputs = inputs[:max_total]
             if inputs:
+                self.log_execution_start(n_instances=len(inputs))
                 if not dry:
                     execute_node.delay(node_id=self.node.id, inputs=inputs)
-                self.log_execution_start(n_instances=len(inputs))
 
     def log_run_start(self, log_level: int = logging.INFO) -> None:
         """
@@ -20,3 +20,22 @@ class AnalysisSerializer(serializers.HyperlinkedModelSerializer):
             "modified",
             "url",
         )
+
+
+class CompactAnalysisSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer class for the
+    :class:`~django_analyses.models.analysis.Analysis` model, serializing
+    relations as primary keys.
+    """
+
+    class Meta:
+        model = Analysis
+        fields = (
+            "id",
+            "title",
+            "description",
+            "category",
+            "created",
+            "modified",
+        )
@@ -27,3 +27,15 @@ class AnalysisVersionSerializer(serializers.HyperlinkedModelSerializer):
             "created",
             "modified",
         )
+
+
+class CompactAnalysisVersionSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer class for the
+    :class:`~django_analyses.models.analysis_version.AnalysisVersion` model,
+    serializing relations as primary keys.
+    """
+
+    class Meta:
+        model = AnalysisVersion
+        fields = AnalysisVersionSerializer.Meta.fields
@@ -5,6 +5,20 @@ from rest_framework import serializers
 from django_analyses.models.run import Run
 from django_analyses.serializers.analysis_version import AnalysisVersionSerializer
 
+#: Fields serialized by the run serializers.
+RUN_FIELDS = (
+    "id",
+    "user",
+    "analysis_version",
+    "created",
+    "modified",
+    "start_time",
+    "end_time",
+    "duration",
+    "status",
+    "traceback",
+)
+
 User = get_user_model()
 
 
@@ -24,6 +38,8 @@ class MiniUserSerializer(UserDetailsSerializer):
             "full_name",
             "email",
         )
+        # Accessed by get_full_name() (if the user model has a profile).
+        select_related = ("profile",)
 
     def get_full_name(self, instance: User) -> str:
         return instance.profile.get_full_name(include_title=False)
@@ -35,18 +51,33 @@ class RunSerializer(serializers.HyperlinkedModelSerializer):
 
     class Meta:
         model = Run
-        fields = (
-            "id",
-            "user",
-            "analysis_version",
-            "created",
-            "modified",
-            "start_time",
-            "end_time",
-            "duration",
-            "status",
-            "traceback",
-        )
+        fields = RUN_FIELDS
 
     def duration(self, instance: Run):
         return self.instance.duration
+
+
+class CompactUserSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer class for the :class:`User` model, used to side-load
+    the users of compactly serialized runs.
+    """
+
+    class Meta:
+        model = User
+        fields = UserDetailsSerializer.Meta.fields
+
+
+class CompactRunSerializer(serializers.ModelSerializer):
+    """
+    Compact serializer class for the :class:`~django_analyses.models.run.Run`
+    model, serializing relations as primary keys. Related instances are
+    side-loaded once per response (see
+    :meth:`~django_analyses.views.run.RunViewSet.get_included`).
+    """
+
+    duration = serializers.DurationField(read_only=True)
+
+    class Meta:
+        model = Run
+        fields = RUN_FIELDS
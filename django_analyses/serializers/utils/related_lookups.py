@@ -0,0 +1,162 @@
+"""
+Utilities used to derive the *select_related* and *prefetch_related* lookups
+required to serialize a queryset without querying related instances one at a
+time.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, QuerySet
+from rest_framework import serializers
+
+
+def get_model_field(model: Model, name: str):
+    """
+    Returns a model's field by name, or None if it does not exist.
+
+    Parameters
+    ----------
+    model : Model
+        Model class
+    name : str
+        Field name
+
+    Returns
+    -------
+    Field
+        Model field, or None
+    """
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        pass
+
+
+def collect_related_lookups(
+    serializer: serializers.BaseSerializer,
+    model: Model,
+    prefix: str = "",
+    select_related: List[str] = None,
+    prefetch_related: List[str] = None,
+) -> Tuple[List[str], List[str]]:
+    """
+    Collects the lookups required by a serializer's nested serializers.
+    Forward foreign key and one-to-one relations are selected, other
+    relations are prefetched. Relations accessed by method fields may be
+    declared using a *select_related* or *prefetch_related* attribute on the
+    serializer's :class:`Meta` class, and are included only if they exist on
+    the model.
+
+    Parameters
+    ----------
+    serializer : serializers.BaseSerializer
+        Serializer instance
+    model : Model
+        The serializer's model
+    prefix : str, optional
+        Lookup prefix of nested serializers, by default ""
+    select_related : List[str], optional
+        Collected select_related lookups, by default None
+    prefetch_related : List[str], optional
+        Collected prefetch_related lookups, by default None
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        select_related and prefetch_related lookups
+    """
+    select_related = [] if select_related is None else select_related
+    prefetch_related = [] if prefetch_related is None else prefetch_related
+    meta = getattr(serializer, "Meta", None)
+    for name in getattr(meta, "select_related", ()):
+        if get_model_field(model, name) is not None:
+            select_related.append(prefix + name)
+    for name in getattr(meta, "prefetch_related", ()):
+        if get_model_field(model, name) is not None:
+            prefetch_related.append(prefix + name)
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+        many = isinstance(field, serializers.ListSerializer)
+        nested = field.child if many else field
+        if not isinstance(nested, serializers.ModelSerializer):
+            continue
+        name = field.source.split(".")[0]
+        model_field = get_model_field(model, name)
+        if model_field is None or not model_field.is_relation:
+            continue
+        lookup = prefix + name
+        single = model_field.many_to_one or (
+            model_field.one_to_one and model_field.concrete
+        )
+        if single and not many:
+            select_related.append(lookup)
+            collect_related_lookups(
+                nested,
+                model_field.related_model,
+                prefix=lookup + "__",
+                select_related=select_related,
+                prefetch_related=prefetch_related,
+            )
+        else:
+            # Lookups of prefetched relations' nested serializers are
+            # prefetched as well.
+            prefetch_related.append(lookup)
+            nested_select, nested_prefetch = collect_related_lookups(
+                nested, model_field.related_model, prefix=lookup + "__",
+            )
+            prefetch_related += nested_select + nested_prefetch
+    return select_related, prefetch_related
+
+
+@lru_cache(maxsize=None)
+def get_related_lookups(
+    serializer_class: type,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Returns the lookups required to serialize instances of a model
+    serializer's model.
+
+    Parameters
+    ----------
+    serializer_class : type
+        Model serializer class
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], Tuple[str, ...]]
+        select_related and prefetch_related lookups
+    """
+    serializer = serializer_class()
+    select_related, prefetch_related = collect_related_lookups(
+        serializer, serializer_class.Meta.model
+    )
+    return tuple(select_related), tuple(prefetch_related)
+
+
+def apply_related_lookups(
+    queryset: QuerySet, serializer_class: type
+) -> QuerySet:
+    """
+    Applies the lookups required to serialize the queryset's instances with
+    the provided serializer class.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        Queryset to serialize
+    serializer_class : type
+        Model serializer class
+
+    Returns
+    -------
+    QuerySet
+        Queryset with related instances selected or prefetched
+    """
+    select_related, prefetch_related = get_related_lookups(serializer_class)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
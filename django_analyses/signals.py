@@ -8,23 +8,61 @@ References
 .. _Signals:
    https://docs.djangoproject.com/en/3.0/ref/signals/
 """
+from typing import List
 
-import json
-import shutil
-
+from celery.signals import worker_process_init
+from django.conf import settings
+from django.db import transaction
 from django.db.models import Model
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_save,
+)
 from django.dispatch import receiver
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.input.definitions.input_definition import (
+    InputDefinition,
+)
+from django_analyses.models.input.input_specification import (
+    InputSpecification,
+)
+from django_analyses.models.output.definitions.output_definition import (
+    OutputDefinition,
+)
+from django_analyses.models.output.output_specification import (
+    OutputSpecification,
+)
+from django_analyses.models.pipeline.node import Node
+from django_analyses.models.pipeline.pipe import Pipe
+from django_analyses.models.pipeline.pipeline import Pipeline
 from django_analyses.models.run import Run
+from django_analyses.models.run_status_count import RunStatusCount
+from django_analyses.models.utils.definition_cache import definition_cache
+from django_analyses.models.utils.interface_pool import interface_pool
+from django_analyses.models.utils.interface_registry import (
+    interface_registry,
+)
+from django_analyses.models.utils.preview_cache import preview_cache
+from django_analyses.models.utils.run_status import PENDING
+from django_analyses.tasks import render_run_previews
+from django_analyses.utils.execution_plan import invalidate_execution_plans
+from django_analyses.utils.run_cleanup import run_directory_cleanup
+from django_analyses.utils.task_results import (
+    associate_task_results,
+    get_association_mode,
+)
 from django_celery_results.models import TaskResult
 
 
-@receiver(pre_delete, sender=Run)
-def run_pre_delete_receiver(
+@receiver(post_delete, sender=Run)
+def run_post_delete_receiver(
     sender: Model, instance: Run, using, **kwargs
 ) -> None:
     """
-    Remove a Run instance's directory when deleted.
+    Queue the removal of a deleted Run instance's directory once the
+    deletion is committed.
 
     Parameters
     ----------
@@ -33,52 +71,392 @@ def run_pre_delete_receiver(
     instance : Run
         The Run instance
     using : Any
-        pre_delete signal argument
+        post_delete signal argument
     """
+    run_directory_cleanup.add(instance.id, using)
 
-    if instance.path:
-        shutil.rmtree(instance.path)
 
+@receiver(post_save, sender=Run)
+def run_post_save_receiver(
+    sender: Model, instance: Run, created: bool, update_fields=None, **kwargs
+) -> None:
+    """
+    Queue the rendering of a successful run's output previews if
+    *ANALYSIS_PREVIEW_PRERENDER* is set and the preview cache is enabled.
 
-# Managing the association of Run instances with TaskResults
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.run.Run` model
+    instance : Run
+        The Run instance
+    created : bool
+        Whether the instance was created
+    update_fields : frozenset, optional
+        Updated fields, by default None
+    """
+    prerender = getattr(settings, "ANALYSIS_PREVIEW_PRERENDER", False)
+    if not (prerender and preview_cache.enabled):
+        return
+    # Full saves (e.g. associating a run with its task result) are ignored.
+    status_changed = created or "status" in (update_fields or ())
+    if instance.status == "SUCCESS" and status_changed:
+        transaction.on_commit(
+            lambda: render_run_previews.delay(instance.id)
+        )
+
+
+# Invalidating cached specification definitions
+
+M2M_CHANGE_ACTIONS = "post_add", "post_remove", "post_clear"
+
+
+@receiver([post_save, post_delete], sender=InputSpecification)
+@receiver([post_save, post_delete], sender=OutputSpecification)
+def specification_change_receiver(
+    sender: Model, instance: Model, **kwargs
+) -> None:
+    """
+    Invalidate a specification's cached definitions when it is saved or
+    deleted.
+
+    Parameters
+    ----------
+    sender : Model
+        The specification model
+    instance : Model
+        The specification instance
+    """
+    definition_cache.invalidate(sender, instance.pk)
 
-STARMAP = "celery.starmap"
 
+def definition_change_receiver(
+    sender: Model, instance: Model, **kwargs
+) -> None:
+    """
+    Invalidate the cached definitions of all input or output specifications
+    (as well as any compiled pipeline execution plans) when a definition is
+    saved or deleted. Definitions are sent by their concrete subclass, so the
+    receiver is registered for each definition model (see
+    :func:`get_definition_models`).
 
-def associate_run_with_task(run_id: int, task_result: TaskResult) -> None:
-    run = Run.objects.get(id=run_id)
-    if run.task_result != task_result:
-        run.task_result = task_result
-        run.save()
+    Parameters
+    ----------
+    sender : Model
+        The saved or deleted definition model
+    instance : Model
+        The saved or deleted instance
+    """
+    if issubclass(sender, InputDefinition):
+        definition_cache.invalidate(InputSpecification)
+    else:
+        definition_cache.invalidate(OutputSpecification)
+    invalidate_execution_plans()
 
 
-def handle_node_execution_end(task_result: TaskResult, created: bool) -> None:
-    run_ids = json.loads(task_result.result)
-    if task_result.status == "SUCCESS" and run_ids:
-        if isinstance(run_ids, int):
-            associate_run_with_task(run_ids, task_result)
-        # if isinstance(run_ids, str):
-        #     associate_run_with_task(int(run_ids), task_result)
-        # else:
-        #     for run_id in run_ids:
-        #         associate_run_with_task(run_id, task_result)
+def get_definition_models(model: type) -> List[type]:
+    """
+    Returns the provided definition model along with all of its (direct and
+    indirect) subclasses.
 
+    Parameters
+    ----------
+    model : type
+        Base definition model
+
+    Returns
+    -------
+    List[type]
+        Definition models
+    """
+    models = [model]
+    for subclass in model.__subclasses__():
+        models += get_definition_models(subclass)
+    return models
 
-POST_TASK_RESULT_HANDLERS = {
-    "django_analyses.node-execution": handle_node_execution_end
-}
+
+for definition_model in get_definition_models(
+    InputDefinition
+) + get_definition_models(OutputDefinition):
+    post_save.connect(definition_change_receiver, sender=definition_model)
+    post_delete.connect(definition_change_receiver, sender=definition_model)
+
+
+@receiver(
+    m2m_changed, sender=InputSpecification.base_input_definitions.through
+)
+@receiver(
+    m2m_changed, sender=OutputSpecification.base_output_definitions.through
+)
+def specification_definitions_change_receiver(
+    sender: Model, instance: Model, action: str, reverse: bool, **kwargs
+) -> None:
+    """
+    Invalidate cached definitions when definitions are added to or removed
+    from a specification.
+
+    Parameters
+    ----------
+    sender : Model
+        The intermediate model of the changed relation
+    instance : Model
+        The specification (or definition, if *reverse* is True) instance
+    action : str
+        The type of update done on the relation
+    reverse : bool
+        Whether the relation was modified from the definition side
+    """
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    if reverse:
+        specification_model = (
+            InputSpecification
+            if isinstance(instance, InputDefinition)
+            else OutputSpecification
+        )
+        definition_cache.invalidate(specification_model)
+    else:
+        definition_cache.invalidate(type(instance), instance.pk)
+
+
+# Invalidating compiled pipeline execution plans
+
+
+@receiver([post_save, post_delete], sender=Pipe)
+def pipe_change_receiver(sender: Model, instance: Pipe, **kwargs) -> None:
+    """
+    Invalidate a pipeline's execution plan when one of its pipes is saved or
+    deleted.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.pipeline.pipe.Pipe` model
+    instance : Pipe
+        The Pipe instance
+    """
+    invalidate_execution_plans(instance.pipeline_id)
+
+
+@receiver(post_delete, sender=Pipeline)
+def pipeline_delete_receiver(
+    sender: Model, instance: Pipeline, **kwargs
+) -> None:
+    """
+    Remove a deleted pipeline's execution plan.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.pipeline.pipeline.Pipeline` model
+    instance : Pipeline
+        The Pipeline instance
+    """
+    invalidate_execution_plans(instance.id)
+
+
+@receiver([post_save, post_delete], sender=Node)
+@receiver([post_save, post_delete], sender=AnalysisVersion)
+def node_change_receiver(sender: Model, instance: Model, **kwargs) -> None:
+    """
+    Invalidate all execution plans when a node or an analysis version is
+    saved or deleted, as both may be shared between pipelines.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.pipeline.node.Node` or
+        :class:`~django_analyses.models.analysis_version.AnalysisVersion`
+        model
+    instance : Model
+        The saved or deleted instance
+    """
+    invalidate_execution_plans()
+
+
+@receiver([post_save, post_delete], sender=AnalysisVersion)
+def analysis_version_change_receiver(
+    sender: Model, instance: AnalysisVersion, **kwargs
+) -> None:
+    """
+    Discard an analysis version's pooled interface instances when it is saved
+    or deleted.
+
+    Parameters
+    ----------
+    sender : Model
+        The
+        :class:`~django_analyses.models.analysis_version.AnalysisVersion`
+        model
+    instance : AnalysisVersion
+        The AnalysisVersion instance
+    """
+    interface_pool.clear(instance.pk)
+
+
+# Maintaining run status counters
+
+#: Name of the instance attribute holding the counted analysis version ID,
+#: status and duration of a run.
+COUNTED_STATUS_ATTRIBUTE = "_counted_status"
+
+#: Counted state of runs that are not counted.
+NOT_COUNTED = (None, None, None)
+
+
+def get_counted_status(instance: Run) -> tuple:
+    """
+    Returns a run's analysis version ID, status (runs with no status are
+    counted as :data:`~django_analyses.models.utils.run_status.PENDING`) and
+    duration in seconds (if both its start and end time are set), without
+    loading deferred fields.
+
+    Parameters
+    ----------
+    instance : Run
+        The Run instance
+
+    Returns
+    -------
+    tuple
+        Analysis version ID, status and duration
+    """
+    fields = instance.__dict__
+    if "status" not in fields:
+        return NOT_COUNTED
+    start_time, end_time = fields.get("start_time"), fields.get("end_time")
+    duration = None
+    if start_time and end_time:
+        duration = (end_time - start_time).total_seconds()
+    return (
+        fields.get("analysis_version_id"),
+        fields["status"] or PENDING,
+        duration,
+    )
+
+
+def update_status_count(counted_status: tuple, delta: int) -> None:
+    """
+    Updates a run status counter if the analysis version and status are
+    set.
+
+    Parameters
+    ----------
+    counted_status : tuple
+        Analysis version ID, status and duration
+    delta : int
+        Counter change
+    """
+    analysis_version_id, status, duration = counted_status
+    if analysis_version_id is not None and status:
+        RunStatusCount.objects.increment(
+            analysis_version_id, status, delta, duration=duration
+        )
+
+
+@receiver(post_init, sender=Run)
+def run_post_init_receiver(sender: Model, instance: Run, **kwargs) -> None:
+    """
+    Record a loaded run's status and duration, so that its previous counters
+    may be decremented if they are changed. Skipped when counters are
+    disabled, as runs are initialized in bulk by most queries.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.run.Run` model
+    instance : Run
+        The Run instance
+    """
+    if RunStatusCount.objects.enabled:
+        counted_status = get_counted_status(instance)
+        instance.__dict__[COUNTED_STATUS_ATTRIBUTE] = counted_status
+
+
+@receiver(post_save, sender=Run)
+def run_status_count_post_save_receiver(
+    sender: Model, instance: Run, created: bool, **kwargs
+) -> None:
+    """
+    Update run status counters when a run is created or its status or
+    duration is changed, if *ANALYSIS_RUN_STATUS_COUNTERS* is set.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.run.Run` model
+    instance : Run
+        The Run instance
+    created : bool
+        Whether the instance was created
+    """
+    if not RunStatusCount.objects.enabled:
+        return
+    previous = NOT_COUNTED
+    if not created:
+        previous = instance.__dict__.get(COUNTED_STATUS_ATTRIBUTE, previous)
+    current = get_counted_status(instance)
+    if current != previous:
+        update_status_count(previous, -1)
+        update_status_count(current, 1)
+        instance.__dict__[COUNTED_STATUS_ATTRIBUTE] = current
+
+
+@receiver(post_delete, sender=Run)
+def run_status_count_post_delete_receiver(
+    sender: Model, instance: Run, **kwargs
+) -> None:
+    """
+    Decrement a deleted run's status counter, if
+    *ANALYSIS_RUN_STATUS_COUNTERS* is set.
+
+    Parameters
+    ----------
+    sender : Model
+        The :class:`~django_analyses.models.run.Run` model
+    instance : Run
+        The Run instance
+    """
+    if RunStatusCount.objects.enabled:
+        counted = instance.__dict__.get(COUNTED_STATUS_ATTRIBUTE, NOT_COUNTED)
+        update_status_count(counted, -1)
+
+
+# Managing the association of Run instances with TaskResults
 
 
 @receiver(post_save, sender=TaskResult)
 def task_result_post_save_receiver(
     sender: Model, instance: TaskResult, created: bool, **kwargs
 ) -> None:
-    handler = POST_TASK_RESULT_HANDLERS.get(instance.task_name)
-    if handler:
-        handler(instance, created)
+    """
+    Associate the runs returned by a run executing task (including chunks
+    executed by *celery.starmap*) with its result, unless associations are
+    deferred to :func:`~django_analyses.tasks.associate_task_results_task`.
+
+    Parameters
+    ----------
+    sender : Model
+        The
+        :class:`~django_celery_results.models.task_result.TaskResult` model
+    instance : TaskResult
+        The TaskResult instance
+    created : bool
+        Whether the instance was created
+    """
+    if get_association_mode() == "immediate":
+        associate_task_results([instance])
 
 
-# TODO: Fix for STARMAP tasks (group/chunk) so that the handler will iterate
-# the results. This is currently difficult because task_kwargs returns as a
-# string and it's hard to infer the task's name and therefore to match a
-# handler.
+# Warming up the interface registry
+
+
+@worker_process_init.connect
+def worker_process_init_receiver(**kwargs) -> None:
+    """
+    Resolve all registered analysis interfaces when a Celery worker process
+    starts, if *ANALYSIS_INTERFACE_WARMUP* is set, so that interface imports
+    do not delay the process's first executions.
+    """
+    if getattr(settings, "ANALYSIS_INTERFACE_WARMUP", False):
+        interface_registry.warm()
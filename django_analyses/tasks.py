@@ -1,15 +1,35 @@
 """
 Base tasks provided by *django_analyses*.
 """
-import math
-from typing import List, Union
+from typing import Dict, List, Union
 
 from celery import group, shared_task
 
-from django_analyses.messages import RUN_EXECUTION_FAILURE
+from django_analyses.messages import (
+    BATCH_EXECUTION_FAILURE,
+    RUN_EXECUTION_FAILURE,
+)
 from django_analyses.models.pipeline.node import Node
 from django_analyses.models.pipeline.pipeline import Pipeline
-from django_analyses.pipeline_runner import PipelineRunner
+from django_analyses.models.run import Run
+from django_analyses.models.utils.html_repr import (
+    get_preview_paths,
+    html_repr,
+)
+from django_analyses.utils.run_cleanup import remove_run_directories
+from django_analyses.utils.task_results import (
+    DEFAULT_ASSOCIATION_BATCH_SIZE,
+    associate_task_results,
+    get_association_mark,
+    get_next_association_mark,
+    get_unassociated_task_results,
+    set_association_mark,
+)
+from django_analyses.pipeline_runner import (
+    PipelineRunner,
+    merge_execution_states,
+    run_pipeline_step,
+)
 
 
 @shared_task(bind=True, name="django_analyses.node-execution")
@@ -54,26 +74,296 @@ def execute_node(
             # This causes an exception (task_id is null):
             # self.update_state(state=states.FAILURE, meta=message)
     else:
-        # If a list of input dictionaries is provided, run in parallel.
-        max_parallel = node.analysis_version.max_parallel
-        try:
-            # Calculate the number of chunks according to the analysis
-            # version's *max_parallel* attribute.
-            n_chunks = math.ceil(len(inputs) / max_parallel)
-        except ZeroDivisionError:
-            # If `max_parallel` is set to 0, run all in parallel.
+        # If a list of input dictionaries is provided, run in parallel
+        # batches sized according to the analysis version's *batch_size*
+        # (or *max_parallel*) attribute.
+        batch_size = node.analysis_version.get_batch_size(len(inputs))
+        if batch_size == 1:
             return group(
-                execute_node.s(node_id, input_dict) for input_dict in inputs
+                execute_node.s(node_id, input_dict, autoretry)
+                for input_dict in inputs
             )()
-        else:
-            # Create the inputs for each separate execution and run in chunks.
-            inputs = ((node_id, input_dict) for input_dict in inputs)
-            return execute_node.chunks(inputs, n_chunks)()
+        batches = (
+            inputs[start:start + batch_size]
+            for start in range(0, len(inputs), batch_size)
+        )
+        return group(
+            execute_node_batch.s(node_id, batch, autoretry)
+            for batch in batches
+        )()
 
 
-@shared_task(name="django_analyses.pipeline-execution")
-def execute_pipeline(pipeline_id: int, inputs: dict):
+@shared_task(bind=True, name="django_analyses.node-batch-execution")
+def execute_node_batch(
+    self, node_id: int, inputs: List[dict], autoretry: bool = False
+) -> Dict[str, list]:
+    """
+    Execute a :class:`~django_analyses.models.pipeline.node.Node` with a
+    batch of inputs within a single task, reusing the node's definitions and
+    (if a reset method is configured) interface instances with identical
+    initialization parameters across the batch. Failed executions are
+    reported in the returned result, and the task itself only fails if none
+    of the executions succeeded.
+
+    Parameters
+    ----------
+    node_id : int
+        The Node instance ID to execute
+    inputs : List[dict]
+        Input dictionaries to pass the node
+    autoretry : bool, optional
+        Whether to rerun existing failed runs, by default False
+
+    Returns
+    -------
+    Dict[str, list]
+        The created or existing :class:`~django_analyses.models.run.Run`
+        instance IDs (*run_ids*) and the failure messages of any failed
+        executions (*failures*)
+
+    Raises
+    ------
+    RuntimeError
+        All of the executions failed
+    """
+    node = Node.objects.select_related(
+        "analysis_version__input_specification",
+        "analysis_version__output_specification",
+    ).get(id=node_id)
+    run_ids = []
+    failures = []
+    with node.analysis_version.reuse_interface_instances():
+        for input_dict in inputs:
+            try:
+                run = node.run(inputs=input_dict)
+                if run.status == "FAILURE" and autoretry:
+                    run.delete()
+                    run = node.run(inputs=input_dict)
+            except Exception as e:
+                failures.append(str(e))
+                continue
+            if run.status == "FAILURE":
+                failures.append(RUN_EXECUTION_FAILURE.format(run=run))
+            else:
+                run_ids.append(run.id)
+    # Partially failed batches succeed so that the IDs of the successful runs
+    # are kept in the task's result.
+    if failures and not run_ids:
+        message = BATCH_EXECUTION_FAILURE.format(
+            n_failed=len(failures),
+            n_inputs=len(inputs),
+            node_id=node_id,
+            failures="\n".join(failures),
+        )
+        raise RuntimeError(message)
+    return {"run_ids": run_ids, "failures": failures}
+
+
+@shared_task(name="django_analyses.pipeline-step-execution")
+def execute_pipeline_step(node_id: int, inputs: dict) -> int:
+    """
+    Execute a single step of a pipeline executed by
+    :meth:`~django_analyses.pipeline_runner.PipelineRunner.run_concurrently`.
+
+    Parameters
+    ----------
+    node_id : int
+        The Node instance ID to execute
+    inputs : dict
+        Inputs to pass the node
+
+    Returns
+    -------
+    int
+        The resulting :class:`~django_analyses.models.run.Run` instance ID
+    """
+    return run_pipeline_step(node_id, inputs)
+
+
+@shared_task(name="django_analyses.pipeline-node-execution")
+def execute_pipeline_node(
+    previous: Union[None, dict, List[dict]] = None,
+    *,
+    pipeline_id: int,
+    node_id: int,
+    run_index: int,
+    inputs: dict,
+) -> dict:
+    """
+    Execute a single node run as part of a pipeline compiled into a Celery
+    canvas (see
+    :meth:`~django_analyses.pipeline_runner.PipelineRunner.get_canvas`).
+
+    Parameters
+    ----------
+    previous : Union[None, dict, List[dict]], optional
+        Execution state/s returned by the preceding tasks, by default None
+    pipeline_id : int
+        The executed Pipeline instance ID
+    node_id : int
+        The Node instance ID to execute
+    run_index : int
+        The index of the node's run within the pipeline
+    inputs : dict
+        User provided inputs to pass the node
+
+    Returns
+    -------
+    dict
+        Updated execution state
+    """
+    pipeline = Pipeline.objects.get(id=pipeline_id)
+    runner = PipelineRunner(pipeline=pipeline, quiet=True)
+    state = merge_execution_states(previous)
+    return runner.run_step(state, node_id, run_index, inputs)
+
+
+@shared_task(name="django_analyses.pipeline-execution-finalization")
+def finalize_pipeline_execution(
+    previous: Union[dict, List[dict]], *, pipeline_id: int
+) -> dict:
+    """
+    Collect the results of a pipeline compiled into a Celery canvas.
+
+    Parameters
+    ----------
+    previous : Union[dict, List[dict]]
+        Execution state/s returned by the last level of the canvas
+    pipeline_id : int
+        The executed Pipeline instance ID
+
+    Returns
+    -------
+    dict
+        Results dictionary with node IDs as keys a list of result
+        dictionaries for each run of that node
+    """
+    pipeline = Pipeline.objects.get(id=pipeline_id)
+    runner = PipelineRunner(pipeline=pipeline, quiet=True)
+    state = merge_execution_states(previous)
+    return runner.collect_results(state)
+
+
+@shared_task(bind=True, name="django_analyses.pipeline-execution")
+def execute_pipeline(
+    self, pipeline_id: int, inputs: dict, canvas: bool = False
+):
+    """
+    Execute a :class:`~django_analyses.models.pipeline.pipeline.Pipeline`.
+
+    Parameters
+    ----------
+    pipeline_id : int
+        The Pipeline instance ID to execute
+    inputs : dict
+        Inputs to pass the pipeline
+    canvas : bool, optional
+        Whether to replace this task with a Celery canvas executing each node
+        run as a separate task, rather than executing the entire pipeline
+        within this task, by default False
+
+    Returns
+    -------
+    dict
+        Results dictionary with node IDs as keys a list of result
+        dictionaries for each run of that node
+    """
     pipeline = Pipeline.objects.get(id=pipeline_id)
     runner = PipelineRunner(pipeline=pipeline)
+    if canvas:
+        raise self.replace(runner.get_canvas(inputs))
     runner.run(inputs=inputs)
     return runner.get_safe_results()
+
+
+@shared_task(name="django_analyses.preview-rendering")
+def render_run_previews(run_id: int) -> int:
+    """
+    Render the previews of a :class:`~django_analyses.models.run.Run`
+    instance's file outputs in advance, so that they are served from the
+    preview cache when first requested.
+
+    Parameters
+    ----------
+    run_id : int
+        The Run instance ID
+
+    Returns
+    -------
+    int
+        Number of rendered previews
+    """
+    run = Run.objects.with_io().get(id=run_id)
+    paths = [
+        path
+        for output in run.get_outputs()
+        if hasattr(output, "_repr_html_")
+        for path in get_preview_paths(output.value)
+    ]
+    for path in paths:
+        html_repr(path)
+    return len(paths)
+
+
+@shared_task(name="django_analyses.run-directory-removal")
+def remove_run_directories_task(run_ids: List[int]) -> int:
+    """
+    Remove the directories of deleted :class:`~django_analyses.models.run.Run`
+    instances.
+
+    Parameters
+    ----------
+    run_ids : List[int]
+        Deleted Run instance IDs
+
+    Returns
+    -------
+    int
+        Number of removed directories
+    """
+    return remove_run_directories(run_ids)
+
+
+@shared_task(name="django_analyses.task-result-association")
+def associate_task_results_task(
+    batch_size: int = DEFAULT_ASSOCIATION_BATCH_SIZE,
+) -> int:
+    """
+    Associate :class:`~django_analyses.models.run.Run` instances with the
+    results of the tasks that executed them, if not already associated.
+    Meant to be scheduled periodically when *ANALYSIS_TASK_RESULT_ASSOCIATION*
+    is set to "deferred", and may also be used to associate the runs of
+    chunks executed before they were supported. Only task results newer than
+    the last processed one (see
+    :func:`~django_analyses.utils.task_results.get_association_mark`) are
+    scanned.
+
+    Parameters
+    ----------
+    batch_size : int, optional
+        Number of task results read and runs updated at a time, by default
+        1000
+
+    Returns
+    -------
+    int
+        Number of updated runs
+    """
+    mark = get_association_mark()
+    finished = True
+    n_updated = 0
+    last_id = mark
+    while True:
+        task_results = get_unassociated_task_results(after=last_id)
+        batch = list(task_results[:batch_size])
+        if not batch:
+            break
+        n_updated += associate_task_results(batch, batch_size=batch_size)
+        # Only advance the mark up to the first unfinished task result, as
+        # it may still complete successfully.
+        if finished:
+            mark = get_next_association_mark(batch, mark)
+            finished = mark == batch[-1].id
+        last_id = batch[-1].id
+    set_association_mark(mark)
+    return n_updated
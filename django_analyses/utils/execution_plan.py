@@ -0,0 +1,499 @@
+"""
+Definition of the :class:`ExecutionPlan` class, an in-memory representation
+of a :class:`~django_analyses.models.pipeline.pipeline.Pipeline` compiled for
+execution.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Set, Tuple
+
+from django.conf import settings
+from django.db.models import F
+from django_analyses.models.input.definitions.input_definition import (
+    InputDefinition,
+)
+from django_analyses.models.output.definitions.output_definition import (
+    OutputDefinition,
+)
+from django_analyses.models.pipeline.node import Node
+from django_analyses.models.pipeline.pipe import Pipe
+from django_analyses.utils.messages import CYCLIC_PIPELINE, UNKNOWN_NODE
+
+#: A single execution of a node within a pipeline, i.e. a (node, run index)
+#: pair.
+Step = Tuple[Node, int]
+
+
+class ExecutionPlan:
+    """
+    Compiles a pipeline's pipes into a topologically sorted sequence of
+    (node, run index) steps, along with each step's incoming pipes and the
+    resolved source and destination ports.
+
+    All pipes, nodes and port definitions are queried once on
+    initialization. Plans are cached per pipeline by
+    :func:`get_execution_plan` (see its notes on the scope of the cache).
+    """
+
+    def __init__(self, pipeline):
+        """
+        Compiles the execution plan of the provided pipeline.
+
+        Parameters
+        ----------
+        pipeline : ~django_analyses.models.pipeline.pipeline.Pipeline
+            The pipeline to compile
+
+        Raises
+        ------
+        ValueError
+            The pipeline contains a cycle
+        """
+
+        self.pipeline_id = pipeline.id
+        pipes = list(
+            Pipe.objects.filter(pipeline_id=pipeline.id)
+            .select_related(
+                "source__analysis_version__input_specification",
+                "destination__analysis_version__input_specification",
+            )
+            .order_by(F("index").asc(nulls_last=True), "id")
+        )
+        self.nodes = self.collect_nodes(pipes)
+        self.source_ports = {
+            definition.id: definition
+            for definition in OutputDefinition.objects.select_subclasses()
+            .filter(id__in={pipe.base_source_port_id for pipe in pipes})
+        }
+        self.destination_ports = {
+            definition.id: definition
+            for definition in InputDefinition.objects.select_subclasses()
+            .filter(id__in={pipe.base_destination_port_id for pipe in pipes})
+        }
+        self.run_counts = defaultdict(int)
+        self.incoming_pipes = defaultdict(list)
+        self.outgoing_pipes = defaultdict(list)
+        for pipe in pipes:
+            # Share a single instance of each node between all pipes.
+            pipe.source = self.nodes[pipe.source_id]
+            pipe.destination = self.nodes[pipe.destination_id]
+            self.run_counts[pipe.source] = max(
+                self.run_counts[pipe.source], pipe.source_run_index + 1
+            )
+            self.run_counts[pipe.destination] = max(
+                self.run_counts[pipe.destination],
+                pipe.destination_run_index + 1,
+            )
+            step = pipe.destination, pipe.destination_run_index
+            self.incoming_pipes[step].append(pipe)
+            source_step = pipe.source, pipe.source_run_index
+            self.outgoing_pipes[source_step].append(pipe)
+        self.steps = self.sort_steps()
+
+    def collect_nodes(self, pipes: List[Pipe]) -> Dict[int, Node]:
+        """
+        Returns the pipeline's nodes by ID, ordered by ID.
+
+        Parameters
+        ----------
+        pipes : List[Pipe]
+            The pipeline's pipes
+
+        Returns
+        -------
+        Dict[int, Node]
+            Pipeline nodes by ID
+        """
+
+        nodes = {}
+        for pipe in pipes:
+            nodes.setdefault(pipe.source_id, pipe.source)
+            nodes.setdefault(pipe.destination_id, pipe.destination)
+        return {node_id: nodes[node_id] for node_id in sorted(nodes)}
+
+    def get_dependencies(self, node: Node, run_index: int) -> Set[Step]:
+        """
+        Returns the steps that must be executed before the provided step.
+        Apart from the sources of the step's incoming pipes, any previous run
+        of the same node is also required, so that runs are created in order.
+
+        Parameters
+        ----------
+        node : Node
+            Node to evaluate
+        run_index : int
+            The index of the node's run
+
+        Returns
+        -------
+        Set[Step]
+            Required steps
+        """
+
+        dependencies = self.get_required_steps(node, run_index)
+        if run_index > 0:
+            dependencies.add((node, run_index - 1))
+        return dependencies
+
+    def sort_steps(self) -> List[Step]:
+        """
+        Topologically sorts all (node, run index) pairs of the pipeline.
+        Independent steps are ordered by run index and node ID.
+
+        Returns
+        -------
+        List[Step]
+            Sorted steps
+
+        Raises
+        ------
+        ValueError
+            The pipeline contains a cycle
+        """
+
+        steps = sorted(
+            (
+                (node, run_index)
+                for node in self.nodes.values()
+                for run_index in range(self.run_counts[node])
+            ),
+            key=lambda step: (step[1], step[0].id),
+        )
+        dependencies = {step: self.get_dependencies(*step) for step in steps}
+        dependents = defaultdict(list)
+        for step, required in dependencies.items():
+            for required_step in required:
+                dependents[required_step].append(step)
+        remaining = {
+            step: len(required) for step, required in dependencies.items()
+        }
+        ready = deque(step for step in steps if not remaining[step])
+        ordered = []
+        while ready:
+            step = ready.popleft()
+            ordered.append(step)
+            for dependent in dependents[step]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+        if len(ordered) != len(steps):
+            blocked = [
+                f"{node.id}#{run_index}"
+                for node, run_index in steps
+                if remaining[(node, run_index)]
+            ]
+            message = CYCLIC_PIPELINE.format(
+                pipeline_id=self.pipeline_id, steps=", ".join(blocked)
+            )
+            raise ValueError(message)
+        return ordered
+
+    def get_branches(self) -> List[List[Step]]:
+        """
+        Groups the sorted steps into independent branches, i.e. sets of
+        steps that neither depend on nor are required by steps of other
+        branches.
+
+        Returns
+        -------
+        List[List[Step]]
+            Sorted steps grouped by branch, ordered by their first step
+        """
+
+        # Steps are sorted, so each step's dependencies were already
+        # assigned a branch, and branches joined by the step are merged.
+        branch_ids = {}
+        branches = {}
+        for index, step in enumerate(self.steps):
+            dependencies = self.get_dependencies(*step)
+            joined = {branch_ids[dependency] for dependency in dependencies}
+            branch_id = min(joined, default=index)
+            branch = branches.setdefault(branch_id, [])
+            for other_id in joined - {branch_id}:
+                for other_step in branches.pop(other_id):
+                    branch_ids[other_step] = branch_id
+                    branch.append(other_step)
+            branch.append(step)
+            branch_ids[step] = branch_id
+        order = {step: index for index, step in enumerate(self.steps)}
+        return [
+            sorted(branch, key=order.get)
+            for _, branch in sorted(branches.items())
+        ]
+
+    def get_levels(self, steps: List[Step] = None) -> List[List[Step]]:
+        """
+        Groups the sorted steps into levels, such that each step only depends
+        on steps in preceding levels. Steps within a level may be executed
+        concurrently.
+
+        Parameters
+        ----------
+        steps : List[Step], optional
+            Sorted steps to group, which must include all of their
+            dependencies (e.g. a branch returned by :meth:`get_branches`),
+            by default None (all steps)
+
+        Returns
+        -------
+        List[List[Step]]
+            Steps grouped by level
+        """
+
+        step_levels = {}
+        levels = []
+        for step in self.steps if steps is None else steps:
+            dependencies = self.get_dependencies(*step)
+            level = 1 + max(
+                (step_levels[dependency] for dependency in dependencies),
+                default=-1,
+            )
+            step_levels[step] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(step)
+        return levels
+
+    def get_node(self, node_id: int) -> Node:
+        """
+        Returns the pipeline's node with the provided ID.
+
+        Parameters
+        ----------
+        node_id : int
+            Node ID
+
+        Returns
+        -------
+        Node
+            Pipeline node
+
+        Raises
+        ------
+        Node.DoesNotExist
+            No such node in this pipeline
+        """
+
+        try:
+            return self.nodes[node_id]
+        except KeyError:
+            message = UNKNOWN_NODE.format(
+                node_id=node_id, pipeline_id=self.pipeline_id
+            )
+            raise Node.DoesNotExist(message)
+
+    def get_incoming_pipes(self, node: Node, run_index: int) -> List[Pipe]:
+        """
+        Returns the pipes leading to the provided step, ordered by their
+        :attr:`~django_analyses.models.pipeline.pipe.Pipe.index`.
+
+        Parameters
+        ----------
+        node : Node
+            Destination node
+        run_index : int
+            The index of the destination node's run
+
+        Returns
+        -------
+        List[Pipe]
+            Incoming pipes
+        """
+
+        return self.incoming_pipes.get((node, run_index), [])
+
+    def get_required_steps(self, node: Node, run_index: int) -> Set[Step]:
+        """
+        Returns the steps generating outputs piped to the provided step.
+
+        Parameters
+        ----------
+        node : Node
+            Destination node
+        run_index : int
+            The index of the destination node's run
+
+        Returns
+        -------
+        Set[Step]
+            Source steps
+        """
+
+        return {
+            (pipe.source, pipe.source_run_index)
+            for pipe in self.get_incoming_pipes(node, run_index)
+        }
+
+    def get_dependent_steps(self, node: Node, run_index: int) -> Set[Step]:
+        """
+        Returns the steps receiving outputs piped from the provided step.
+
+        Parameters
+        ----------
+        node : Node
+            Source node
+        run_index : int
+            The index of the source node's run
+
+        Returns
+        -------
+        Set[Step]
+            Destination steps
+        """
+
+        return {
+            (pipe.destination, pipe.destination_run_index)
+            for pipe in self.outgoing_pipes.get((node, run_index), [])
+        }
+
+    def get_source_port(self, pipe: Pipe) -> OutputDefinition:
+        """
+        Returns the resolved output definition subclass of a pipe's source
+        port.
+
+        Parameters
+        ----------
+        pipe : Pipe
+            Pipeline pipe
+
+        Returns
+        -------
+        OutputDefinition
+            Source port
+        """
+
+        return self.source_ports[pipe.base_source_port_id]
+
+    def get_destination_port(self, pipe: Pipe) -> InputDefinition:
+        """
+        Returns the resolved input definition subclass of a pipe's
+        destination port.
+
+        Parameters
+        ----------
+        pipe : Pipe
+            Pipeline pipe
+
+        Returns
+        -------
+        InputDefinition
+            Destination port
+        """
+
+        return self.destination_ports[pipe.base_destination_port_id]
+
+    def count_node_runs(self, node: Node) -> int:
+        """
+        Returns the number of times a particular node is meant to run during
+        the execution of the pipeline.
+
+        Parameters
+        ----------
+        node : Node
+            Node to count
+
+        Returns
+        -------
+        int
+            Number of separate runs of *node* within the pipeline
+        """
+
+        return self.run_counts.get(node, 0)
+
+    @property
+    def entry_nodes(self) -> List[Node]:
+        """
+        Returns the "entry" nodes of the pipeline, i.e. nodes whose first run
+        has no incoming pipes.
+
+        Returns
+        -------
+        List[Node]
+            Entry nodes
+        """
+
+        return [
+            node
+            for node in self.nodes.values()
+            if (node, 0) not in self.incoming_pipes
+        ]
+
+
+#: Default number of seconds cached execution plans are reused for (see
+#: *ANALYSIS_EXECUTION_PLAN_TTL*).
+EXECUTION_PLAN_TTL = 60
+
+_execution_plans = {}
+_execution_plans_generation = 0
+_execution_plans_lock = threading.Lock()
+
+
+def get_execution_plan_ttl() -> float:
+    """
+    Returns the number of seconds cached execution plans are reused for, as
+    set by *ANALYSIS_EXECUTION_PLAN_TTL* (None disables expiry).
+
+    Returns
+    -------
+    float
+        Execution plan time-to-live
+    """
+    return getattr(settings, "ANALYSIS_EXECUTION_PLAN_TTL", EXECUTION_PLAN_TTL)
+
+
+def get_execution_plan(pipeline) -> ExecutionPlan:
+    """
+    Returns the cached execution plan of the provided pipeline, compiling it
+    if required.
+
+    Notes
+    -----
+    Plans are cached per process. Local changes to pipes, nodes, analysis
+    versions and definitions invalidate them immediately (see
+    :mod:`django_analyses.signals`), but changes made by other processes
+    (e.g. by the web server while Celery workers run pipelines) are only
+    picked up once a plan expires, i.e. after
+    *ANALYSIS_EXECUTION_PLAN_TTL* seconds (60 by default).
+
+    Parameters
+    ----------
+    pipeline : ~django_analyses.models.pipeline.pipeline.Pipeline
+        The pipeline to compile
+
+    Returns
+    -------
+    ExecutionPlan
+        The pipeline's execution plan
+    """
+
+    ttl = get_execution_plan_ttl()
+    now = time.monotonic()
+    plan, compiled = _execution_plans.get(pipeline.id, (None, None))
+    if plan is None or (ttl is not None and now - compiled >= ttl):
+        generation = _execution_plans_generation
+        plan = ExecutionPlan(pipeline)
+        with _execution_plans_lock:
+            # Avoid storing plans that were invalidated while compiling.
+            if generation == _execution_plans_generation:
+                _execution_plans[pipeline.id] = plan, now
+    return plan
+
+
+def invalidate_execution_plans(pipeline_id: int = None) -> None:
+    """
+    Removes cached execution plans.
+
+    Parameters
+    ----------
+    pipeline_id : int, optional
+        ID of the pipeline to invalidate, by default None (all pipelines)
+    """
+
+    global _execution_plans_generation
+    with _execution_plans_lock:
+        _execution_plans_generation += 1
+        if pipeline_id is None:
+            _execution_plans.clear()
+        else:
+            _execution_plans.pop(pipeline_id, None)
@@ -1,6 +1,7 @@
-from typing import Callable
+from typing import Callable, Union
 
 from django.conf import settings
+from django.utils.module_loading import import_string
 from django_analyses.models.analysis_version import AnalysisVersion
 from django_analyses.utils import messages
 
@@ -9,6 +10,27 @@ def get_visualizers() -> dict:
     return getattr(settings, "ANALYSIS_VISUALIZERS", {})
 
 
+def resolve_visualizer(visualizer: Union[str, Callable]) -> Callable:
+    """
+    Returns a registered visualizer, importing it if registered as a dotted
+    import path (so that visualization dependencies are only loaded when
+    used).
+
+    Parameters
+    ----------
+    visualizer : Union[str, Callable]
+        Visualizer or its dotted import path
+
+    Returns
+    -------
+    Callable
+        Visualizer
+    """
+    if isinstance(visualizer, str):
+        return import_string(visualizer)
+    return visualizer
+
+
 def get_visualizer(
     analysis_version: AnalysisVersion, provider: str = None
 ) -> callable:
@@ -23,19 +45,20 @@ def get_visualizer(
         provider_dict = isinstance(analysis_version_visualizers, dict)
         if provider_dict and provider:
             try:
-                return analysis_version_visualizers[provider]
+                visualizer = analysis_version_visualizers[provider]
             except KeyError:
                 message = messages.UNREGISTERED_VISUALIZATION_PROVIDER.format(
                     provider=provider, analysis_version=analysis_version,
                 )
                 raise NotImplementedError(message)
+            return resolve_visualizer(visualizer)
         elif provider_dict:
             providers = list(analysis_version_visualizers.keys())
             message = messages.MISSING_VISUALIZATION_PROVIDER.format(
                 analysis_version=analysis_version, providers=providers,
             )
-        elif isinstance(analysis_version_visualizers, Callable):
-            return analysis_version_visualizers
+        elif isinstance(analysis_version_visualizers, (str, Callable)):
+            return resolve_visualizer(analysis_version_visualizers)
     message = messages.VISUALIZER_NOT_IMPLEMENTED.format(
         analysis_version=analysis_version
     )
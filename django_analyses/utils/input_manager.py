@@ -2,7 +2,7 @@
 Definition of the :class:`InputManager` class.
 """
 
-from typing import Any, List, Set, Tuple
+from typing import Any, Dict, List, Set, Tuple
 
 from django_analyses.models.input.definitions.directory_input_definition import \
     DirectoryInputDefinition  # noqa: E501
@@ -11,6 +11,7 @@ from django_analyses.models.input.definitions.input_definition import \
 from django_analyses.models.input.definitions.string_input_definition import \
     StringInputDefinition
 from django_analyses.models.input.input import Input
+from django_analyses.models.utils import bulk_create_subclass_instances
 
 BAD_KEY = "Invalid input definition key: {key}"
 
@@ -38,7 +39,11 @@ class InputManager:
 
         self.run = run
         self.raw_configuration = configuration
+        self.input_specification = (
+            self.run.analysis_version.input_specification
+        )
         self.input_definitions = self.run.analysis_version.input_definitions
+        self._input_instances = None
 
     def input_definition_is_a_missing_output_path(
         self, input_definition: InputDefinition
@@ -103,9 +108,10 @@ class InputManager:
             List of missing output path configurations that should be generated
         """
 
+        input_definitions = self.get_input_definitions_by_key().values()
         return [
             input_definition
-            for input_definition in self.input_definitions
+            for input_definition in input_definitions
             if self.input_definition_is_a_missing_output_path(input_definition)
         ]
 
@@ -124,9 +130,10 @@ class InputManager:
             generated
         """
 
+        input_definitions = self.get_input_definitions_by_key().values()
         return [
             input_definition
-            for input_definition in self.input_definitions
+            for input_definition in input_definitions
             if self.input_definition_is_a_missing_output_directory(
                 input_definition
             )
@@ -146,9 +153,10 @@ class InputManager:
             List of missing dynamic_default instances
         """
 
+        input_definitions = self.get_input_definitions_by_key().values()
         return [
             input_definition
-            for input_definition in self.input_definitions
+            for input_definition in input_definitions
             if getattr(input_definition, "dynamic_default", False)
             and input_definition.key not in self.raw_configuration
         ]
@@ -215,7 +223,7 @@ class InputManager:
         """
 
         try:
-            input_definition = self.input_definitions.get(key=key)
+            input_definition = self.input_specification.get_definition(key)
         except InputDefinition.DoesNotExist:
             message = BAD_KEY.format(key=key)
             raise InputDefinition.DoesNotExist(message)
@@ -240,6 +248,77 @@ class InputManager:
             for key, value in self.raw_configuration.items()
         ]
 
+    def get_input_definitions_by_key(self) -> Dict[str, InputDefinition]:
+        """
+        Returns the run's input definitions as a dictionary with their keys as
+        keys.
+
+        Returns
+        -------
+        Dict[str, InputDefinition]
+            Input definitions by key
+        """
+
+        return self.input_specification.get_definitions_by_key()
+
+    def build_input_instances(self) -> List[Input]:
+        """
+        Returns unsaved :class:`~django_analyses.models.input.input.Input`
+        subclass instances for both the user-provided configuration and any
+        missing inputs.
+
+        Returns
+        -------
+        List[Input]
+            Unsaved input instances
+
+        Raises
+        ------
+        InputDefinition.DoesNotExist
+            Invalid input definition key within the input dictionary
+        """
+
+        input_definitions = self.get_input_definitions_by_key()
+        instances = []
+        for key, value in self.raw_configuration.items():
+            try:
+                input_definition = input_definitions[key]
+            except KeyError:
+                message = BAD_KEY.format(key=key)
+                raise InputDefinition.DoesNotExist(message)
+            instance = input_definition.build_input_instance(
+                value=value, run=self.run
+            )
+            instances.append(instance)
+        for input_definition in self.missing_input_definitions:
+            instance = input_definition.build_input_instance(run=self.run)
+            instances.append(instance)
+        return instances
+
+    def bulk_create_input_instances(self) -> List[Input]:
+        """
+        Creates all the :class:`~django_analyses.models.input.input.Input`
+        subclass instances for the provided run using a single insert query
+        per table.
+
+        Returns
+        -------
+        List[Input]
+            Created input instances
+
+        Raises
+        ------
+        ValidationError
+            Invalid input value
+        """
+
+        instances = self.build_input_instances()
+        # Run the same preprocessing and validation as Input.save().
+        for instance in instances:
+            instance.pre_save()
+            instance.validate()
+        return bulk_create_subclass_instances(Input, instances)
+
     def get_all_input_instances(self) -> List[Input]:
         """
         Returns all
@@ -252,7 +331,9 @@ class InputManager:
             Input instances
         """
 
-        return self.raw_input_instances + self.missing_inputs
+        if self._input_instances is None:
+            self._input_instances = self.bulk_create_input_instances()
+        return self._input_instances
 
     def get_required_paths(self) -> List[Input]:
         """
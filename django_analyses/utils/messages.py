@@ -5,6 +5,27 @@ MISSING_ENTRY_POINT_INPUTS = "Provided input dictionary does not satisfy the num
 FAILED_NODE_RUN = "\nFailed to run node #{node_id} ({analysis_version}, execution #{run_index}) with the following exception:\n{exception}\n\nUser provided inputs:\n{user_inputs}\n\nNode inputs:\n{node_inputs}"
 NODE_RUN_START = "\n{analysis_version} (#{run_index})\nInputs:\n{inputs}\n..."
 NODE_RUN_FINISHED = "Outputs:\n{outputs}\n"
+CYCLIC_PIPELINE = "Pipeline #{pipeline_id} contains a cycle and can't be executed!\nBlocked node runs: {steps}"
+BAD_CONCURRENCY_BACKEND = "Invalid concurrency backend '{backend}'! Please choose from: {backends}"
+CELERY_BACKEND_IN_TASK = "The celery concurrency backend waits for the results of other tasks and can't be used from within a Celery task! Please execute a compiled pipeline canvas instead (see PipelineRunner.get_canvas())."
+FAILED_PIPELINE_STEPS = "Pipeline #{pipeline_id} failed to execute the following node runs:\n{failures}"
+SKIPPED_PIPELINE_STEP = "Skipped due to a failure in a required node run."
+UNKNOWN_NODE = "Node #{node_id} is not a part of pipeline #{pipeline_id}!"
+UNKNOWN_OUTPUT_KEYS = "Run #{run_id} returned results with no matching output definition, which will not be saved: {keys}"
+
+# Results export
+BAD_EXPORT_FORMAT = "Invalid export format '{file_format}'! Please choose from: {formats}"
+MISSING_EXPORT_DEPENDENCY = "Parquet and Arrow exports require pyarrow, please install it (pip install django_analyses[export])."
+
+# Run summary
+BAD_SUMMARY_ID = "Invalid {name} ID '{value}'!"
+
+# Run directory cleanup
+BAD_CLEANUP_BACKEND = "Invalid run directory cleanup backend '{backend}'! Please choose from: {backends}"
+
+# Zip streaming
+BAD_COMPRESSION_MODE = "Invalid compression mode '{mode}'! Please choose from: {modes}"
+MISSING_RUN_DIRECTORY = "Run #{run_id} has no output directory!"
 
 # Visualizers
 UNREGISTERED_VISUALIZATION_PROVIDER = (
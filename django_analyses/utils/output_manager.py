@@ -1,16 +1,25 @@
+import logging
+
 from django.core.exceptions import ObjectDoesNotExist
 from django_analyses.models.output.output import Output
+from django_analyses.models.utils import bulk_create_subclass_instances
+from django_analyses.utils.messages import UNKNOWN_OUTPUT_KEYS
+
+_LOGGER = logging.getLogger("analysis_exection")
 
 
 class OutputManager:
     def __init__(self, run, results: dict):
         self.run = run
         self.results = results
+        self.output_specification = (
+            self.run.analysis_version.output_specification
+        )
         self.output_definitions = self.run.analysis_version.output_definitions
 
     def create_output_instance(self, key: str, value) -> Output:
         try:
-            output_definition = self.output_definitions.get(key=key)
+            output_definition = self.output_specification.get_definition(key)
         except ObjectDoesNotExist:
             pass
         else:
@@ -18,9 +27,28 @@ class OutputManager:
                 value=value, run=self.run
             )
 
-    def create_output_instances(self) -> list:
-        output_instances = [
-            self.create_output_instance(key, value)
+    def build_output_instances(self) -> list:
+        output_definitions = self.output_specification.get_definitions_by_key()
+        unknown_keys = [
+            key for key in self.results if key not in output_definitions
+        ]
+        if unknown_keys:
+            message = UNKNOWN_OUTPUT_KEYS.format(
+                run_id=self.run.id, keys=", ".join(unknown_keys)
+            )
+            _LOGGER.warning(message)
+        return [
+            output_definitions[key].build_output_instance(
+                value=value, run=self.run
+            )
             for key, value in self.results.items()
+            if key in output_definitions
         ]
-        return [output for output in output_instances if output is not None]
+
+    def create_output_instances(self) -> list:
+        output_instances = self.build_output_instances()
+        # Run the same preprocessing and validation as Output.save().
+        for output in output_instances:
+            output.pre_save()
+            output.validate()
+        return bulk_create_subclass_instances(Output, output_instances)
@@ -0,0 +1,393 @@
+"""
+Definition of the :class:`ResultsExporter` class, used to export the outputs
+of many runs as a wide table (one row per run and one column per output
+definition key).
+"""
+import csv
+import io
+import json
+from typing import IO, Any, Dict, Iterator, List
+
+from django.db import models
+from django_analyses.models.input.utils import ListElementTypes
+from django_analyses.models.output.definitions.list_output_definition import (
+    ListOutputDefinition,
+)
+from django_analyses.models.output.definitions.output_definition import (
+    OutputDefinition,
+)
+from django_analyses.utils.messages import (
+    BAD_EXPORT_FORMAT,
+    MISSING_EXPORT_DEPENDENCY,
+)
+
+#: Supported export file formats.
+EXPORT_FORMATS = "csv", "parquet", "arrow"
+
+#: Default number of runs read and written at a time.
+DEFAULT_CHUNK_SIZE = 1000
+
+#: Name of the run ID column.
+RUN_ID_COLUMN = "run_id"
+
+#: Arrow type names by output value field type.
+ARROW_FIELD_TYPES = {
+    "BigIntegerField": "int64",
+    "BooleanField": "bool_",
+    "FloatField": "float64",
+    "ForeignKey": "int64",
+    "IntegerField": "int64",
+    "PositiveIntegerField": "int64",
+}
+
+#: Arrow type names by list output element type.
+ARROW_ELEMENT_TYPES = {
+    ListElementTypes.BLN.name: "bool_",
+    ListElementTypes.INT.name: "int64",
+    ListElementTypes.FLT.name: "float64",
+    ListElementTypes.FIL.name: "string",
+    ListElementTypes.STR.name: "string",
+}
+
+
+def import_pyarrow():
+    """
+    Imports pyarrow, which is only required for Parquet and Arrow IPC
+    exports and is installed by the *export* extra.
+
+    Returns
+    -------
+    module
+        The pyarrow module
+
+    Raises
+    ------
+    ImportError
+        pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(MISSING_EXPORT_DEPENDENCY)
+    return pyarrow
+
+
+class ResultsExporter:
+    """
+    Exports the outputs of a queryset of runs in chunks. Each chunk requires
+    a single query for its run IDs and one more for each output model, so
+    memory usage is bounded by the chunk size rather than the number of runs.
+    """
+
+    def __init__(
+        self, runs: models.QuerySet, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        Initializes a new exporter.
+
+        Parameters
+        ----------
+        runs : models.QuerySet
+            Runs to export
+        chunk_size : int, optional
+            Number of runs read and written at a time, by default
+            :data:`DEFAULT_CHUNK_SIZE`
+        """
+        self.runs = runs
+        self.chunk_size = chunk_size
+        self.definitions = self.get_definitions()
+        self.columns = self.get_columns()
+        self.output_definition_keys = self.get_output_definition_keys()
+
+    def get_definitions(self) -> List[OutputDefinition]:
+        """
+        Returns the output definitions of all analysis versions included in
+        the exported runs.
+
+        Returns
+        -------
+        List[OutputDefinition]
+            Output definitions, ordered by key
+        """
+        analysis_versions = self.runs.order_by().values("analysis_version")
+        return list(
+            OutputDefinition.objects.select_subclasses()
+            .filter(
+                specification_set__analysis_version_set__in=analysis_versions
+            )
+            .distinct()
+            .order_by("key", "id")
+        )
+
+    def get_columns(self) -> Dict[str, OutputDefinition]:
+        """
+        Returns the exported columns (other than the run ID) by key, along
+        with the definition used to determine each column's type. If
+        multiple definitions share a key, the first is used.
+
+        Returns
+        -------
+        Dict[str, OutputDefinition]
+            Column definitions by key
+        """
+        columns = {}
+        for definition in self.definitions:
+            columns.setdefault(definition.key, definition)
+        return columns
+
+    def get_output_definition_keys(self) -> Dict[type, Dict[int, str]]:
+        """
+        Returns the keys of the exported output definitions by ID, grouped by
+        the output model of each definition.
+
+        Returns
+        -------
+        Dict[type, Dict[int, str]]
+            Definition keys by ID by output model
+        """
+        keys = {}
+        for definition in self.definitions:
+            output_model = getattr(definition, "output_class", None)
+            if output_model is None:
+                continue
+            keys.setdefault(output_model, {})[definition.id] = definition.key
+        return keys
+
+    def iterate_run_ids(self) -> Iterator[List[int]]:
+        """
+        Yields chunks of run IDs in ascending order.
+
+        Yields
+        ------
+        List[int]
+            Run IDs
+        """
+        queryset = self.runs.order_by("id").values_list("id", flat=True)
+        last_id = None
+        while True:
+            chunk = queryset if last_id is None else queryset.filter(
+                id__gt=last_id
+            )
+            run_ids = list(chunk[: self.chunk_size])
+            if not run_ids:
+                return
+            yield run_ids
+            last_id = run_ids[-1]
+
+    def get_rows(self, run_ids: List[int]) -> List[Dict[str, Any]]:
+        """
+        Returns the rows of the provided runs.
+
+        Parameters
+        ----------
+        run_ids : List[int]
+            Run IDs
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Output values by key, including the run ID
+        """
+        empty = dict.fromkeys(self.columns)
+        rows = {run_id: {RUN_ID_COLUMN: run_id, **empty} for run_id in run_ids}
+        for output_model, keys in self.output_definition_keys.items():
+            values = output_model.objects.filter(
+                run_id__in=run_ids, definition_id__in=keys
+            ).values_list("run_id", "definition_id", "value")
+            for run_id, definition_id, value in values:
+                rows[run_id][keys[definition_id]] = value
+        return list(rows.values())
+
+    def iterate_rows(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the exported rows in chunks.
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            Exported rows
+        """
+        for run_ids in self.iterate_run_ids():
+            yield self.get_rows(run_ids)
+
+    def serialize_csv_value(self, value: Any) -> Any:
+        """
+        Serializes list and dictionary values as JSON for CSV exports.
+
+        Parameters
+        ----------
+        value : Any
+            Output value
+
+        Returns
+        -------
+        Any
+            CSV cell value
+        """
+        if isinstance(value, (list, dict)):
+            return json.dumps(value)
+        return value
+
+    def iterate_csv(self) -> Iterator[str]:
+        """
+        Yields the exported table as CSV text, one chunk at a time.
+
+        Yields
+        ------
+        str
+            CSV text
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([RUN_ID_COLUMN, *self.columns])
+        for rows in self.iterate_rows():
+            for row in rows:
+                writer.writerow(
+                    [self.serialize_csv_value(value) for value in row.values()]
+                )
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+        # Yield the header of empty exports.
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def to_csv(self, destination: IO[str]) -> None:
+        """
+        Writes the exported table to a text file in CSV format.
+
+        Parameters
+        ----------
+        destination : IO[str]
+            Writable text file object
+        """
+        for text in self.iterate_csv():
+            destination.write(text)
+
+    def get_arrow_type(self, definition: OutputDefinition):
+        """
+        Returns the Arrow data type of a column.
+
+        Parameters
+        ----------
+        definition : OutputDefinition
+            The column's output definition
+
+        Returns
+        -------
+        pyarrow.DataType
+            Column data type
+        """
+        pyarrow = import_pyarrow()
+        if isinstance(definition, ListOutputDefinition):
+            element_type = ARROW_ELEMENT_TYPES.get(
+                definition.element_type, "string"
+            )
+            return pyarrow.list_(getattr(pyarrow, element_type)())
+        value_field = definition.output_class._meta.get_field("value")
+        field_type = value_field.get_internal_type()
+        return getattr(pyarrow, ARROW_FIELD_TYPES.get(field_type, "string"))()
+
+    def get_arrow_schema(self):
+        """
+        Returns the Arrow schema of the exported table.
+
+        Returns
+        -------
+        pyarrow.Schema
+            Exported table schema
+        """
+        pyarrow = import_pyarrow()
+        fields = [(RUN_ID_COLUMN, pyarrow.int64())] + [
+            (key, self.get_arrow_type(definition))
+            for key, definition in self.columns.items()
+        ]
+        return pyarrow.schema(fields)
+
+    def iterate_record_batches(self, schema) -> Iterator:
+        """
+        Yields the exported table as Arrow record batches.
+
+        Parameters
+        ----------
+        schema : pyarrow.Schema
+            Exported table schema
+
+        Yields
+        ------
+        pyarrow.RecordBatch
+            Exported rows
+        """
+        pyarrow = import_pyarrow()
+        string_columns = [
+            field.name
+            for field in schema
+            if pyarrow.types.is_string(field.type)
+        ]
+        for rows in self.iterate_rows():
+            for row in rows:
+                for key in string_columns:
+                    value = row[key]
+                    if value is not None and not isinstance(value, str):
+                        row[key] = json.dumps(value)
+            yield pyarrow.RecordBatch.from_pylist(rows, schema=schema)
+
+    def to_parquet(self, destination) -> None:
+        """
+        Writes the exported table in Parquet format.
+
+        Parameters
+        ----------
+        destination : Union[str, Path, IO[bytes]]
+            Destination path or writable binary file object
+        """
+        import_pyarrow()
+        from pyarrow import parquet
+
+        schema = self.get_arrow_schema()
+        with parquet.ParquetWriter(destination, schema) as writer:
+            for batch in self.iterate_record_batches(schema):
+                writer.write_batch(batch)
+
+    def to_arrow(self, destination) -> None:
+        """
+        Writes the exported table in Arrow IPC file format.
+
+        Parameters
+        ----------
+        destination : Union[str, Path, IO[bytes]]
+            Destination path or writable binary file object
+        """
+        pyarrow = import_pyarrow()
+        schema = self.get_arrow_schema()
+        with pyarrow.ipc.new_file(destination, schema) as writer:
+            for batch in self.iterate_record_batches(schema):
+                writer.write_batch(batch)
+
+    def export(self, destination, file_format: str = "csv") -> None:
+        """
+        Writes the exported table in the provided format.
+
+        Parameters
+        ----------
+        destination : Union[str, Path, IO]
+            Destination path or writable file object (text for CSV, binary
+            otherwise)
+        file_format : str, optional
+            One of :data:`EXPORT_FORMATS`, by default "csv"
+
+        Raises
+        ------
+        ValueError
+            Invalid file format
+        """
+        if file_format not in EXPORT_FORMATS:
+            message = BAD_EXPORT_FORMAT.format(
+                file_format=file_format, formats=", ".join(EXPORT_FORMATS)
+            )
+            raise ValueError(message)
+        if file_format == "csv" and not hasattr(destination, "write"):
+            with open(destination, "w", newline="") as csv_file:
+                self.to_csv(csv_file)
+        else:
+            getattr(self, f"to_{file_format}")(destination)
@@ -0,0 +1,247 @@
+"""
+Definition of the :class:`RunDirectoryCleanup` class, used to remove the
+directories of deleted runs once their deletion is committed.
+"""
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Iterable, List
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django_analyses.models.run import Run
+from django_analyses.utils.messages import BAD_CLEANUP_BACKEND
+
+#: Supported directory removal backends.
+CLEANUP_BACKENDS = "thread", "celery"
+
+#: Default directory removal backend.
+DEFAULT_CLEANUP_BACKEND = "thread"
+
+#: Maximal number of run directories removed by a single task.
+CLEANUP_BATCH_SIZE = 500
+
+
+def get_run_directory(run_id: int) -> Path:
+    """
+    Returns the artifacts directory of a run by its ID.
+
+    Parameters
+    ----------
+    run_id : int
+        Run ID
+
+    Returns
+    -------
+    Path
+        Run directory (which may not exist)
+    """
+    return Path(settings.ANALYSIS_BASE_PATH) / str(run_id)
+
+
+def get_deleted_run_directories(
+    run_ids: Iterable[int], using: str = DEFAULT_DB_ALIAS
+) -> List[Path]:
+    """
+    Returns the existing directories of the provided runs, excluding runs
+    that still exist (e.g. if their deletion was rolled back).
+
+    Parameters
+    ----------
+    run_ids : Iterable[int]
+        Deleted run IDs
+    using : str, optional
+        Database alias, by default DEFAULT_DB_ALIAS
+
+    Returns
+    -------
+    List[Path]
+        Directories to remove
+    """
+    run_ids = list(run_ids)
+    existing = set(
+        Run.objects.using(using)
+        .filter(id__in=run_ids)
+        .values_list("id", flat=True)
+    )
+    paths = [get_run_directory(run_id) for run_id in run_ids]
+    return [
+        path
+        for run_id, path in zip(run_ids, paths)
+        if run_id not in existing and path.is_dir()
+    ]
+
+
+def remove_directories(paths: Iterable[Path]) -> int:
+    """
+    Removes the provided directories.
+
+    Parameters
+    ----------
+    paths : Iterable[Path]
+        Directories to remove
+
+    Returns
+    -------
+    int
+        Number of removed directories
+    """
+    n_removed = 0
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+        n_removed += 1
+    return n_removed
+
+
+def remove_run_directories(run_ids: Iterable[int]) -> int:
+    """
+    Removes the directories of the provided deleted runs.
+
+    Parameters
+    ----------
+    run_ids : Iterable[int]
+        Deleted run IDs
+
+    Returns
+    -------
+    int
+        Number of removed directories
+    """
+    return remove_directories(get_deleted_run_directories(run_ids))
+
+
+class RunDirectoryCleanup:
+    """
+    Collects the IDs of runs deleted within a transaction and removes their
+    directories in batches after it is committed, either in a background
+    thread or in Celery tasks (as set by *ANALYSIS_RUN_CLEANUP_BACKEND*).
+    Directories are kept if the transaction is rolled back.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+
+    @property
+    def backend(self) -> str:
+        """
+        Returns the configured directory removal backend.
+
+        Returns
+        -------
+        str
+            Directory removal backend
+
+        Raises
+        ------
+        ValueError
+            Invalid backend
+        """
+        backend = getattr(
+            settings, "ANALYSIS_RUN_CLEANUP_BACKEND", DEFAULT_CLEANUP_BACKEND
+        )
+        if backend not in CLEANUP_BACKENDS:
+            message = BAD_CLEANUP_BACKEND.format(
+                backend=backend, backends=", ".join(CLEANUP_BACKENDS)
+            )
+            raise ValueError(message)
+        return backend
+
+    def add(self, run_id: int, using: str = DEFAULT_DB_ALIAS) -> None:
+        """
+        Queues the removal of a deleted run's directory once the current
+        transaction is committed.
+
+        Parameters
+        ----------
+        run_id : int
+            Deleted run ID
+        using : str, optional
+            Database alias, by default DEFAULT_DB_ALIAS
+        """
+        pending = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = {}
+        callback, run_ids = pending.get(using, (None, None))
+        connection = transaction.get_connection(using)
+        registered = callback is not None and any(
+            callback is entry[1] for entry in connection.run_on_commit
+        )
+        if not registered:
+            # Either the first deletion in this transaction, or the previous
+            # transaction was rolled back.
+            callback = partial(self.flush, using)
+            pending[using] = callback, [run_id]
+            transaction.on_commit(callback, using=using)
+        else:
+            run_ids.append(run_id)
+
+    def flush(self, using: str = DEFAULT_DB_ALIAS) -> None:
+        """
+        Submits the removal of the directories queued for a database.
+
+        Parameters
+        ----------
+        using : str, optional
+            Database alias, by default DEFAULT_DB_ALIAS
+        """
+        _, run_ids = self._local.pending.pop(using, (None, []))
+        for start in range(0, len(run_ids), CLEANUP_BATCH_SIZE):
+            batch = run_ids[start:start + CLEANUP_BATCH_SIZE]
+            self.submit(batch, using)
+
+    def submit(
+        self, run_ids: List[int], using: str = DEFAULT_DB_ALIAS
+    ) -> None:
+        """
+        Removes the provided runs' directories using the configured backend.
+        Celery tasks look up the deleted runs' directories themselves, while
+        the background thread only removes the directories it is given, so
+        that it never opens a database connection.
+
+        Parameters
+        ----------
+        run_ids : List[int]
+            Deleted run IDs
+        using : str, optional
+            Database alias, by default DEFAULT_DB_ALIAS
+        """
+        if self.backend == "celery":
+            from django_analyses.tasks import remove_run_directories_task
+
+            remove_run_directories_task.delay(run_ids)
+            return
+        paths = get_deleted_run_directories(run_ids, using)
+        if not paths:
+            return
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="run-cleanup"
+                )
+            future = self._executor.submit(remove_directories, paths)
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.append(future)
+
+    def wait(self) -> List[Future]:
+        """
+        Waits for directory removals submitted to the background thread.
+
+        Returns
+        -------
+        List[Future]
+            Completed removals
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+        return futures
+
+
+#: Deleted run directory cleanup.
+run_directory_cleanup = RunDirectoryCleanup()
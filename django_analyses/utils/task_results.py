@@ -0,0 +1,292 @@
+"""
+Utilities used to associate :class:`~django_analyses.models.run.Run`
+instances with the
+:class:`~django_celery_results.models.task_result.TaskResult` instances of
+the tasks that executed them.
+"""
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from celery import states
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Case, IntegerField, QuerySet, Value, When
+from django_analyses.models.run import Run
+from django_celery_results.models import TaskResult
+
+#: Name of the task executing group chunks (see :meth:`celery.Task.chunks`).
+STARMAP = "celery.starmap"
+
+#: Tasks returning run IDs, and whether their runs should be associated
+#: with them even if already associated with another task. Existing runs
+#: returned by batch executions remain associated with the task that created
+#: them.
+RUN_TASKS = {
+    "django_analyses.node-execution": True,
+    "django_analyses.node-batch-execution": False,
+    "django_analyses.pipeline-node-execution": True,
+}
+
+#: Default number of runs updated per query.
+DEFAULT_ASSOCIATION_BATCH_SIZE = 1000
+
+#: Matches quoted task names within a task's serialized arguments.
+QUOTED_TASK_NAME = re.compile(r"""['"]([\w.-]+)['"]""")
+
+#: Cache key of the ID of the last task result processed by
+#: :func:`~django_analyses.tasks.associate_task_results_task`.
+ASSOCIATION_MARK_KEY = "django_analyses.task-result-association-mark"
+
+
+def get_association_mode() -> str:
+    """
+    Returns the configured run association mode. In "immediate" mode runs
+    are associated as each task result is saved, while in "deferred" mode
+    they are associated in batches by
+    :func:`~django_analyses.tasks.associate_task_results_task`.
+
+    Returns
+    -------
+    str
+        Run association mode
+    """
+    return getattr(settings, "ANALYSIS_TASK_RESULT_ASSOCIATION", "immediate")
+
+
+def get_run_task_name(task_result: TaskResult) -> Optional[str]:
+    """
+    Returns the name of the run executing task of a task result. Chunks are
+    executed by the generic :data:`STARMAP` task, in which case the mapped
+    task's name is looked up in the serialized task arguments.
+
+    Parameters
+    ----------
+    task_result : TaskResult
+        Task result
+
+    Returns
+    -------
+    Optional[str]
+        Run executing task name, or None
+    """
+    if task_result.task_name in RUN_TASKS:
+        return task_result.task_name
+    if task_result.task_name == STARMAP:
+        serialized = f"{task_result.task_args} {task_result.task_kwargs}"
+        for name in QUOTED_TASK_NAME.findall(serialized):
+            if name in RUN_TASKS:
+                return name
+
+
+def collect_run_ids(result: Any) -> List[int]:
+    """
+    Collects the run IDs within a (possibly nested) task result.
+
+    Parameters
+    ----------
+    result : Any
+        Deserialized task result
+
+    Returns
+    -------
+    List[int]
+        Run IDs
+    """
+    if isinstance(result, bool):
+        return []
+    if isinstance(result, int):
+        return [result]
+    if isinstance(result, dict):
+        return collect_run_ids([result.get("run_id"), result.get("run_ids")])
+    if isinstance(result, (list, tuple)):
+        return [run_id for item in result for run_id in collect_run_ids(item)]
+    return []
+
+
+def get_run_associations(
+    task_results: Iterable[TaskResult],
+) -> Dict[bool, Dict[int, int]]:
+    """
+    Returns the task result IDs by run ID of the provided successful task
+    results, grouped by whether existing associations should be
+    overwritten.
+
+    Parameters
+    ----------
+    task_results : Iterable[TaskResult]
+        Task results
+
+    Returns
+    -------
+    Dict[bool, Dict[int, int]]
+        Task result IDs by run ID
+    """
+    associations = {True: {}, False: {}}
+    for task_result in task_results:
+        name = get_run_task_name(task_result)
+        if name is None or task_result.status != "SUCCESS":
+            continue
+        try:
+            result = json.loads(task_result.result)
+        except (TypeError, ValueError):
+            continue
+        overwrite = RUN_TASKS[name]
+        for run_id in collect_run_ids(result):
+            associations[overwrite][run_id] = task_result.id
+    return associations
+
+
+def update_run_task_results(
+    associations: Dict[int, int],
+    overwrite: bool = True,
+    batch_size: int = DEFAULT_ASSOCIATION_BATCH_SIZE,
+) -> int:
+    """
+    Updates the task results of runs using a single *UPDATE ... CASE* query
+    per batch.
+
+    Parameters
+    ----------
+    associations : Dict[int, int]
+        Task result IDs by run ID
+    overwrite : bool, optional
+        Whether to update runs already associated with a task result, by
+        default True
+    batch_size : int, optional
+        Number of runs updated per query, by default
+        :data:`DEFAULT_ASSOCIATION_BATCH_SIZE`
+
+    Returns
+    -------
+    int
+        Number of updated runs
+    """
+    run_ids = list(associations)
+    n_updated = 0
+    for start in range(0, len(run_ids), batch_size):
+        batch = run_ids[start:start + batch_size]
+        runs = Run.objects.filter(id__in=batch)
+        if not overwrite:
+            runs = runs.filter(task_result__isnull=True)
+        task_result_ids = {associations[run_id] for run_id in batch}
+        if len(task_result_ids) == 1:
+            value = Value(task_result_ids.pop())
+        else:
+            value = Case(
+                *[
+                    When(id=run_id, then=Value(associations[run_id]))
+                    for run_id in batch
+                ],
+                output_field=IntegerField(),
+            )
+        n_updated += runs.update(task_result_id=value)
+    return n_updated
+
+
+def associate_task_results(
+    task_results: Iterable[TaskResult],
+    batch_size: int = DEFAULT_ASSOCIATION_BATCH_SIZE,
+) -> int:
+    """
+    Associates the runs returned by the provided task results with them.
+
+    Parameters
+    ----------
+    task_results : Iterable[TaskResult]
+        Task results
+    batch_size : int, optional
+        Number of runs updated per query, by default
+        :data:`DEFAULT_ASSOCIATION_BATCH_SIZE`
+
+    Returns
+    -------
+    int
+        Number of updated runs
+    """
+    associations = get_run_associations(task_results)
+    return sum(
+        update_run_task_results(
+            associations[overwrite], overwrite=overwrite, batch_size=batch_size
+        )
+        for overwrite in (True, False)
+    )
+
+
+def get_association_mark() -> int:
+    """
+    Returns the ID of the last task result processed by
+    :func:`~django_analyses.tasks.associate_task_results_task`, so that
+    only newer task results are scanned by its next execution. The mark is
+    kept in the default cache, which should be shared by the worker
+    processes (otherwise each process scans all task results once).
+
+    Returns
+    -------
+    int
+        Last processed task result ID, or 0
+    """
+    return cache.get(ASSOCIATION_MARK_KEY, 0)
+
+
+def set_association_mark(task_result_id: int) -> None:
+    """
+    Sets the ID of the last task result processed by
+    :func:`~django_analyses.tasks.associate_task_results_task`.
+
+    Parameters
+    ----------
+    task_result_id : int
+        Last processed task result ID
+    """
+    cache.set(ASSOCIATION_MARK_KEY, task_result_id, timeout=None)
+
+
+def get_unassociated_task_results(after: int = 0) -> QuerySet:
+    """
+    Returns run executing task results newer than the provided task result
+    ID, ordered by ID. Unfinished task results are included so that the
+    association mark (see :func:`get_association_mark`) is not advanced past
+    them.
+
+    Parameters
+    ----------
+    after : int, optional
+        Task result ID to return newer task results of, by default 0
+
+    Returns
+    -------
+    QuerySet
+        Run executing task results
+    """
+    return TaskResult.objects.filter(
+        id__gt=after,
+        task_name__in=[*RUN_TASKS, STARMAP],
+    ).order_by("id")
+
+
+def get_next_association_mark(
+    task_results: Iterable[TaskResult], mark: int
+) -> int:
+    """
+    Returns the association mark following the processing of the provided
+    task results, which is the ID preceding the first unfinished task result
+    (if any) or the ID of the last one.
+
+    Parameters
+    ----------
+    task_results : Iterable[TaskResult]
+        Processed task results, ordered by ID
+    mark : int
+        Current association mark
+
+    Returns
+    -------
+    int
+        Next association mark
+    """
+    for task_result in task_results:
+        if task_result.status not in states.READY_STATES:
+            return mark
+        mark = task_result.id
+    return mark
@@ -0,0 +1,173 @@
+"""
+Utilities used to stream zip archives without writing them to disk or
+buffering them in memory.
+"""
+import io
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple, Union
+
+#: Size of the chunks read from archived files.
+CHUNK_SIZE = 1024 * 1024
+
+#: Compression modes, by query parameter value.
+COMPRESSION_MODES = {
+    "auto": None,
+    "deflated": zipfile.ZIP_DEFLATED,
+    "stored": zipfile.ZIP_STORED,
+}
+
+#: Suffixes of files that are already compressed, and are therefore stored
+#: as-is when using the "auto" compression mode.
+COMPRESSED_SUFFIXES = {
+    ".bz2",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".mgz",
+    ".png",
+    ".xz",
+    ".zip",
+}
+
+
+class ZipStreamBuffer(io.RawIOBase):
+    """
+    Unseekable write-only buffer collecting the bytes written by
+    :class:`zipfile.ZipFile` until they are popped. As the buffer is not
+    seekable, entry sizes and checksums are written in data descriptors
+    following each entry rather than in its header.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def pop(self) -> bytes:
+        """
+        Returns and clears the bytes written since the last call.
+
+        Returns
+        -------
+        bytes
+            Written bytes
+        """
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def pop_chunk(buffer: ZipStreamBuffer) -> Iterator[bytes]:
+    """
+    Yields the bytes written to the buffer since the last call, if any.
+
+    Parameters
+    ----------
+    buffer : ZipStreamBuffer
+        Zip stream buffer
+
+    Yields
+    ------
+    bytes
+        Written bytes
+    """
+    data = buffer.pop()
+    if data:
+        yield data
+
+
+def get_compression(path: Path, mode: str = "auto") -> int:
+    """
+    Returns the compression method used to archive the provided file.
+
+    Parameters
+    ----------
+    path : Path
+        Archived file
+    mode : str, optional
+        One of :data:`COMPRESSION_MODES`, by default "auto" (store already
+        compressed files and deflate others)
+
+    Returns
+    -------
+    int
+        :mod:`zipfile` compression constant
+    """
+    compression = COMPRESSION_MODES[mode]
+    if compression is not None:
+        return compression
+    if path.suffix.lower() in COMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def iterate_directory(
+    path: Union[str, Path]
+) -> Iterator[Tuple[Path, str]]:
+    """
+    Yields the files under the provided directory along with their archive
+    names (relative to the directory).
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        Directory to archive
+
+    Yields
+    ------
+    Tuple[Path, str]
+        File path and archive name
+    """
+    path = Path(path)
+    for file_path in sorted(path.rglob("*")):
+        if file_path.is_file():
+            yield file_path, str(file_path.relative_to(path))
+
+
+def iterate_zip(
+    entries: Iterable[Tuple[Union[str, Path], str]],
+    mode: str = "auto",
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Yields a zip archive of the provided files in chunks, reading each file
+    as the archive is consumed.
+
+    Parameters
+    ----------
+    entries : Iterable[Tuple[Union[str, Path], str]]
+        File paths and their archive names
+    mode : str, optional
+        One of :data:`COMPRESSION_MODES`, by default "auto"
+    chunk_size : int, optional
+        Size of the chunks read from archived files, by default
+        :data:`CHUNK_SIZE`
+
+    Yields
+    ------
+    bytes
+        Zip archive chunk
+    """
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, "w", allowZip64=True) as archive:
+        for path, name in entries:
+            path = Path(path)
+            info = zipfile.ZipInfo.from_file(path, name)
+            info.compress_type = get_compression(path, mode)
+            with open(path, "rb") as source, archive.open(info, "w") as dest:
+                for chunk in iter(lambda: source.read(chunk_size), b""):
+                    dest.write(chunk)
+                    yield from pop_chunk(buffer)
+        yield from pop_chunk(buffer)
+    yield from pop_chunk(buffer)
@@ -1,4 +1,18 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+
+from django.db import connections
+from django.db.models import QuerySet
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+#: Query parameter used to select keyset pagination (by setting it to
+#: :data:`KEYSET_PAGINATION`).
+PAGINATION_QUERY_PARAM = "pagination"
+KEYSET_PAGINATION = "keyset"
+
+#: Query parameter used to request a total count with keyset pagination.
+COUNT_QUERY_PARAM = "count"
 
 
 class StandardResultsSetPagination(PageNumberPagination):
@@ -10,3 +24,137 @@ class StandardResultsSetPagination(PageNumberPagination):
 
     page_size = 100
     page_size_query_param = "page_size"
+
+
+def get_approximate_count(queryset: QuerySet) -> int:
+    """
+    Returns the query planner's estimate of the number of rows in a
+    queryset, avoiding a full ``COUNT(*)`` scan. Only PostgreSQL is
+    supported, other backends return an exact count.
+
+    Parameters
+    ----------
+    queryset : QuerySet
+        Queryset to estimate
+
+    Returns
+    -------
+    int
+        Estimated number of rows
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor != "postgresql":
+        return queryset.count()
+    plan = json.loads(queryset.explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class KeysetResultsSetPagination(CursorPagination):
+    """
+    Keyset (cursor) pagination, used to list large tables without the
+    ``COUNT(*)`` and ``OFFSET`` scans of page number pagination, so that
+    retrieving a page doesn't depend on its depth. Results are always
+    ordered by the pagination key (:attr:`ordering`), which should be
+    indexed.
+
+    A total count may be requested by setting the *count* query parameter to
+    "approximate" (the query planner's estimate) or "exact".
+    """
+
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+    ordering = ("-id",)
+
+    def get_ordering(
+        self, request: Request, queryset: QuerySet, view=None
+    ) -> tuple:
+        """
+        Returns the pagination key. Any ordering requested using the view's
+        ordering filter is ignored, as keyset pagination requires a unique
+        (or nearly unique) and indexed ordering.
+
+        Returns
+        -------
+        tuple
+            Ordering fields
+        """
+        return tuple(self.ordering)
+
+    def get_count(self, queryset: QuerySet, request: Request) -> int:
+        """
+        Returns the requested total count of the queryset, if any.
+
+        Parameters
+        ----------
+        queryset : QuerySet
+            Paginated queryset
+        request : Request
+            The current request
+
+        Returns
+        -------
+        int
+            Total count, or None if not requested
+        """
+        count = request.query_params.get(COUNT_QUERY_PARAM)
+        if count == "approximate":
+            return get_approximate_count(queryset)
+        elif count == "exact":
+            return queryset.count()
+
+    def paginate_queryset(
+        self, queryset: QuerySet, request: Request, view=None
+    ) -> list:
+        self.count = self.get_count(queryset, request)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data) -> Response:
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data["count"] = self.count
+        return response
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"] = {
+            "type": "integer",
+            "nullable": True,
+            "example": 123,
+        }
+        return response_schema
+
+
+class RunKeysetResultsSetPagination(KeysetResultsSetPagination):
+    """
+    Keyset pagination of runs, ordered by creation time (see the
+    *run_created_idx* index of :class:`~django_analyses.models.run.Run`).
+    """
+
+    ordering = ("-created", "-id")
+
+
+class KeysetPaginationMixin:
+    """
+    Allows clients to select keyset pagination instead of the view's default
+    :attr:`pagination_class` by setting the *pagination* query parameter to
+    "keyset" (or by following a cursor link).
+    """
+
+    keyset_pagination_class = KeysetResultsSetPagination
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator") and self.use_keyset_pagination:
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
+
+    @property
+    def use_keyset_pagination(self) -> bool:
+        request = getattr(self, "request", None)
+        if request is None or self.keyset_pagination_class is None:
+            return False
+        params = request.query_params
+        selected = params.get(PAGINATION_QUERY_PARAM) == KEYSET_PAGINATION
+        cursor_param = self.keyset_pagination_class.cursor_query_param
+        return selected or cursor_param in params
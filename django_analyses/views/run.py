@@ -1,20 +1,75 @@
-import os
-import shutil
+import tempfile
 
-from django.http import FileResponse
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django_analyses.filters.run import RunFilter
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
 from django_analyses.models.run import Run
-from django_analyses.serializers.run import RunSerializer
+from django_analyses.models.run_status_count import RunStatusCount
+from django_analyses.serializers.analysis import CompactAnalysisSerializer
+from django_analyses.serializers.analysis_version import (
+    CompactAnalysisVersionSerializer,
+)
+from django_analyses.serializers.run import (
+    CompactRunSerializer,
+    CompactUserSerializer,
+    RunSerializer,
+)
+from django_analyses.serializers.utils.related_lookups import (
+    apply_related_lookups,
+)
+from django_analyses.utils.messages import (
+    BAD_EXPORT_FORMAT,
+    BAD_SUMMARY_ID,
+    MISSING_RUN_DIRECTORY,
+)
+from django_analyses.utils.results_export import (
+    DEFAULT_CHUNK_SIZE,
+    EXPORT_FORMATS,
+    ResultsExporter,
+)
 from django_analyses.views.defaults import DefaultsMixin
-from django_analyses.views.pagination import StandardResultsSetPagination
-from rest_framework import viewsets
+from django_analyses.views.pagination import (
+    KeysetPaginationMixin,
+    RunKeysetResultsSetPagination,
+    StandardResultsSetPagination,
+)
+from django_analyses.utils.zip_stream import iterate_directory
+from django_analyses.views.utils import (
+    EXPORT_CONTENT_DISPOSITION,
+    EXPORT_CONTENT_TYPES,
+    get_compression_mode,
+    get_zip_response,
+)
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
+from rest_framework.response import Response
 
+#: Exported results file name (without extension).
+EXPORT_FILE_NAME = "results"
 
-class RunViewSet(DefaultsMixin, viewsets.ModelViewSet):
+#: Query parameter used to select the compact serializer.
+COMPACT_QUERY_PARAM = "compact"
+
+#: Query parameters used to filter run summaries, by analysis version lookup.
+SUMMARY_QUERY_PARAMS = {
+    "analysis": "analysis__in",
+    "analysis_version": "id__in",
+}
+
+User = get_user_model()
+
+
+class RunViewSet(
+    KeysetPaginationMixin, DefaultsMixin, viewsets.ModelViewSet
+):
     filter_class = RunFilter
     pagination_class = StandardResultsSetPagination
+    keyset_pagination_class = RunKeysetResultsSetPagination
     queryset = Run.objects.all()
     serializer_class = RunSerializer
     ordering_fields = (
@@ -26,12 +81,205 @@ class RunViewSet(DefaultsMixin, viewsets.ModelViewSet):
         "user",
     )
 
-    @action(detail=True, methods=["get"])
-    def to_zip(self, request: Request, pk: int) -> FileResponse:
-        instance = Run.objects.get(id=pk)
-        base_dir = root_dir = str(instance.path)
-        name = str(instance.id)
-        archive = shutil.make_archive(name, "zip", base_dir, root_dir)
-        response = FileResponse(open(archive, "rb"), as_attachment=True)
-        os.unlink(archive)
+    def get_queryset(self) -> QuerySet:
+        """
+        Returns the runs queryset with the related instances required by
+        the serializer selected or prefetched.
+
+        Returns
+        -------
+        QuerySet
+            Runs
+        """
+        queryset = super().get_queryset()
+        return apply_related_lookups(queryset, self.get_serializer_class())
+
+    def get_serializer_class(self) -> type:
+        if self.compact:
+            return CompactRunSerializer
+        return super().get_serializer_class()
+
+    def get_included(self, runs) -> dict:
+        """
+        Returns the side-loaded instances related to compactly serialized
+        runs, serializing each related instance once.
+
+        Parameters
+        ----------
+        runs : Iterable[Run]
+            Serialized runs
+
+        Returns
+        -------
+        dict
+            Serialized analysis versions, analyses and users
+        """
+        version_ids = {run.analysis_version_id for run in runs}
+        user_ids = {run.user_id for run in runs if run.user_id}
+        versions = AnalysisVersion.objects.filter(id__in=version_ids)
+        analyses = Analysis.objects.filter(
+            id__in={version.analysis_id for version in versions}
+        )
+        users = User.objects.filter(id__in=user_ids)
+        context = self.get_serializer_context()
+        return {
+            "analysis_versions": CompactAnalysisVersionSerializer(
+                versions, many=True, context=context
+            ).data,
+            "analyses": CompactAnalysisSerializer(
+                analyses, many=True, context=context
+            ).data,
+            "users": CompactUserSerializer(
+                users, many=True, context=context
+            ).data,
+        }
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Lists runs. If the *compact* query parameter is set, relations are
+        serialized as primary keys and the related instances are returned
+        once in an *included* block.
+        """
+        if not self.compact:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        runs = list(queryset) if page is None else page
+        data = self.get_serializer(runs, many=True).data
+        included = self.get_included(runs)
+        if page is None:
+            return Response({"results": data, "included": included})
+        response = self.get_paginated_response(data)
+        response.data["included"] = included
         return response
+
+    @property
+    def compact(self) -> bool:
+        request = getattr(self, "request", None)
+        if request is None:
+            return False
+        value = request.query_params.get(COMPACT_QUERY_PARAM, "")
+        return value.lower() in ("1", "true", "yes")
+
+    def get_summary_analysis_versions(self, request: Request) -> QuerySet:
+        """
+        Returns the analysis versions selected by the summary query
+        parameters (see :data:`SUMMARY_QUERY_PARAMS`), or None if no filter
+        is provided. Parameters may be repeated or comma-separated.
+
+        Parameters
+        ----------
+        request : Request
+            Summary request
+
+        Returns
+        -------
+        QuerySet
+            Analysis version IDs, or None
+
+        Raises
+        ------
+        ValidationError
+            Invalid ID
+        """
+        lookups = {}
+        for name, lookup in SUMMARY_QUERY_PARAMS.items():
+            values = [
+                value
+                for param in request.query_params.getlist(name)
+                for value in param.split(",")
+                if value
+            ]
+            if not values:
+                continue
+            invalid = [value for value in values if not value.isdigit()]
+            if invalid:
+                message = BAD_SUMMARY_ID.format(name=name, value=invalid[0])
+                raise ValidationError({name: message})
+            lookups[lookup] = [int(value) for value in values]
+        if lookups:
+            return AnalysisVersion.objects.filter(**lookups).values("id")
+
+    @action(detail=False, methods=["get"])
+    def summary(self, request: Request) -> Response:
+        """
+        Returns the number of runs of each status (runs with no status are
+        counted as "PENDING") along with the mean and 95th percentile
+        duration (in seconds) of the finished runs of each analysis version.
+        Results may be filtered using the *analysis* and *analysis_version*
+        query parameters.
+
+        If *ANALYSIS_RUN_STATUS_COUNTERS* is set, statistics are read from
+        rollup tables maintained as runs are saved, so the response time
+        does not depend on the number of runs. Otherwise, they are computed
+        from the runs table.
+        """
+        analysis_version_ids = self.get_summary_analysis_versions(request)
+        summary = RunStatusCount.objects.get_summary(analysis_version_ids)
+        return Response(summary)
+
+    @action(detail=True, methods=["get"])
+    def to_zip(self, request: Request, pk: int) -> StreamingHttpResponse:
+        """
+        Streams a zip archive of the run's output directory. The archive is
+        generated as it is sent, so no temporary file is written. Already
+        compressed files are stored as-is by default, the compression mode
+        may be set using the *compression* query parameter ("auto",
+        "stored" or "deflated").
+        """
+        instance = self.get_object()
+        path = instance.path
+        if path is None:
+            raise Http404(MISSING_RUN_DIRECTORY.format(run_id=instance.id))
+        mode = get_compression_mode(request)
+        entries = iterate_directory(path)
+        return get_zip_response(entries, str(instance.id), mode)
+
+    @action(detail=False, methods=["get"])
+    def export_results(self, request: Request) -> FileResponse:
+        """
+        Exports the outputs of the filtered runs as a table with one row per
+        run and one column per output definition key. The format is set by
+        the *file_format* query parameter ("csv", "parquet" or "arrow").
+        CSV exports are streamed, other formats are written in chunks to a
+        temporary file.
+        """
+        file_format = request.query_params.get("file_format", "csv")
+        if file_format not in EXPORT_FORMATS:
+            message = BAD_EXPORT_FORMAT.format(
+                file_format=file_format, formats=", ".join(EXPORT_FORMATS)
+            )
+            raise ValidationError({"file_format": message})
+        try:
+            chunk_size = int(
+                request.query_params.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            )
+        except ValueError:
+            raise ValidationError({"chunk_size": "Must be an integer."})
+        runs = self.filter_queryset(self.get_queryset())
+        exporter = ResultsExporter(runs, chunk_size=max(chunk_size, 1))
+        content_type = EXPORT_CONTENT_TYPES[file_format]
+        if file_format == "csv":
+            response = StreamingHttpResponse(
+                exporter.iterate_csv(), content_type=content_type
+            )
+            content_disposition = EXPORT_CONTENT_DISPOSITION.format(
+                name=EXPORT_FILE_NAME, extension=file_format
+            )
+            response["Content-Disposition"] = content_disposition
+            return response
+        destination = tempfile.TemporaryFile()
+        try:
+            exporter.export(destination, file_format=file_format)
+        except ImportError as e:
+            destination.close()
+            return Response(
+                {"detail": str(e)}, status=status.HTTP_501_NOT_IMPLEMENTED
+            )
+        destination.seek(0)
+        return FileResponse(
+            destination,
+            as_attachment=True,
+            filename=f"{EXPORT_FILE_NAME}.{file_format}",
+            content_type=content_type,
+        )
@@ -1,2 +1,270 @@
+import hashlib
+import mimetypes
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from django.db.models import Model
+from django.http import (
+    FileResponse,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import (
+    content_disposition_header,
+    http_date,
+    quote_etag,
+)
+from django_analyses.models.utils.html_repr import (
+    get_preview_key,
+    get_preview_paths,
+)
+from django_analyses.utils.messages import BAD_COMPRESSION_MODE
+from django_analyses.utils.zip_stream import (
+    CHUNK_SIZE,
+    COMPRESSION_MODES,
+    iterate_zip,
+)
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
 CONTENT_DISPOSITION = "attachment; filename={name}.zip"
 ZIP_CONTENT_TYPE = "application/x-zip-compressed"
+EXPORT_CONTENT_DISPOSITION = "attachment; filename={name}.{extension}"
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+#: Query parameter used to select the compression mode of zip archives.
+COMPRESSION_QUERY_PARAM = "compression"
+
+#: Content returned for instances without a preview.
+NO_PREVIEW = "No preview available :("
+
+#: Single byte range *Range* header pattern.
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def get_compression_mode(request: Request) -> str:
+    """
+    Returns the zip archive compression mode requested by the client.
+
+    Parameters
+    ----------
+    request : Request
+        The current request
+
+    Returns
+    -------
+    str
+        Compression mode
+
+    Raises
+    ------
+    ValidationError
+        Invalid compression mode
+    """
+    mode = request.query_params.get(COMPRESSION_QUERY_PARAM, "auto")
+    if mode not in COMPRESSION_MODES:
+        message = BAD_COMPRESSION_MODE.format(
+            mode=mode, modes=", ".join(COMPRESSION_MODES)
+        )
+        raise ValidationError({COMPRESSION_QUERY_PARAM: message})
+    return mode
+
+
+def get_zip_response(
+    entries: Iterable[Tuple[Union[str, Path], str]],
+    name: str,
+    mode: str = "auto",
+) -> StreamingHttpResponse:
+    """
+    Returns a response streaming a zip archive of the provided files.
+
+    Parameters
+    ----------
+    entries : Iterable[Tuple[Union[str, Path], str]]
+        File paths and their archive names
+    name : str
+        Archive name (without extension)
+    mode : str, optional
+        Compression mode, by default "auto"
+
+    Returns
+    -------
+    StreamingHttpResponse
+        Zip archive response
+    """
+    response = StreamingHttpResponse(
+        iterate_zip(entries, mode=mode), content_type=ZIP_CONTENT_TYPE
+    )
+    response["Content-Disposition"] = CONTENT_DISPOSITION.format(name=name)
+    return response
+
+
+def iterate_file_range(
+    path: Path, start: int, length: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yields a byte range of a file in chunks.
+
+    Parameters
+    ----------
+    path : Path
+        File path
+    start : int
+        First byte position
+    length : int
+        Number of bytes to read
+    chunk_size : int, optional
+        Size of the yielded chunks, by default :data:`CHUNK_SIZE`
+
+    Yields
+    ------
+    bytes
+        File chunk
+    """
+    with open(path, "rb") as file_object:
+        file_object.seek(start)
+        while length > 0:
+            chunk = file_object.read(min(chunk_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def get_file_response(
+    request: Request, path: Union[str, Path]
+) -> HttpResponse:
+    """
+    Returns a response sending the provided file as an attachment. Single
+    byte range requests (using the *Range* header) are answered with partial
+    content, so that large downloads may be resumed.
+
+    Parameters
+    ----------
+    request : Request
+        The current request
+    path : Union[str, Path]
+        File path
+
+    Returns
+    -------
+    HttpResponse
+        File response
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    match = RANGE_PATTERN.match(request.META.get("HTTP_RANGE", "").strip())
+    if not match or match.groups() == ("", ""):
+        response = FileResponse(open(path, "rb"), as_attachment=True)
+        response["Accept-Ranges"] = "bytes"
+        return response
+    start, end = match.groups()
+    if start:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    else:
+        # Suffix range (the last *end* bytes).
+        start = max(size - int(end), 0)
+        end = size - 1
+    if start > end:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+    content_type, _ = mimetypes.guess_type(path.name)
+    response = StreamingHttpResponse(
+        iterate_file_range(path, start, end - start + 1),
+        status=206,
+        content_type=content_type or "application/octet-stream",
+    )
+    response["Content-Length"] = str(end - start + 1)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = content_disposition_header(
+        True, path.name
+    )
+    return response
+
+
+def get_preview_validators(
+    paths: List[Path],
+) -> Tuple[Optional[str], Optional[int]]:
+    """
+    Returns the *ETag* and last modification time of a preview of the
+    provided files. The ETag is derived from the files' preview cache keys,
+    so it changes whenever a file or the rendering parameters change.
+
+    Parameters
+    ----------
+    paths : List[Path]
+        Previewed files
+
+    Returns
+    -------
+    Tuple[Optional[str], Optional[int]]
+        ETag and last modification timestamp, or None if there are no
+        previewed files
+    """
+    if not paths:
+        return None, None
+    keys = "".join(get_preview_key(path) for path in paths)
+    etag = quote_etag(hashlib.sha256(keys.encode()).hexdigest())
+    last_modified = int(max(path.stat().st_mtime for path in paths))
+    return etag, last_modified
+
+
+def get_html_repr_response(
+    request: Request, instance: Model, index: int = None
+) -> HttpResponse:
+    """
+    Returns a response containing an input or output instance's HTML
+    preview. File previews are sent with *ETag* and *Last-Modified* headers,
+    and conditional requests for unchanged files are answered with
+    *304 Not Modified* without rendering.
+
+    Parameters
+    ----------
+    request : Request
+        The current request
+    instance : Model
+        Input or output instance
+    index : int, optional
+        Index of a list element to preview, by default None
+
+    Returns
+    -------
+    HttpResponse
+        Preview response
+    """
+    html_repr = False
+    paths = []
+    has_repr = hasattr(instance, "_repr_html_")
+    has_getter = hasattr(instance, "get_html_repr")
+    if index is None and has_repr:
+        paths = get_preview_paths(instance.value)
+    elif index is not None and has_getter:
+        paths = get_preview_paths(instance.value[index])
+    etag, last_modified = get_preview_validators(paths)
+    if etag is not None:
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            return response
+    if index is None and has_repr:
+        html_repr = instance._repr_html_()
+    elif index is not None and has_getter:
+        html_repr = instance.get_html_repr(index)
+    content = html_repr if html_repr else NO_PREVIEW
+    response = JsonResponse({"content": content})
+    if etag is not None:
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -19,6 +19,9 @@ with open("requirements.txt") as fh:
 with open("requirements-dev.txt") as fh:
     dev_requirements = fh.read().splitlines()
 
+# Optional dependencies required by Parquet and Arrow results exports.
+export_requirements = ["pyarrow>=7.0"]
+
 setup(
     name="django_analyses",
     version="0.1.0",
@@ -34,7 +37,7 @@ setup(
     keywords="django research analysis pipeline",
     install_requires=install_requires,
     dependency_links=dependency_links,
-    extras_require={"dev": dev_requirements},
+    extras_require={"dev": dev_requirements, "export": export_requirements},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Environment :: Web Environment",
@@ -0,0 +1,60 @@
+from django.test import TestCase
+from django_analyses.filters.input.input import InputFilter
+from django_analyses.filters.output.output import OutputFilter
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.input.input import Input
+from django_analyses.models.output.output import Output
+from tests.factories.input.types.string_input import StringInputFactory
+from tests.factories.pipeline.node import NodeFactory
+from tests.fixtures import ANALYSES
+
+
+class InputOutputFilterTestCase(TestCase):
+    """
+    Tests for the :class:`~django_analyses.filters.input.input.InputFilter`
+    and :class:`~django_analyses.filters.output.output.OutputFilter` classes.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        addition = AnalysisVersion.objects.get(analysis__title="addition")
+        cls.addition_run = NodeFactory(analysis_version=addition).run(
+            inputs={"x": 1, "y": 2}
+        )
+        cls.string_input = StringInputFactory(
+            run=cls.addition_run, definition__key="name"
+        )
+
+    def filter_inputs(self, **data):
+        queryset = Input.objects.select_subclasses()
+        return InputFilter(data, queryset=queryset).qs
+
+    def filter_outputs(self, **data):
+        queryset = Output.objects.select_subclasses()
+        return OutputFilter(data, queryset=queryset).qs
+
+    def test_filter_input_key(self):
+        inputs = self.filter_inputs(key="X")
+        self.assertListEqual([inpt.key for inpt in inputs], ["x"])
+
+    def test_filter_input_type(self):
+        inputs = self.filter_inputs(input_type="STR")
+        self.assertListEqual(list(inputs), [self.string_input])
+
+    def test_filter_input_key_and_type(self):
+        self.assertFalse(self.filter_inputs(key="x", input_type="STR"))
+
+    def test_filter_output_key(self):
+        outputs = self.filter_outputs(key="res")
+        self.assertListEqual([output.value for output in outputs], [3])
+
+    def test_filter_output_type(self):
+        self.assertEqual(self.filter_outputs(output_type="FLT").count(), 1)
+        self.assertFalse(self.filter_outputs(output_type="FIL"))
+
+    def test_filter_is_single_query(self):
+        with self.assertNumQueries(1):
+            list(self.filter_inputs(key="x", input_type="FLT"))
@@ -1,12 +1,14 @@
 from django.core.exceptions import ValidationError
 from django.db.models import QuerySet
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django_analyses.models.input.definitions.boolean_input_definition import \
     BooleanInputDefinition
 from django_analyses.models.input.definitions.file_input_definition import \
     FileInputDefinition
 from django_analyses.models.input.definitions.float_input_definition import \
     FloatInputDefinition
+from django_analyses.models.input.definitions.input_definition import \
+    InputDefinition
 from django_analyses.models.input.definitions.integer_input_definition import \
     IntegerInputDefinition
 from django_analyses.models.input.definitions.list_input_definition import \
@@ -45,6 +47,63 @@ class InputSpecificationTestCase(TestCase):
     def test_string(self):
         self.assertIsInstance(self.input_specification.__str__(), str)
 
+    # get_definitions_by_key
+    def test_get_definitions_by_key(self):
+        value = self.input_specification.get_definitions_by_key()
+        expected = {
+            definition.key: definition
+            for definition in self.input_specification.input_definitions
+        }
+        self.assertDictEqual(value, expected)
+
+    def test_get_definitions_by_key_is_cached(self):
+        self.input_specification.get_definitions_by_key()
+        kwargs = {
+            definition.key: "value"
+            for definition in self.input_specification.input_definitions
+        }
+        with self.assertNumQueries(0):
+            self.input_specification.validate_keys(**kwargs)
+            self.input_specification.validate_required(**kwargs)
+            self.input_specification.default_configuration
+            self.input_specification.configuration_keys
+
+    def test_get_definitions_by_key_invalidated_on_definition_add(self):
+        self.input_specification.get_definitions_by_key()
+        definition = StringInputDefinition.objects.create(key="added")
+        self.input_specification.base_input_definitions.add(definition)
+        value = self.input_specification.get_definitions_by_key()
+        self.assertIn("added", value)
+
+    def test_get_definitions_by_key_invalidated_on_definition_save(self):
+        definition = self.input_specification.input_definitions.first()
+        self.input_specification.get_definitions_by_key()
+        definition.description = "Updated"
+        definition.save()
+        value = self.input_specification.get_definitions_by_key()
+        self.assertEqual(value[definition.key].description, "Updated")
+
+    def test_get_definitions_by_key_expires(self):
+        self.input_specification.get_definitions_by_key()
+        # Changes made by other processes send no local signals.
+        definition = self.input_specification.input_definitions.first()
+        type(definition).objects.filter(id=definition.id).update(
+            description="Updated"
+        )
+        with override_settings(ANALYSIS_DEFINITION_CACHE_TTL=0):
+            value = self.input_specification.get_definitions_by_key()
+        self.assertEqual(value[definition.key].description, "Updated")
+
+    # get_definition
+    def test_get_definition(self):
+        definition = self.input_specification.input_definitions.first()
+        value = self.input_specification.get_definition(definition.key)
+        self.assertEqual(value, definition)
+
+    def test_get_definition_with_an_invalid_key_raises_does_not_exist(self):
+        with self.assertRaises(InputDefinition.DoesNotExist):
+            self.input_specification.get_definition("invalid_key")
+
     # validate_keys
     def test_validate_keys_with_valid_keys(self):
         kwargs = {
@@ -1,32 +1,68 @@
-# from django.test import TestCase
-# from django_analyses.models.analysis import Analysis
-# from django_analyses.models.analysis_version import AnalysisVersion
-# from django_analyses.models.run import Run
-# from tests.factories.pipeline.node import NodeFactory
-# from tests.fixtures import ANALYSES
+from django.test import TestCase
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.run import Run
+from tests.factories.pipeline.node import NodeFactory
+from tests.fixtures import ANALYSES
 
 
-# class RunManagerTestCase(TestCase):
-#     """
-#     Tests for the :class:`~django_analyses.models.managers.run.RunManager` class.
+class FilterByConfigurationTestCase(TestCase):
+    """
+    Tests for the
+    :meth:`~django_analyses.models.managers.run.RunManager.filter_by_configuration`
+    method.
 
-#     """
+    """
 
-#     @classmethod
-#     def setUpTestData(cls):
-#         Analysis.objects.from_list(ANALYSES)
-#         cls.addition = AnalysisVersion.objects.get(analysis__title="addition")
-#         cls.power = AnalysisVersion.objects.get(analysis__title="power")
-#         cls.addition_node = NodeFactory(analysis_version=cls.addition)
-#         cls.power_node = NodeFactory(analysis_version=cls.power)
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        cls.norm = AnalysisVersion.objects.get(analysis__title="norm")
+        addition = AnalysisVersion.objects.get(analysis__title="addition")
+        node = NodeFactory(analysis_version=cls.norm)
+        cls.default_run = node.run({"x": [1, 2, 3]})
+        cls.other_input_run = node.run({"x": [1, 2, 3, 4]})
+        configured_node = NodeFactory(
+            analysis_version=cls.norm, configuration={"order": "-2"}
+        )
+        cls.configured_run = configured_node.run({"x": [1, 2, 3]})
+        NodeFactory(analysis_version=addition).run({"x": 1, "y": 2})
 
-#     def setUp(self):
-#         """
-#         Adds the created instances to the tests' contexts.
-#         For more information see unittest's :meth:`~unittest.TestCase.setUp` method.
+    def filter_runs(self, configuration, **kwargs) -> set:
+        runs = Run.objects.filter_by_configuration(
+            self.norm, configuration, **kwargs
+        )
+        return set(runs)
 
-#         """
-#         pass
+    def test_null_configuration(self):
+        expected = {
+            run
+            for run in Run.objects.filter(analysis_version=self.norm)
+            if run.check_null_configuration()
+        }
+        self.assertSetEqual(expected, {self.default_run, self.other_input_run})
+        self.assertSetEqual(self.filter_runs({}), expected)
 
-#     def test_run_with_no_user(self):
+    def test_single_query(self):
+        self.filter_runs({"order": "-2", "x": [1, 2, 3]})
+        with self.assertNumQueries(1):
+            runs = self.filter_runs({"order": "-2", "x": [1, 2, 3]})
+        self.assertSetEqual(runs, {self.configured_run})
+        with self.assertNumQueries(1):
+            self.filter_runs({})
 
+    def test_non_configuration_keys(self):
+        runs = self.filter_runs({"x": [1, 2, 3]})
+        self.assertSetEqual(runs, {self.default_run, self.configured_run})
+        runs = self.filter_runs({"x": [1, 2, 3]}, ignore_non_config=True)
+        self.assertEqual(len(runs), 3)
+
+    def test_multiple_configurations(self):
+        configurations = [{"order": "-2"}, {"x": [1, 2, 3, 4]}]
+        runs = self.filter_runs(configurations)
+        self.assertSetEqual(runs, {self.configured_run, self.other_input_run})
+
+    def test_invalid_key(self):
+        self.assertSetEqual(self.filter_runs({"invalid": 1}), set())
+        runs = self.filter_runs([{"invalid": 1}, {"order": "-2"}])
+        self.assertSetEqual(runs, {self.configured_run})
@@ -1,5 +1,11 @@
+from unittest import mock
+
+import numpy as np
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.utils.interface_pool import interface_pool
 from tests.factories.analysis import AnalysisFactory
 from tests.factories.analysis_version import AnalysisVersionFactory
 from tests.factories.input.definitions.float_input_definition import (
@@ -132,6 +138,184 @@ class AnalysisVersionTestCase(TestCase):
         run = self.addition_analysis_version.run_interface(x=1, y=2)
         self.assertEqual(run["result"], 3)
 
+    def test_get_batch_size_with_batch_size(self):
+        self.power_analysis_version.batch_size = 10
+        self.assertEqual(self.power_analysis_version.get_batch_size(100), 10)
+
+    def test_get_batch_size_from_max_parallel(self):
+        self.power_analysis_version.max_parallel = 4
+        self.assertEqual(self.power_analysis_version.get_batch_size(10), 3)
+
+    def test_get_batch_size_without_max_parallel(self):
+        self.power_analysis_version.max_parallel = 0
+        self.assertEqual(self.power_analysis_version.get_batch_size(10), 1)
+
+    def checkout(self, version: AnalysisVersion, **init_kwargs) -> Power:
+        with version.checkout_interface_instance(**init_kwargs) as instance:
+            return instance
+
+    def test_checkout_interface_instance_creates_new_instances(self):
+        version = self.power_analysis_version
+        version.reset_method_key = "reset"
+        with mock.patch.object(Power, "reset", create=True):
+            first = self.checkout(version, base=2, exponent=2)
+            second = self.checkout(version, base=2, exponent=2)
+        self.assertIsNot(first, second)
+
+    def test_reuse_interface_instances(self):
+        version = self.power_analysis_version
+        version.reset_method_key = "reset"
+        with mock.patch.object(Power, "reset", create=True):
+            with version.reuse_interface_instances():
+                first = self.checkout(version, base=2, exponent=2)
+                second = self.checkout(version, base=2, exponent=2)
+                other = self.checkout(version, base=3, exponent=2)
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_reuse_interface_instances_requires_reset_method(self):
+        version = self.power_analysis_version
+        with version.reuse_interface_instances():
+            first = self.checkout(version, base=2, exponent=2)
+            second = self.checkout(version, base=2, exponent=2)
+        self.assertIsNot(first, second)
+
+    def test_reuse_interface_instances_skips_non_primitive_kwargs(self):
+        version = self.power_analysis_version
+        version.reset_method_key = "reset"
+        with mock.patch.object(Power, "reset", create=True):
+            with version.reuse_interface_instances():
+                first = self.checkout(version, base=object(), exponent=2)
+                second = self.checkout(version, base=object(), exponent=2)
+        self.assertIsNot(first, second)
+
+    def test_checkout_reused_instance_resets_instance(self):
+        version = self.power_analysis_version
+        version.reset_method_key = "reset"
+        with mock.patch.object(Power, "reset", create=True) as reset:
+            with version.reuse_interface_instances():
+                with version.checkout_interface_instance(
+                    base=2, exponent=2
+                ) as first:
+                    pass
+                with version.checkout_interface_instance(
+                    base=2, exponent=2
+                ) as second:
+                    pass
+        self.assertIs(first, second)
+        self.assertEqual(reset.call_count, 2)
+
+    def test_checkout_reused_instance_discards_failing_reset(self):
+        version = self.power_analysis_version
+        version.reset_method_key = "reset"
+        with mock.patch.object(
+            Power, "reset", create=True, side_effect=RuntimeError
+        ):
+            with version.reuse_interface_instances():
+                with version.checkout_interface_instance(
+                    base=2, exponent=2
+                ) as first:
+                    pass
+                with version.checkout_interface_instance(
+                    base=2, exponent=2
+                ) as second:
+                    pass
+        self.assertIsNot(first, second)
+
+    def test_checkout_interface_instance_without_pool(self):
+        version = self.power_analysis_version
+        with version.checkout_interface_instance(base=2, exponent=2) as first:
+            pass
+        with version.checkout_interface_instance(base=2, exponent=2) as other:
+            pass
+        self.assertIsNot(first, other)
+        self.assertEqual(interface_pool.count(version.id), 0)
+
+    def test_checkout_interface_instance_with_pool(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        self.addCleanup(interface_pool.clear)
+        with version.checkout_interface_instance(base=2, exponent=2) as first:
+            pass
+        with version.checkout_interface_instance(base=2, exponent=2) as other:
+            pass
+        self.assertIs(first, other)
+        self.assertEqual(interface_pool.count(version.id), 1)
+
+    def test_interface_pool_evicts_least_recently_used(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        self.addCleanup(interface_pool.clear)
+        with version.checkout_interface_instance(base=2, exponent=2) as first:
+            pass
+        with version.checkout_interface_instance(base=3, exponent=2):
+            pass
+        with version.checkout_interface_instance(base=2, exponent=2) as other:
+            pass
+        self.assertIsNot(first, other)
+        self.assertEqual(interface_pool.count(version.id), 1)
+
+    def test_interface_pool_discards_failed_instances(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        self.addCleanup(interface_pool.clear)
+        with self.assertRaises(ValueError):
+            with version.checkout_interface_instance(base=2, exponent=2):
+                raise ValueError
+        self.assertEqual(interface_pool.count(version.id), 0)
+
+    def test_run_interface_resets_pooled_instance(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        version.reset_method_key = "reset"
+        self.addCleanup(interface_pool.clear)
+        with mock.patch.object(Power, "reset", create=True) as reset:
+            result = version.run_interface(base=2, exponent=2)
+        self.assertEqual(result, {"result": 4})
+        reset.assert_called_once_with()
+
+    def test_interface_pool_discards_instances_failing_to_reset(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        version.reset_method_key = "reset"
+        self.addCleanup(interface_pool.clear)
+        with mock.patch.object(
+            Power, "reset", create=True, side_effect=RuntimeError
+        ):
+            result = version.run_interface(base=2, exponent=2)
+        self.assertEqual(result, {"result": 4})
+        self.assertEqual(interface_pool.count(version.id), 0)
+
+    def test_interface_pool_skips_non_primitive_kwargs(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        self.addCleanup(interface_pool.clear)
+        # Long arrays with different values share the same str().
+        first_base = np.zeros(2000)
+        second_base = np.zeros(2000)
+        second_base[1000] = 1
+        self.assertEqual(str(first_base), str(second_base))
+        with version.checkout_interface_instance(
+            base=first_base, exponent=2
+        ) as first:
+            pass
+        with version.checkout_interface_instance(
+            base=second_base, exponent=2
+        ) as other:
+            pass
+        self.assertIsNot(first, other)
+        self.assertIs(other.base, second_base)
+        self.assertEqual(interface_pool.count(version.id), 0)
+
+    def test_interface_pool_cleared_on_save(self):
+        version = self.power_analysis_version
+        version.interface_pool_size = 1
+        self.addCleanup(interface_pool.clear)
+        with version.checkout_interface_instance(base=2, exponent=2):
+            pass
+        version.save()
+        self.assertEqual(interface_pool.count(version.id), 0)
+
     def test_extract_results_without_nested_attribute(self):
         run = self.power_analysis_version.run_interface(base=5, exponent=2)
         results = self.power_analysis_version.extract_results(run)
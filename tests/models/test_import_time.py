@@ -0,0 +1,66 @@
+import json
+import os
+import subprocess
+import sys
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+
+#: Modules that must not be loaded by importing the app's models.
+HEAVY_MODULES = ("matplotlib", "nibabel", "nilearn", "numpy", "pandas")
+
+#: Environment variable setting the maximal time (in seconds) taken to set up
+#: Django with the app installed. Timing is machine-dependent, so it is only
+#: checked if set.
+IMPORT_TIME_BUDGET_VARIABLE = "IMPORT_TIME_BUDGET"
+
+#: Number of measurements, the fastest of which is compared to the budget.
+N_MEASUREMENTS = 3
+
+MEASUREMENT_SCRIPT = f"""
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import django
+
+django.setup()
+import django_analyses.models  # noqa: F401
+
+elapsed = time.perf_counter() - start
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "loaded": loaded}}))
+"""
+
+
+class ImportTimeTestCase(SimpleTestCase):
+    """
+    Guards against heavy dependencies being imported when the app's models
+    are loaded (e.g. by Celery workers that never render previews).
+
+    """
+
+    def measure(self) -> dict:
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.test_settings"}
+        output = subprocess.run(
+            [sys.executable, "-c", MEASUREMENT_SCRIPT],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_models_import_is_light(self):
+        self.assertListEqual(self.measure()["loaded"], [])
+
+    @skipUnless(
+        IMPORT_TIME_BUDGET_VARIABLE in os.environ,
+        f"{IMPORT_TIME_BUDGET_VARIABLE} is not set",
+    )
+    def test_models_import_time(self):
+        budget = float(os.environ[IMPORT_TIME_BUDGET_VARIABLE])
+        measurements = [self.measure() for _ in range(N_MEASUREMENTS)]
+        elapsed = min(measurement["elapsed"] for measurement in measurements)
+        self.assertLess(elapsed, budget)
@@ -1,10 +1,18 @@
+import csv
+import io
+import shutil
 from pathlib import Path
+from unittest import mock
 
 from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
 from django.test import TestCase
 from django_analyses.models.analysis import Analysis
 from django_analyses.models.analysis_version import AnalysisVersion
 from django_analyses.models.run import Run
+from django_analyses.utils.run_cleanup import run_directory_cleanup
+from django_celery_results.models import TaskResult
 from tests.factories.input.types.string_input import StringInputFactory
 from tests.factories.pipeline.node import NodeFactory
 from tests.factories.run import RunFactory
@@ -103,17 +111,194 @@ class RunTestCase(TestCase):
         with self.assertRaises(Run.DoesNotExist):
             Run.objects.get(id=self.run.id)
 
+    def test_task_result_delete_keeps_run(self):
+        task_result = TaskResult.objects.create(task_id="task")
+        self.run.task_result = task_result
+        self.run.save()
+        task_result.delete()
+        self.run.refresh_from_db()
+        self.assertIsNone(self.run.task_result)
+
     def test_run_delete_with_media_dir(self):
         self.assertIsNone(self.run.path)
         base_path = getattr(settings, "ANALYSIS_BASE_PATH", "analysis")
         p = Path(base_path, str(self.run.id))
         p.mkdir(parents=True)
-        self.run.delete()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.run.delete()
+        run_directory_cleanup.wait()
         self.assertFalse(p.is_dir())
         with self.assertRaises(Run.DoesNotExist):
             Run.objects.get(id=self.run.id)
 
+    def test_run_delete_rollback_keeps_media_dir(self):
+        run_id = self.run.id
+        p = Path(settings.ANALYSIS_BASE_PATH, str(run_id))
+        p.mkdir(parents=True)
+        self.addCleanup(shutil.rmtree, p, ignore_errors=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.run.delete()
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        run_directory_cleanup.wait()
+        self.assertTrue(p.is_dir())
+        self.assertTrue(Run.objects.filter(id=run_id).exists())
+
+    def test_cleanup_run_directories(self):
+        base_path = Path(settings.ANALYSIS_BASE_PATH)
+        orphan = base_path / str(Run.objects.latest("id").id + 1)
+        existing = base_path / str(self.run.id)
+        for path in (orphan, existing):
+            path.mkdir(parents=True)
+            self.addCleanup(shutil.rmtree, path, ignore_errors=True)
+        stdout = io.StringIO()
+        call_command(
+            "cleanup_run_directories", dry_run=True, min_age=0, stdout=stdout
+        )
+        self.assertIn(str(orphan), stdout.getvalue())
+        self.assertTrue(orphan.is_dir())
+        call_command("cleanup_run_directories", verbosity=0)
+        self.assertTrue(orphan.is_dir())
+        call_command("cleanup_run_directories", min_age=0, verbosity=0)
+        self.assertFalse(orphan.is_dir())
+        self.assertTrue(existing.is_dir())
+
     def test_get_output(self):
         result = self.addition_run.get_output("result")
         self.assertEqual(result, 2)
 
+    def test_with_io(self):
+        runs = list(Run.objects.filter(id=self.addition_run.id).with_io())
+        # Populate the definition cache.
+        self.addition.input_specification.get_definitions_by_key()
+        self.addition.output_specification.get_definitions_by_key()
+        with self.assertNumQueries(0):
+            run = runs[0]
+            self.assertEqual(run.get_input("x"), 1)
+            self.assertEqual(run.get_output("result"), 2)
+            self.assertEqual(run.get_results_json(), {"result": 2})
+
+    def test_with_io_query_count(self):
+        for y in range(2, 5):
+            self.addition_node.run(inputs={"x": 1, "y": y})
+        # Populate the definition cache.
+        self.addition_run.get_results_json()
+        with self.assertNumQueries(3):
+            results = [
+                run.get_results_json()
+                for run in Run.objects.filter(
+                    analysis_version=self.addition
+                ).with_io()
+            ]
+        self.assertEqual(len(results), 4)
+
+    def test_get_input_configuration_with_io(self):
+        run = Run.objects.with_io().get(id=self.addition_run.id)
+        self.assertEqual(run.get_input_configuration(), {"x": 1, "y": 1})
+
+    def test_export_results_to_csv(self):
+        second_run = self.addition_node.run(inputs={"x": 1, "y": 2})
+        runs = Run.objects.filter(analysis_version=self.addition)
+        destination = io.StringIO()
+        runs.export_results(destination, chunk_size=1)
+        destination.seek(0)
+        rows = list(csv.DictReader(destination))
+        expected = [
+            {"run_id": str(self.addition_run.id), "result": "2.0"},
+            {"run_id": str(second_run.id), "result": "3.0"},
+        ]
+        self.assertListEqual(rows, expected)
+
+    def test_export_results_with_invalid_format(self):
+        with self.assertRaises(ValueError):
+            Run.objects.export_results(io.StringIO(), file_format="xlsx")
+
+    def test_configuration_fingerprint_set_on_creation(self):
+        expected = self.addition_run.get_configuration_fingerprint()
+        self.assertEqual(
+            self.addition_run.configuration_fingerprint, expected
+        )
+
+    def create_failed_run_without_inputs(self) -> Run:
+        with mock.patch(
+            "django_analyses.models.managers.run.InputManager"
+            ".create_input_instances",
+            side_effect=ValueError,
+        ):
+            run = Run.objects.create_and_execute(
+                self.addition, {"x": 2, "y": 2}
+            )
+        run.refresh_from_db()
+        return run
+
+    def test_configuration_fingerprint_cleared_on_input_failure(self):
+        run = self.create_failed_run_without_inputs()
+        self.assertEqual(run.status, "FAILURE")
+        self.assertIsNone(run.configuration_fingerprint)
+
+    def test_configuration_fingerprint_kept_on_execution_failure(self):
+        with mock.patch.object(
+            AnalysisVersion, "run", side_effect=RuntimeError
+        ):
+            run = Run.objects.create_and_execute(
+                self.addition, {"x": 2, "y": 2}
+            )
+        run.refresh_from_db()
+        self.assertEqual(run.status, "FAILURE")
+        self.assertEqual(
+            run.configuration_fingerprint,
+            run.get_configuration_fingerprint(),
+        )
+
+    def test_get_existing_by_fingerprint(self):
+        existing = Run.objects.get_existing(self.addition, {"x": 1.0, "y": 1})
+        self.assertEqual(existing, self.addition_run)
+
+    def test_get_existing_legacy_run(self):
+        Run.objects.filter(id=self.addition_run.id).update(
+            configuration_fingerprint=None
+        )
+        existing = Run.objects.get_existing(self.addition, {"x": 1, "y": 1})
+        self.assertEqual(existing, self.addition_run)
+
+    def test_get_existing_legacy_run_queries(self):
+        Run.objects.filter(id=self.addition_run.id).update(
+            configuration_fingerprint=None
+        )
+        self.create_failed_run_without_inputs()
+        Run.objects.get_existing(self.addition, {"x": 1, "y": 1})
+        with self.assertNumQueries(3):
+            existing = Run.objects.get_existing(
+                self.addition, {"x": 1, "y": 1}
+            )
+        self.assertEqual(existing, self.addition_run)
+
+    def test_exclude_failed_without_inputs(self):
+        run = self.create_failed_run_without_inputs()
+        runs = Run.objects.exclude_failed_without_inputs()
+        self.assertNotIn(run, runs)
+        self.assertIn(self.addition_run, runs)
+
+    def test_get_existing_no_match(self):
+        with self.assertRaises(Run.DoesNotExist):
+            Run.objects.get_existing(self.addition, {"x": 1, "y": 2})
+
+    def test_backfill_run_fingerprints(self):
+        Run.objects.filter(id=self.addition_run.id).update(
+            configuration_fingerprint=None
+        )
+        call_command("backfill_run_fingerprints", verbosity=0)
+        self.addition_run.refresh_from_db()
+        expected = self.addition_run.get_configuration_fingerprint()
+        self.assertEqual(
+            self.addition_run.configuration_fingerprint, expected
+        )
+
+    def test_backfill_run_fingerprints_skips_failed_runs_without_inputs(self):
+        run = self.create_failed_run_without_inputs()
+        call_command("backfill_run_fingerprints", verbosity=0)
+        run.refresh_from_db()
+        self.assertIsNone(run.configuration_fingerprint)
@@ -0,0 +1,114 @@
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django_analyses.models.run import Run
+from django_analyses.models.run_status_count import RunStatusCount
+from django_analyses.signals import COUNTED_STATUS_ATTRIBUTE
+from tests.factories.analysis_version import AnalysisVersionFactory
+from tests.factories.run import RunFactory
+
+
+@override_settings(ANALYSIS_RUN_STATUS_COUNTERS=True)
+class RunStatusCountTestCase(TestCase):
+    """
+    Tests for the
+    :class:`~django_analyses.models.run_status_count.RunStatusCount` model.
+
+    """
+
+    def setUp(self):
+        self.analysis_version = AnalysisVersionFactory()
+        self.runs = [
+            RunFactory(analysis_version=self.analysis_version, status=status)
+            for status in ("STARTED", "STARTED", "SUCCESS")
+        ]
+
+    def get_expected_counts(self) -> dict:
+        rows = (
+            Run.objects.filter(status__isnull=False)
+            .order_by()
+            .values_list("analysis_version", "status")
+            .annotate(count=Count("id"))
+        )
+        counts = {}
+        for analysis_version_id, status, count in rows:
+            counts.setdefault(analysis_version_id, {})[status] = count
+        return counts
+
+    def test_counters_follow_run_changes(self):
+        started = self.runs[0]
+        started.status = "SUCCESS"
+        started.save(update_fields=["status"])
+        reloaded = Run.objects.get(id=self.runs[1].id)
+        reloaded.status = "FAILURE"
+        reloaded.save()
+        self.runs[2].delete()
+        counts = RunStatusCount.objects.get_counts()
+        self.assertDictEqual(counts, self.get_expected_counts())
+        expected = {"STARTED": 0, "SUCCESS": 1, "FAILURE": 1}
+        version_counts = counts[self.analysis_version.id]
+        for status, count in expected.items():
+            self.assertEqual(version_counts.get(status, 0), count)
+
+    def test_rebuild(self):
+        RunStatusCount.objects.all().delete()
+        call_command("rebuild_run_status_counts", verbosity=0)
+        counts = RunStatusCount.objects.get_counts()
+        self.assertDictEqual(counts, self.get_expected_counts())
+
+    def test_loaded_run_status_is_recorded(self):
+        run = Run.objects.get(id=self.runs[0].id)
+        self.assertIn(COUNTED_STATUS_ATTRIBUTE, run.__dict__)
+
+    @override_settings(ANALYSIS_RUN_STATUS_COUNTERS=False)
+    def test_loaded_run_status_is_not_recorded_without_counters(self):
+        run = Run.objects.get(id=self.runs[0].id)
+        self.assertNotIn(COUNTED_STATUS_ATTRIBUTE, run.__dict__)
+
+    @override_settings(ANALYSIS_RUN_STATUS_COUNTERS=False)
+    def test_get_counts_without_counters(self):
+        RunStatusCount.objects.all().delete()
+        with self.assertNumQueries(1):
+            counts = RunStatusCount.objects.get_counts(
+                [self.analysis_version.id]
+            )
+        expected = {self.analysis_version.id: {"STARTED": 2, "SUCCESS": 1}}
+        self.assertDictEqual(counts, expected)
+
+    def test_summary(self):
+        start_time = timezone.now()
+        for seconds in range(1, 21):
+            RunFactory(
+                analysis_version=self.analysis_version,
+                status="SUCCESS",
+                start_time=start_time,
+                end_time=start_time + timedelta(seconds=seconds),
+            )
+        pending = RunFactory(analysis_version=self.analysis_version)
+        pending.status = "FAILURE"
+        pending.start_time = start_time
+        pending.end_time = start_time + timedelta(seconds=21)
+        pending.save()
+        with self.assertNumQueries(2):
+            summary = RunStatusCount.objects.get_summary(
+                [self.analysis_version.id]
+            )
+        with override_settings(ANALYSIS_RUN_STATUS_COUNTERS=False):
+            computed = RunStatusCount.objects.get_summary(
+                [self.analysis_version.id]
+            )
+        self.assertListEqual(summary, computed)
+        result = summary[0]
+        self.assertEqual(result["total"], 24)
+        self.assertEqual(result["PENDING"], 0)
+        self.assertEqual(result["STARTED"], 2)
+        self.assertEqual(result["SUCCESS"], 21)
+        self.assertEqual(result["FAILURE"], 1)
+        self.assertAlmostEqual(result["mean_duration"], 11)
+        # The 95th percentile (~20s) is interpolated within the (15, 30]
+        # bucket.
+        self.assertGreater(result["p95_duration"], 15)
+        self.assertLessEqual(result["p95_duration"], 30)
@@ -0,0 +1,90 @@
+from django.test import TestCase
+from django_analyses.models.input.input import Input
+from django_analyses.models.input.types.float_input import FloatInput
+from django_analyses.models.input.types.number_input import NumberInput
+from django_analyses.models.input.types.string_input import StringInput
+from django_analyses.models.utils.bulk_create import (
+    bulk_create_subclass_instances,
+)
+from tests.factories.input.definitions.float_input_definition import (
+    FloatInputDefinitionFactory,
+)
+from tests.factories.input.definitions.string_input_definition import (
+    StringInputDefinitionFactory,
+)
+from tests.factories.run import RunFactory
+
+
+class BulkCreateSubclassInstancesTestCase(TestCase):
+    """
+    Tests for the
+    :func:`~django_analyses.models.utils.bulk_create.bulk_create_subclass_instances`
+    function.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.input_run = RunFactory()
+        cls.float_definition = FloatInputDefinitionFactory(
+            min_value=None, max_value=None
+        )
+        cls.string_definition = StringInputDefinitionFactory(
+            min_length=None, max_length=None
+        )
+
+    def build_float_input(self, value: float) -> FloatInput:
+        return FloatInput(
+            run=self.input_run, definition=self.float_definition, value=value
+        )
+
+    def build_string_input(self, value: str) -> StringInput:
+        return StringInput(
+            run=self.input_run, definition=self.string_definition, value=value
+        )
+
+    def test_parent_primary_keys_are_propagated(self):
+        instances = [self.build_float_input(value) for value in (1.0, 2.0)]
+        created = bulk_create_subclass_instances(Input, instances)
+        self.assertIs(created, instances)
+        for instance in instances:
+            self.assertIsNotNone(instance.pk)
+            self.assertEqual(instance.input_ptr_id, instance.pk)
+            self.assertEqual(instance.numberinput_ptr_id, instance.pk)
+            self.assertFalse(instance._state.adding)
+        pks = [instance.pk for instance in instances]
+        self.assertEqual(Input.objects.filter(pk__in=pks).count(), 2)
+        self.assertEqual(NumberInput.objects.filter(pk__in=pks).count(), 2)
+        values = FloatInput.objects.filter(pk__in=pks).values_list(
+            "value", flat=True
+        )
+        self.assertListEqual(sorted(values), [1.0, 2.0])
+
+    def test_multiple_subclasses(self):
+        instances = [
+            self.build_float_input(1.0),
+            self.build_string_input("a"),
+            self.build_float_input(2.0),
+            self.build_string_input("b"),
+        ]
+        bulk_create_subclass_instances(Input, instances, batch_size=1)
+        saved = Input.objects.filter(run=self.input_run).select_subclasses()
+        self.assertSetEqual(
+            {(type(instance), instance.value) for instance in saved},
+            {
+                (FloatInput, 1.0),
+                (StringInput, "a"),
+                (FloatInput, 2.0),
+                (StringInput, "b"),
+            },
+        )
+        pks = [instance.pk for instance in instances]
+        run_ids = Input.objects.filter(pk__in=pks).values_list(
+            "run", flat=True
+        )
+        self.assertSetEqual(set(run_ids), {self.input_run.id})
+
+    def test_empty_list(self):
+        with self.assertNumQueries(0):
+            created = bulk_create_subclass_instances(Input, [])
+        self.assertListEqual(created, [])
@@ -0,0 +1,38 @@
+import tempfile
+from pathlib import Path
+
+import nibabel as nib
+import numpy as np
+from django.test import SimpleTestCase
+from django_analyses.models.utils.html_repr import load_preview_volume
+
+
+class LoadPreviewVolumeTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :func:`~django_analyses.models.utils.html_repr.load_preview_volume`
+    function.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "volume.nii"
+        data = np.arange(20 * 20 * 20, dtype=np.int16).reshape(20, 20, 20)
+        affine = np.diag([0.5, 0.5, 0.5, 1])
+        nib.save(nib.Nifti1Image(data, affine), self.path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_downsampled_volume(self):
+        volume = load_preview_volume(self.path, max_voxels=1000)
+        self.assertTupleEqual(volume.shape, (10, 10, 10))
+        self.assertEqual(volume.get_data_dtype(), np.int16)
+        np.testing.assert_array_equal(
+            np.diag(volume.affine), [1.0, 1.0, 1.0, 1.0]
+        )
+
+    def test_small_volume_is_not_downsampled(self):
+        volume = load_preview_volume(self.path, max_voxels=10000)
+        self.assertTupleEqual(volume.shape, (20, 20, 20))
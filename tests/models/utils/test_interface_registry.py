@@ -0,0 +1,58 @@
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.module_loading import import_string
+from django_analyses.models.utils.interface_registry import (
+    interface_registry,
+)
+from tests.interfaces import Addition, Power
+
+INTERFACES = {
+    "addition": {"1.0": Addition},
+    "power": {"1.0": "tests.interfaces.Power"},
+}
+
+
+@override_settings(ANALYSIS_INTERFACES=INTERFACES)
+class InterfaceRegistryTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :class:`~django_analyses.models.utils.interface_registry.InterfaceRegistry`
+    class.
+
+    """
+
+    def setUp(self):
+        interface_registry.clear()
+
+    def test_dotted_paths_are_imported_once(self):
+        with mock.patch(
+            "django_analyses.models.utils.interface_registry.import_string",
+            wraps=import_string,
+        ) as mocked_import_string:
+            for _ in range(3):
+                interface = interface_registry.get("power", "1.0")
+        self.assertIs(interface, Power)
+        mocked_import_string.assert_called_once_with("tests.interfaces.Power")
+
+    def test_classes_are_returned_as_is(self):
+        self.assertIs(interface_registry.get("addition", "1.0"), Addition)
+
+    def test_missing_interface(self):
+        with self.assertRaises(KeyError):
+            interface_registry.get("power", "2.0")
+
+    def test_warm(self):
+        self.assertEqual(interface_registry.warm(), 2)
+        self.assertSetEqual(
+            set(interface_registry.resolved),
+            {("addition", "1.0"), ("power", "1.0")},
+        )
+
+    def test_cache_is_cleared_when_settings_change(self):
+        interface_registry.warm()
+        interfaces = {"power": {"1.0": Addition}}
+        with override_settings(ANALYSIS_INTERFACES=interfaces):
+            self.assertEqual(interface_registry.resolved, ())
+            self.assertIs(interface_registry.get("power", "1.0"), Addition)
+        self.assertIs(interface_registry.get("power", "1.0"), Power)
@@ -0,0 +1,67 @@
+import os
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+from django_analyses.models.utils.preview_cache import preview_cache
+
+
+class PreviewCacheTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :class:`~django_analyses.models.utils.preview_cache.PreviewCache` class.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        self.cache_dir = root / "cache"
+        self.path = root / "lh.thickness"
+        self.path.write_bytes(b"data")
+        self.settings_override = override_settings(
+            ANALYSIS_PREVIEW_CACHE_DIR=str(self.cache_dir),
+            ANALYSIS_PREVIEW_CACHE_SIZE=350,
+        )
+        self.settings_override.enable()
+        self.renders = []
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.temp_dir.cleanup()
+
+    def render(self, content: str = "<div>preview</div>"):
+        self.renders.append(content)
+        return content
+
+    def test_cached_preview_is_not_rendered_again(self):
+        for _ in range(3):
+            content = preview_cache.get_or_render(
+                self.path, self.render, width=10
+            )
+            self.assertEqual(content, "<div>preview</div>")
+        self.assertEqual(len(self.renders), 1)
+
+    def test_key_depends_on_file_and_parameters(self):
+        key = preview_cache.get_key(self.path, width=10)
+        self.assertNotEqual(key, preview_cache.get_key(self.path, width=20))
+        self.path.write_bytes(b"modified")
+        self.assertNotEqual(key, preview_cache.get_key(self.path, width=10))
+
+    def test_least_recently_used_previews_are_evicted(self):
+        keys = [preview_cache.get_key(self.path, index=i) for i in range(3)]
+        for i, key in enumerate(keys):
+            preview_cache.set(key, "x" * 100)
+            # Ensure distinct access times.
+            os.utime(preview_cache.get_path(key), ns=(i, i))
+        preview_cache.get(keys[0])
+        preview_cache.set(preview_cache.get_key(self.path, index=3), "x" * 100)
+        self.assertIsNotNone(preview_cache.get(keys[0]))
+        self.assertIsNone(preview_cache.get(keys[1]))
+
+    @override_settings(ANALYSIS_PREVIEW_CACHE_DIR=None)
+    def test_disabled_cache(self):
+        for _ in range(2):
+            preview_cache.get_or_render(self.path, self.render)
+        self.assertEqual(len(self.renders), 2)
+        self.assertFalse(self.cache_dir.exists())
@@ -0,0 +1,207 @@
+from unittest import mock
+
+from celery import current_app
+from celery.result import GroupResult
+from django.test import TestCase
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.run import Run
+from django_analyses.runner.queryset_runner import QuerySetRunner
+from tests.fixtures import ANALYSES
+
+
+class PowerRunner(QuerySetRunner):
+    DATA_MODEL = Analysis
+    ANALYSIS_TITLE = "power"
+    ANALYSIS_VERSION_TITLE = "1.0"
+    ANALYSIS_CONFIGURATION = {"exponent": 2}
+    INPUT_KEY = "base"
+
+    def get_instance_representation(self, instance: Analysis) -> float:
+        return float(instance.id)
+
+
+class DefaultRepresentationPowerRunner(QuerySetRunner):
+    DATA_MODEL = Analysis
+    ANALYSIS_TITLE = "power"
+    ANALYSIS_VERSION_TITLE = "1.0"
+    ANALYSIS_CONFIGURATION = {"exponent": 2}
+    INPUT_KEY = "base"
+
+
+class InputValueFieldPowerRunner(PowerRunner):
+    INPUT_VALUE_FIELD = "id"
+
+
+class QuerySetRunnerTestCase(TestCase):
+    """
+    Tests for the streaming execution of the
+    :class:`~django_analyses.runner.queryset_runner.QuerySetRunner` class.
+    Tasks are executed eagerly.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        cls.power = AnalysisVersion.objects.get(analysis__title="power")
+
+    def setUp(self):
+        eager = current_app.conf.task_always_eager
+        current_app.conf.task_always_eager = True
+        self.addCleanup(setattr, current_app.conf, "task_always_eager", eager)
+        self.runner = PowerRunner()
+        self.queryset = Analysis.objects.order_by("id")
+        self.inputs = [
+            self.runner.create_input_specification(instance)
+            for instance in self.queryset.all()
+        ]
+
+    def test_dispatch_batch(self):
+        result = self.runner.dispatch_batch(self.inputs)
+        self.assertIsInstance(result, GroupResult)
+        self.assertEqual(len(result), len(self.inputs))
+        self.assertEqual(Run.objects.count(), len(self.inputs))
+
+    def test_dispatch_batch_with_task_batch_size(self):
+        self.power.batch_size = 2
+        self.power.save()
+        result = self.runner.dispatch_batch(self.inputs)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(Run.objects.count(), len(self.inputs))
+
+    def test_wait_for_batch(self):
+        result = self.runner.dispatch_batch(self.inputs)
+        self.runner.wait_for_batch(result)
+        self.assertTrue(result.ready())
+
+    def test_wait_for_batch_within_task_raises_runtime_error(self):
+        result = self.runner.dispatch_batch(self.inputs)
+        with mock.patch(
+            "django_analyses.runner.queryset_runner.current_task"
+        ):
+            with self.assertRaises(RuntimeError):
+                self.runner.wait_for_batch(result)
+
+    def test_run_in_batches(self):
+        n_inputs = self.runner.run_in_batches(
+            self.queryset, batch_size=2, progressbar=False
+        )
+        self.assertEqual(n_inputs, len(self.inputs))
+        bases = {
+            run.input_configuration["base"] for run in Run.objects.all()
+        }
+        expected = {float(instance.id) for instance in self.queryset.all()}
+        self.assertSetEqual(bases, expected)
+
+    def test_run_in_batches_waits_for_in_flight_batches(self):
+        with mock.patch.object(
+            PowerRunner, "wait_for_batch", autospec=True
+        ) as wait_for_batch:
+            self.runner.run_in_batches(
+                self.queryset, batch_size=1, max_in_flight=1, progressbar=False
+            )
+        self.assertEqual(wait_for_batch.call_count, len(self.inputs) - 1)
+
+    def test_run_in_batches_with_max_total(self):
+        n_inputs = self.runner.run_in_batches(
+            self.queryset, batch_size=2, max_total=1, progressbar=False
+        )
+        self.assertEqual(n_inputs, 1)
+        self.assertEqual(Run.objects.count(), 1)
+
+    def test_run_in_batches_dry(self):
+        n_inputs = self.runner.run_in_batches(
+            self.queryset, batch_size=2, progressbar=False, dry=True
+        )
+        self.assertEqual(n_inputs, len(self.inputs))
+        self.assertFalse(Run.objects.exists())
+
+    def test_run_in_batches_within_task_raises_runtime_error(self):
+        with mock.patch(
+            "django_analyses.runner.queryset_runner.current_task"
+        ):
+            with self.assertRaises(RuntimeError):
+                self.runner.run_in_batches(
+                    self.queryset,
+                    batch_size=1,
+                    max_in_flight=1,
+                    progressbar=False,
+                )
+        self.assertFalse(Run.objects.exists())
+
+
+class QuerySetRunnerSplitTestCase(TestCase):
+    """
+    Tests for splitting querysets to instances with and without existing
+    runs using the
+    :class:`~django_analyses.runner.queryset_runner.QuerySetRunner` class.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        eager = current_app.conf.task_always_eager
+        current_app.conf.task_always_eager = True
+        try:
+            runner = PowerRunner()
+            instances = Analysis.objects.order_by("id")[:2]
+            runner.dispatch_batch(
+                [runner.create_input_specification(i) for i in instances]
+            )
+        finally:
+            current_app.conf.task_always_eager = eager
+
+    def setUp(self):
+        self.queryset = Analysis.objects.order_by("id")
+        ids = list(self.queryset.values_list("id", flat=True))
+        self.existing_ids, self.pending_ids = set(ids[:2]), set(ids[2:])
+
+    def split(self, runner: QuerySetRunner, queryset, n_queries: int):
+        # Warm up the runner's cached node and input set queries.
+        runner.input_set
+        field = runner.get_representation_field()
+        with self.assertNumQueries(n_queries):
+            if field is None:
+                existing, pending = runner.split_by_representation(queryset)
+            else:
+                existing, pending = runner.split_by_field(queryset, field)
+            existing_ids = {instance.id for instance in existing}
+            pending_ids = {instance.id for instance in pending}
+        return existing_ids, pending_ids
+
+    def test_split_by_default_representation(self):
+        runner = DefaultRepresentationPowerRunner()
+        self.assertEqual(runner.get_representation_field(), "pk")
+        existing, pending = self.split(runner, self.queryset.all(), 2)
+        self.assertSetEqual(existing, self.existing_ids)
+        self.assertSetEqual(pending, self.pending_ids)
+
+    def test_split_sliced_queryset_by_default_representation(self):
+        runner = DefaultRepresentationPowerRunner()
+        # The sliced queryset is evaluated to a list of IDs first.
+        existing, pending = self.split(runner, self.queryset.all()[1:], 3)
+        expected = self.existing_ids - {min(self.existing_ids)}
+        self.assertSetEqual(existing, expected)
+        self.assertSetEqual(pending, self.pending_ids)
+
+    def test_split_by_input_value_field(self):
+        runner = InputValueFieldPowerRunner()
+        self.assertEqual(runner.get_representation_field(), "id")
+        existing, pending = self.split(runner, self.queryset.all(), 2)
+        self.assertSetEqual(existing, self.existing_ids)
+        self.assertSetEqual(pending, self.pending_ids)
+
+    def test_split_by_representation(self):
+        runner = PowerRunner()
+        self.assertIsNone(runner.get_representation_field())
+        existing, pending = self.split(runner, self.queryset.all(), 4)
+        self.assertSetEqual(existing, self.existing_ids)
+        self.assertSetEqual(pending, self.pending_ids)
+        has_run = {
+            instance.id
+            for instance in self.queryset.all()
+            if runner.has_run(instance)
+        }
+        self.assertSetEqual(existing, has_run)
@@ -0,0 +1,74 @@
+from django.contrib.admin.sites import site
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.pipeline.pipeline import Pipeline
+from django_analyses.models.run import Run
+from tests.factories.analysis_version import AnalysisVersionFactory
+from tests.factories.pipeline.pipe import PipeFactory
+from tests.factories.run import RunFactory
+
+
+class RunCountAnnotationTestCase(TestCase):
+    """
+    Tests for the run count columns of the analysis and analysis version
+    admins.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.analysis_versions = [AnalysisVersionFactory() for _ in range(3)]
+        for index, analysis_version in enumerate(cls.analysis_versions):
+            for _ in range(index):
+                RunFactory(analysis_version=analysis_version, status="SUCCESS")
+
+    def get_run_counts(self, model) -> dict:
+        model_admin = site._registry[model]
+        request = RequestFactory().get("/")
+        with self.assertNumQueries(1):
+            queryset = list(model_admin.get_queryset(request))
+        return {
+            instance.id: model_admin.run_count(instance)
+            for instance in queryset
+        }
+
+    def assert_run_counts(self):
+        for model, lookup in (
+            (AnalysisVersion, "analysis_version"),
+            (Analysis, "analysis_version__analysis"),
+        ):
+            run_counts = self.get_run_counts(model)
+            for instance_id, run_count in run_counts.items():
+                expected = Run.objects.filter(**{lookup: instance_id}).count()
+                self.assertEqual(run_count, expected)
+
+    def test_run_counts(self):
+        self.assert_run_counts()
+
+    @override_settings(ANALYSIS_RUN_STATUS_COUNTERS=True)
+    def test_run_counts_from_counters(self):
+        call_command("rebuild_run_status_counts", verbosity=0)
+        self.assert_run_counts()
+
+
+class PipelineAdminTestCase(TestCase):
+    """
+    Tests for the node and pipe count columns of the pipeline admin.
+
+    """
+
+    def test_node_and_pipe_counts(self):
+        first = PipeFactory()
+        # A second pipe sharing the first pipe's destination node.
+        PipeFactory(pipeline=first.pipeline, source=first.destination)
+        model_admin = site._registry[Pipeline]
+        request = RequestFactory().get("/")
+        with self.assertNumQueries(1):
+            pipeline = model_admin.get_queryset(request).get()
+        self.assertEqual(model_admin.node_count(pipeline), 3)
+        self.assertEqual(model_admin.pipe_count(pipeline), 2)
+        self.assertEqual(
+            model_admin.node_count(pipeline), pipeline.node_set.count()
+        )
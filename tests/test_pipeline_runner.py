@@ -1,4 +1,6 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, TransactionTestCase, override_settings
 from django_analyses.models.analysis import Analysis
 from django_analyses.models.analysis_version import AnalysisVersion
 from django_analyses.models.pipeline.node import Node
@@ -75,6 +77,40 @@ class PipelineRunnerTestCase(TestCase):
         self.assertIn(self.addition_to_power_pipe, power_incoming)
         self.assertIn(self.norm_to_power_pipe, power_incoming)
 
+    def test_plan_steps_are_topologically_sorted(self):
+        steps = self.pipeline_runner.plan.steps
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(steps[-1], (self.power_node, 0))
+
+    def test_plan_is_cached(self):
+        plan = self.pipeline.get_execution_plan()
+        with self.assertNumQueries(0):
+            self.assertIs(self.pipeline.get_execution_plan(), plan)
+
+    def test_plan_is_invalidated_on_pipe_change(self):
+        plan = self.pipeline.get_execution_plan()
+        self.norm_to_power_pipe.save()
+        self.assertIsNot(self.pipeline.get_execution_plan(), plan)
+
+    def test_plan_expires(self):
+        plan = self.pipeline.get_execution_plan()
+        with override_settings(ANALYSIS_EXECUTION_PLAN_TTL=0):
+            self.assertIsNot(self.pipeline.get_execution_plan(), plan)
+
+    def test_plan_with_cycle_raises_value_error(self):
+        pipeline = PipelineFactory()
+        addition_output = self.addition.output_definitions.get(key="result")
+        addition_input = self.addition.input_definitions.get(key="x")
+        PipeFactory(
+            pipeline=pipeline,
+            source=self.addition_node,
+            base_source_port=addition_output,
+            destination=self.addition_node,
+            base_destination_port=addition_input,
+        )
+        with self.assertRaises(ValueError):
+            pipeline.get_execution_plan()
+
     def test_run_entry_nodes(self):
         inputs = {
             self.addition_node: [{"x": 1, "y": 2}],
@@ -243,6 +279,104 @@ class PipelineRunnerTestCase(TestCase):
         norm_expected = 6.082762530298219
         self.assertAlmostEqual(norm_result, norm_expected)
 
+    def test_get_canvas(self):
+        pipeline = Pipeline.objects.get(title="Test Pipeline 1")
+        runner = PipelineRunner(pipeline=pipeline, quiet=True)
+        square_node = Node.objects.get(
+            analysis_version=self.power, configuration={"exponent": 2}
+        )
+        inputs = {
+            self.addition_node.id: [{"x": 1, "y": 1}, {"x": 1, "y": 1}],
+            square_node.id: [{"base": 1}],
+        }
+        results = runner.get_canvas(inputs).apply().get()
+        addition_results = [
+            result["result"] for result in results[self.addition_node.id]
+        ]
+        self.assertListEqual(addition_results, [2.0, 2.0, 6.0])
+        power_results = [
+            result["result"] for result in results[square_node.id]
+        ]
+        self.assertListEqual(power_results, [1.0, 4.0])
+        norm_result = results[self.norm_node.id][0]["norm"]
+        self.assertAlmostEqual(norm_result, 6.082762530298219)
+
+    def test_get_canvas_failure_skips_dependent_steps(self):
+        pipeline = Pipeline.objects.get(title="Test Pipeline 1")
+        runner = PipelineRunner(pipeline=pipeline, quiet=True)
+        square_node = Node.objects.get(
+            analysis_version=self.power, configuration={"exponent": 2}
+        )
+        inputs = {
+            self.addition_node.id: [{"x": 1, "y": 1}, {"x": 1}],
+            square_node.id: [{"base": 1}],
+        }
+        with self.assertRaises(RuntimeError):
+            runner.get_canvas(inputs).apply().get()
+        # Independent branches are still executed.
+        square_runs = Run.objects.filter(analysis_version=self.power)
+        square_results = {run.get_output("result") for run in square_runs}
+        self.assertSetEqual(square_results, {1.0, 4.0})
+        norm_runs = Run.objects.filter(analysis_version=self.norm)
+        self.assertFalse(norm_runs.exists())
+
+    def create_branched_pipeline(self) -> tuple:
+        pipeline = PipelineFactory()
+        cube_node = NodeFactory(
+            analysis_version=self.power, configuration={"exponent": 3}
+        )
+        fourth_power_node = NodeFactory(
+            analysis_version=self.power, configuration={"exponent": 4}
+        )
+        base_input = self.power.input_definitions.get(key="base")
+        PipeFactory(
+            pipeline=pipeline,
+            source=self.addition_node,
+            base_source_port=self.addition.output_definitions.get(
+                key="result"
+            ),
+            destination=cube_node,
+            base_destination_port=base_input,
+        )
+        PipeFactory(
+            pipeline=pipeline,
+            source=self.norm_node,
+            base_source_port=self.norm.output_definitions.get(key="norm"),
+            destination=fourth_power_node,
+            base_destination_port=base_input,
+        )
+        return pipeline, cube_node, fourth_power_node
+
+    def test_plan_branches(self):
+        plan = self.pipeline.get_execution_plan()
+        self.assertListEqual(plan.get_branches(), [plan.steps])
+        pipeline, cube_node, fourth_power_node = (
+            self.create_branched_pipeline()
+        )
+        plan = pipeline.get_execution_plan()
+        self.assertListEqual(
+            plan.get_branches(),
+            [
+                [(self.addition_node, 0), (cube_node, 0)],
+                [(self.norm_node, 0), (fourth_power_node, 0)],
+            ],
+        )
+
+    def test_get_canvas_with_independent_branches(self):
+        pipeline, cube_node, fourth_power_node = (
+            self.create_branched_pipeline()
+        )
+        runner = PipelineRunner(pipeline=pipeline, quiet=True)
+        inputs = {
+            self.addition_node.id: [{"x": 1, "y": 1}],
+            self.norm_node.id: [{"x": [3, 4]}],
+        }
+        results = runner.get_canvas(inputs).apply().get()
+        self.assertEqual(results[cube_node.id][0]["result"], 8.0)
+        self.assertAlmostEqual(
+            results[fourth_power_node.id][0]["result"], 625.0
+        )
+
     def test_listinput_indices(self):
         pipeline = Pipeline.objects.get(title="Test Pipeline 1")
         runner = PipelineRunner(pipeline=pipeline, quiet=False)
@@ -257,3 +391,62 @@ class PipelineRunnerTestCase(TestCase):
         norm_run = results[self.norm_node][0]
         x = norm_run.input_configuration["x"]
         self.assertListEqual(x, [6.0, 1.0])
+
+
+class ConcurrentPipelineRunnerTestCase(TransactionTestCase):
+    """
+    Tests for the concurrent execution of pipelines by the
+    :class:`~django_analyses.pipeline_runner.PipelineRunner` class.
+    Nodes are executed by separate processes, so data must be committed.
+
+    """
+
+    def setUp(self):
+        """
+        For more information see unittest's :meth:`~unittest.TestCase.setUp`
+        method.
+
+        """
+
+        Analysis.objects.from_list(ANALYSES)
+        Pipeline.objects.from_list(PIPELINES)
+        self.pipeline = Pipeline.objects.get(title="Test Pipeline 1")
+        self.addition = AnalysisVersion.objects.get(analysis__title="addition")
+        self.power = AnalysisVersion.objects.get(analysis__title="power")
+        self.norm = AnalysisVersion.objects.get(analysis__title="norm")
+
+    def test_run_with_process_backend(self):
+        addition_node = Node.objects.get(
+            analysis_version=self.addition, configuration={}
+        )
+        square_node = Node.objects.get(
+            analysis_version=self.power, configuration={"exponent": 2}
+        )
+        norm_node = Node.objects.get(analysis_version=self.norm)
+        inputs = {
+            addition_node: [{"x": 1, "y": 1}, {"x": 1, "y": 1}],
+            square_node: [{"base": 1}],
+        }
+        runner = PipelineRunner(pipeline=self.pipeline, quiet=True)
+        results = runner.run(inputs=inputs, max_workers=2, backend="process")
+        addition_results = [
+            run.get_output("result") for run in results[addition_node]
+        ]
+        self.assertListEqual(addition_results, [2.0, 2.0, 6.0])
+        power_results = [
+            run.get_output("result") for run in results[square_node]
+        ]
+        self.assertListEqual(power_results, [1.0, 4.0])
+        norm_result = results[norm_node][0].get_output("norm")
+        self.assertAlmostEqual(norm_result, 6.082762530298219)
+
+    def test_run_with_invalid_backend_raises_value_error(self):
+        runner = PipelineRunner(pipeline=self.pipeline, quiet=True)
+        with self.assertRaises(ValueError):
+            runner.run(inputs={}, backend="invalid")
+
+    def test_run_with_celery_backend_within_task_raises_runtime_error(self):
+        runner = PipelineRunner(pipeline=self.pipeline, quiet=True)
+        with mock.patch("django_analyses.pipeline_runner.current_task"):
+            with self.assertRaises(RuntimeError):
+                runner.run(inputs={}, backend="celery")
@@ -2,7 +2,6 @@ import os
 
 import environ
 
-from tests.interfaces import Addition, Division, NormCalculation, Power
 
 env = environ.Env(
     DB_NAME=(str, "django_analyses"),
@@ -92,10 +91,10 @@ REST_FRAMEWORK = {
 ANALYSIS_BASE_PATH = os.path.join(BASE_DIR, "media", "analysis")
 
 ANALYSIS_INTERFACES = {
-    "addition": {"1.0": Addition},
-    "division": {"1.0": Division},
-    "norm": {"NumPy:1.18": NormCalculation},
-    "power": {"1.0": Power},
+    "addition": {"1.0": "tests.interfaces.Addition"},
+    "division": {"1.0": "tests.interfaces.Division"},
+    "norm": {"NumPy:1.18": "tests.interfaces.NormCalculation"},
+    "power": {"1.0": "tests.interfaces.Power"},
 }
 
 # Date format
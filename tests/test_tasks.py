@@ -0,0 +1,40 @@
+from django.test import TestCase
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.run import Run
+from django_analyses.tasks import execute_node_batch
+from tests.factories.pipeline.node import NodeFactory
+from tests.fixtures import ANALYSES
+
+
+class ExecuteNodeBatchTestCase(TestCase):
+    """
+    Tests for the :func:`~django_analyses.tasks.execute_node_batch` task.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        power = AnalysisVersion.objects.get(analysis__title="power")
+        cls.node = NodeFactory(analysis_version=power)
+
+    def test_execute_node_batch(self):
+        inputs = [{"base": 2, "exponent": 2}, {"base": 3, "exponent": 2}]
+        result = execute_node_batch.apply(args=(self.node.id, inputs)).get()
+        self.assertListEqual(result["failures"], [])
+        run_ids = Run.objects.order_by("id").values_list("id", flat=True)
+        self.assertListEqual(result["run_ids"], list(run_ids))
+
+    def test_execute_node_batch_with_partial_failure(self):
+        inputs = [{"base": 2, "exponent": 2}, {"base": 0, "exponent": -1}]
+        result = execute_node_batch.apply(args=(self.node.id, inputs)).get()
+        self.assertEqual(len(result["failures"]), 1)
+        run = Run.objects.get(id__in=result["run_ids"])
+        self.assertEqual(run.status, "SUCCESS")
+
+    def test_execute_node_batch_with_total_failure(self):
+        inputs = [{"base": 0, "exponent": -1}, {"base": 0, "exponent": -2}]
+        result = execute_node_batch.apply(args=(self.node.id, inputs))
+        self.assertTrue(result.failed())
+        self.assertIsInstance(result.result, RuntimeError)
@@ -0,0 +1,7 @@
+from django.urls import include, path
+
+# Mirrors the installation instructions, as the hyperlinked serializers
+# reverse URLs within the "analyses" namespace.
+urlpatterns = [
+    path("api/", include("django_analyses.urls", namespace="analyses")),
+]
@@ -0,0 +1,34 @@
+from django.test import TestCase
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.utils.output_manager import OutputManager
+from tests.factories.run import RunFactory
+from tests.fixtures import ANALYSES
+
+
+class OutputManagerTestCase(TestCase):
+    """
+    Tests for the :class:`~django_analyses.utils.output_manager.OutputManager`
+    class.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        power = AnalysisVersion.objects.get(analysis__title="power")
+        cls.power_run = RunFactory(analysis_version=power)
+
+    def test_create_output_instances(self):
+        manager = OutputManager(run=self.power_run, results={"result": 4.0})
+        outputs = manager.create_output_instances()
+        self.assertEqual(len(outputs), 1)
+        self.assertEqual(self.power_run.get_output("result"), 4.0)
+
+    def test_unknown_result_keys_are_logged(self):
+        results = {"result": 4.0, "unknown": 1}
+        manager = OutputManager(run=self.power_run, results=results)
+        with self.assertLogs("analysis_exection", level="WARNING") as logs:
+            outputs = manager.create_output_instances()
+        self.assertEqual(len(outputs), 1)
+        self.assertIn("unknown", logs.output[0])
@@ -0,0 +1,112 @@
+import json
+import uuid
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django_analyses.models.run import Run
+from django_analyses.tasks import associate_task_results_task
+from django_analyses.utils.task_results import (
+    ASSOCIATION_MARK_KEY,
+    associate_task_results,
+    collect_run_ids,
+    get_association_mark,
+)
+from django_celery_results.models import TaskResult
+from tests.factories.run import RunFactory
+
+
+def create_task_result(task_name: str, result, **kwargs) -> TaskResult:
+    return TaskResult.objects.create(
+        task_id=str(uuid.uuid4()),
+        task_name=task_name,
+        status="SUCCESS",
+        result=json.dumps(result),
+        **kwargs,
+    )
+
+
+class TaskResultAssociationTestCase(TestCase):
+    """
+    Tests for the :mod:`~django_analyses.utils.task_results` module.
+
+    """
+
+    def setUp(self):
+        cache.delete(ASSOCIATION_MARK_KEY)
+        self.addCleanup(cache.delete, ASSOCIATION_MARK_KEY)
+        self.runs = [RunFactory() for _ in range(3)]
+        self.run_ids = [run.id for run in self.runs]
+
+    def get_task_result_ids(self) -> list:
+        runs = Run.objects.in_bulk(self.run_ids)
+        return [runs[run_id].task_result_id for run_id in self.run_ids]
+
+    def test_collect_run_ids(self):
+        result = [1, [2, {"run_id": 3}, {"run_ids": [4]}], None, True, "5"]
+        self.assertListEqual(collect_run_ids(result), [1, 2, 3, 4])
+
+    def test_batch_execution(self):
+        task_result = create_task_result(
+            "django_analyses.node-batch-execution",
+            {"run_ids": self.run_ids, "failures": []},
+        )
+        expected = [task_result.id] * len(self.run_ids)
+        self.assertListEqual(self.get_task_result_ids(), expected)
+
+    def test_chunk_execution(self):
+        task_args = str(
+            ({"task": "django_analyses.node-execution", "args": ()}, [])
+        )
+        task_result = create_task_result(
+            "celery.starmap", self.run_ids, task_args=task_args
+        )
+        expected = [task_result.id] * len(self.run_ids)
+        self.assertListEqual(self.get_task_result_ids(), expected)
+
+    @override_settings(ANALYSIS_TASK_RESULT_ASSOCIATION="deferred")
+    def test_deferred_association(self):
+        task_results = [
+            create_task_result("django_analyses.node-execution", run_id)
+            for run_id in self.run_ids
+        ]
+        self.assertListEqual(self.get_task_result_ids(), [None] * 3)
+        with self.assertNumQueries(1):
+            associate_task_results(task_results)
+        expected = [task_result.id for task_result in task_results]
+        self.assertListEqual(self.get_task_result_ids(), expected)
+
+    @override_settings(ANALYSIS_TASK_RESULT_ASSOCIATION="deferred")
+    def test_associate_task_results_task(self):
+        task_result = create_task_result(
+            "django_analyses.node-batch-execution",
+            {"run_ids": self.run_ids, "failures": []},
+        )
+        self.assertEqual(associate_task_results_task(), 3)
+        expected = [task_result.id] * len(self.run_ids)
+        self.assertListEqual(self.get_task_result_ids(), expected)
+        self.assertEqual(associate_task_results_task(), 0)
+
+    @override_settings(ANALYSIS_TASK_RESULT_ASSOCIATION="deferred")
+    def test_associate_task_results_task_sets_mark(self):
+        create_task_result("celery.starmap", [], task_args="()")
+        task_result = create_task_result(
+            "django_analyses.node-execution", self.run_ids[0]
+        )
+        self.assertEqual(associate_task_results_task(), 1)
+        self.assertEqual(get_association_mark(), task_result.id)
+        # Processed task results are not scanned again.
+        with self.assertNumQueries(1):
+            self.assertEqual(associate_task_results_task(), 0)
+
+    @override_settings(ANALYSIS_TASK_RESULT_ASSOCIATION="deferred")
+    def test_associate_task_results_task_waits_for_unfinished(self):
+        started = create_task_result("django_analyses.node-execution", None)
+        TaskResult.objects.filter(id=started.id).update(status="STARTED")
+        create_task_result("django_analyses.node-execution", self.run_ids[0])
+        self.assertEqual(associate_task_results_task(), 1)
+        self.assertLess(get_association_mark(), started.id)
+        TaskResult.objects.filter(id=started.id).update(
+            status="SUCCESS", result=json.dumps(self.run_ids[1])
+        )
+        self.assertEqual(associate_task_results_task(), 2)
+        self.assertEqual(self.get_task_result_ids()[1], started.id)
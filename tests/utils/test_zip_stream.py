@@ -0,0 +1,60 @@
+import io
+import tempfile
+import zipfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+from django_analyses.utils.zip_stream import iterate_directory, iterate_zip
+
+
+class ZipStreamTestCase(SimpleTestCase):
+    """
+    Tests for the :mod:`~django_analyses.utils.zip_stream` module.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name)
+        (self.path / "sub").mkdir()
+        (self.path / "a.txt").write_text("a" * 10000)
+        (self.path / "sub" / "b.nii.gz").write_bytes(b"b" * 10000)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read_archive(self, mode: str = "auto", chunk_size: int = 1024):
+        entries = iterate_directory(self.path)
+        chunks = iterate_zip(entries, mode=mode, chunk_size=chunk_size)
+        return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+    def test_archive_contents(self):
+        with self.read_archive() as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertListEqual(
+                archive.namelist(), ["a.txt", "sub/b.nii.gz"]
+            )
+            self.assertEqual(archive.read("a.txt"), b"a" * 10000)
+            self.assertEqual(archive.read("sub/b.nii.gz"), b"b" * 10000)
+
+    def test_auto_compression_stores_compressed_files(self):
+        with self.read_archive() as archive:
+            compression = {
+                info.filename: info.compress_type
+                for info in archive.infolist()
+            }
+        expected = {
+            "a.txt": zipfile.ZIP_DEFLATED,
+            "sub/b.nii.gz": zipfile.ZIP_STORED,
+        }
+        self.assertDictEqual(compression, expected)
+
+    def test_stored_compression(self):
+        with self.read_archive(mode="stored") as archive:
+            for info in archive.infolist():
+                self.assertEqual(info.compress_type, zipfile.ZIP_STORED)
+
+    def test_archive_is_streamed_in_chunks(self):
+        entries = iterate_directory(self.path)
+        chunks = list(iterate_zip(entries, mode="stored", chunk_size=1024))
+        self.assertGreater(len(chunks), 10)
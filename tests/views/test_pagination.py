@@ -0,0 +1,77 @@
+from django.test import TestCase, override_settings
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.run import Run
+from django_analyses.views.pagination import (
+    RunKeysetResultsSetPagination,
+    StandardResultsSetPagination,
+)
+from django_analyses.views.run import RunViewSet
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from tests.factories.pipeline.node import NodeFactory
+from tests.fixtures import ANALYSES
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class KeysetPaginationTestCase(TestCase):
+    """
+    Tests for the
+    :class:`~django_analyses.views.pagination.KeysetResultsSetPagination`
+    class.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Analysis.objects.from_list(ANALYSES)
+        addition = AnalysisVersion.objects.get(analysis__title="addition")
+        node = NodeFactory(analysis_version=addition)
+        for y in range(5):
+            node.run(inputs={"x": 1, "y": y})
+
+    def get_view(self, url: str) -> RunViewSet:
+        view = RunViewSet()
+        view.request = Request(APIRequestFactory().get(url))
+        view.format_kwarg = None
+        return view
+
+    def paginate(self, url: str) -> dict:
+        view = self.get_view(url)
+        queryset = view.filter_queryset(view.get_queryset())
+        page = view.paginator.paginate_queryset(queryset, view.request, view)
+        ids = [run.id for run in page]
+        return view.paginator.get_paginated_response(ids).data
+
+    def test_default_pagination(self):
+        view = self.get_view("/analyses/run/")
+        self.assertIsInstance(view.paginator, StandardResultsSetPagination)
+
+    def test_keyset_pagination_selection(self):
+        view = self.get_view("/analyses/run/?pagination=keyset")
+        self.assertIsInstance(view.paginator, RunKeysetResultsSetPagination)
+
+    def test_keyset_pagination(self):
+        url = "/analyses/run/?pagination=keyset&page_size=2"
+        ids = []
+        while url:
+            data = self.paginate(url)
+            self.assertNotIn("count", data)
+            ids += data["results"]
+            url = data["next"]
+        expected = list(
+            Run.objects.order_by("-created", "-id").values_list(
+                "id", flat=True
+            )
+        )
+        self.assertListEqual(ids, expected)
+
+    def test_keyset_pagination_with_exact_count(self):
+        data = self.paginate("/analyses/run/?pagination=keyset&count=exact")
+        self.assertEqual(data["count"], Run.objects.count())
+
+    def test_keyset_pagination_with_approximate_count(self):
+        data = self.paginate(
+            "/analyses/run/?pagination=keyset&count=approximate"
+        )
+        self.assertIsInstance(data["count"], int)
@@ -0,0 +1,278 @@
+import csv
+import io
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django_analyses.models.analysis import Analysis
+from django_analyses.models.analysis_version import AnalysisVersion
+from django_analyses.models.run import Run
+from django_analyses.utils.messages import MISSING_EXPORT_DEPENDENCY
+from django_analyses.views.run import RunViewSet
+from rest_framework.test import APIRequestFactory, force_authenticate
+from tests.factories.analysis_version import AnalysisVersionFactory
+from tests.factories.pipeline.node import NodeFactory
+from tests.factories.run import RunFactory
+from tests.fixtures import ANALYSES
+
+User = get_user_model()
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class RunViewSetTestCase(TestCase):
+    """
+    Tests for the :class:`~django_analyses.views.run.RunViewSet` class.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="user")
+        for _ in range(5):
+            RunFactory(user=cls.user)
+
+    def list_runs(self, url: str):
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "list"})
+        return view(request).data
+
+    def test_queryset_selects_serialized_relations(self):
+        view = RunViewSet()
+        view.request = None
+        view.format_kwarg = None
+        select_related = view.get_queryset().query.select_related
+        self.assertIn("user", select_related)
+        self.assertIn("analysis", select_related["analysis_version"])
+
+    def test_compact_list(self):
+        data = self.list_runs("/analyses/run/?compact=true")
+        self.assertEqual(data["count"], Run.objects.count())
+        run = data["results"][0]
+        self.assertIsInstance(run["analysis_version"], int)
+        self.assertEqual(run["user"], self.user.id)
+        included = data["included"]
+        version_ids = {run["analysis_version"] for run in data["results"]}
+        included_version_ids = {
+            version["id"] for version in included["analysis_versions"]
+        }
+        self.assertSetEqual(version_ids, included_version_ids)
+        self.assertEqual(len(included["analyses"]), len(version_ids))
+        self.assertListEqual(
+            [user["username"] for user in included["users"]], ["user"]
+        )
+
+    def test_compact_list_query_count(self):
+        # Count, runs, analysis versions, analyses and users.
+        with self.assertNumQueries(5):
+            self.list_runs("/analyses/run/?compact=true")
+        for _ in range(5):
+            RunFactory(user=self.user)
+        with self.assertNumQueries(5):
+            self.list_runs("/analyses/run/?compact=true")
+
+    @override_settings(ROOT_URLCONF="tests.urls")
+    def test_list_query_count(self):
+        # The default user model has no profile, so one is provided to
+        # exercise MiniUserSerializer.get_full_name().
+        profile = property(
+            lambda user: mock.Mock(**{"get_full_name.return_value": "Name"})
+        )
+        with mock.patch.object(User, "profile", profile, create=True):
+            # Count and runs (with their related instances selected).
+            with self.assertNumQueries(2):
+                self.list_runs("/analyses/run/")
+            for i in range(5):
+                RunFactory(user=User.objects.create(username=f"user{i}"))
+            with self.assertNumQueries(2):
+                data = self.list_runs("/analyses/run/")
+        self.assertEqual(data["count"], Run.objects.count())
+        self.assertEqual(data["results"][0]["user"]["full_name"], "Name")
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class RunZipTestCase(TestCase):
+    """
+    Tests for the :meth:`~django_analyses.views.run.RunViewSet.to_zip`
+    action.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="user")
+        cls.zipped_run = RunFactory(user=cls.user)
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / str(self.zipped_run.id)
+        path.mkdir()
+        (path / "output.txt").write_text("output")
+        self.settings_override = override_settings(
+            ANALYSIS_BASE_PATH=self.temp_dir.name
+        )
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.temp_dir.cleanup()
+
+    def get_zip(self, query: str = ""):
+        url = f"/analyses/run/{self.zipped_run.id}/to_zip/{query}"
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "to_zip"})
+        return view(request, pk=self.zipped_run.id)
+
+    def test_to_zip_streams_archive(self):
+        response = self.get_zip()
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content)
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            self.assertEqual(archive.read("output.txt"), b"output")
+
+    def test_to_zip_with_invalid_compression(self):
+        response = self.get_zip("?compression=lzma")
+        self.assertEqual(response.status_code, 400)
+
+    def test_to_zip_with_missing_directory(self):
+        run = RunFactory(user=self.user)
+        url = f"/analyses/run/{run.id}/to_zip/"
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "to_zip"})
+        response = view(request, pk=run.id)
+        self.assertEqual(response.status_code, 404)
+
+    def test_to_zip_with_unknown_run(self):
+        pk = self.zipped_run.id + 1000
+        request = APIRequestFactory().get(f"/analyses/run/{pk}/to_zip/")
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "to_zip"})
+        response = view(request, pk=pk)
+        self.assertEqual(response.status_code, 404)
+
+
+@override_settings(ALLOWED_HOSTS=["testserver"])
+class RunExportTestCase(TestCase):
+    """
+    Tests for the :meth:`~django_analyses.views.run.RunViewSet.export_results`
+    action.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="user")
+        Analysis.objects.from_list(ANALYSES)
+        cls.addition = AnalysisVersion.objects.get(analysis__title="addition")
+        node = NodeFactory(analysis_version=cls.addition)
+        cls.exported_runs = [
+            node.run(inputs={"x": 1, "y": y}) for y in (1, 2)
+        ]
+
+    def export(self, query: str = ""):
+        url = f"/analyses/run/export_results/{query}"
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "export_results"})
+        return view(request)
+
+    def test_export_results_streams_csv(self):
+        query = f"?analysis_version={self.addition.id}&chunk_size=1"
+        response = self.export(query)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment", response["Content-Disposition"])
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+        expected = [
+            {"run_id": str(run.id), "result": result}
+            for run, result in zip(self.exported_runs, ("2.0", "3.0"))
+        ]
+        self.assertListEqual(rows, expected)
+
+    def test_export_results_with_invalid_format(self):
+        response = self.export("?file_format=xlsx")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file_format", response.data)
+
+    def test_export_results_with_invalid_chunk_size(self):
+        response = self.export("?chunk_size=many")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("chunk_size", response.data)
+
+    def test_export_results_without_pyarrow(self):
+        with mock.patch(
+            "django_analyses.utils.results_export.import_pyarrow",
+            side_effect=ImportError(MISSING_EXPORT_DEPENDENCY),
+        ):
+            response = self.export("?file_format=parquet")
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response.data["detail"], MISSING_EXPORT_DEPENDENCY)
+
+
+@override_settings(
+    ALLOWED_HOSTS=["testserver"], ANALYSIS_RUN_STATUS_COUNTERS=True
+)
+class RunSummaryTestCase(TestCase):
+    """
+    Tests for the :meth:`~django_analyses.views.run.RunViewSet.summary`
+    action.
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="user")
+        cls.summarized_run = RunFactory(user=cls.user, status="SUCCESS")
+        RunFactory(user=cls.user)
+
+    def get_summary(self, query: str = ""):
+        request = APIRequestFactory().get(f"/analyses/run/summary/{query}")
+        force_authenticate(request, user=self.user)
+        view = RunViewSet.as_view({"get": "summary"})
+        return view(request)
+
+    def test_summary(self):
+        self.assertEqual(len(self.get_summary().data), 2)
+        version_id = self.summarized_run.analysis_version_id
+        response = self.get_summary(f"?analysis_version={version_id}")
+        summary = response.data
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]["analysis_version"], version_id)
+        self.assertEqual(summary[0]["SUCCESS"], 1)
+
+    @override_settings(ANALYSIS_RUN_STATUS_COUNTERS=False)
+    def test_summary_by_analysis_without_counters(self):
+        analysis_version = AnalysisVersionFactory()
+        for status in ("SUCCESS", "SUCCESS", "FAILURE"):
+            RunFactory(analysis_version=analysis_version, status=status)
+        query = f"?analysis={analysis_version.analysis.id}"
+        summary = self.get_summary(query).data
+        expected = {
+            "analysis_version": analysis_version.id,
+            "total": 3,
+            "PENDING": 0,
+            "STARTED": 0,
+            "SUCCESS": 2,
+            "FAILURE": 1,
+            "mean_duration": None,
+            "p95_duration": None,
+        }
+        self.assertListEqual(summary, [expected])
+
+    def test_summary_query_count(self):
+        with self.assertNumQueries(2):
+            self.get_summary()
+        for _ in range(5):
+            RunFactory(user=self.user, status="FAILURE")
+        with self.assertNumQueries(2):
+            self.get_summary()
+
+    def test_summary_with_invalid_id(self):
+        response = self.get_summary("?analysis=one")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,95 @@
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+from django_analyses.views.utils import (
+    get_file_response,
+    get_html_repr_response,
+)
+from rest_framework.test import APIRequestFactory
+
+
+class FileResponseTestCase(SimpleTestCase):
+    """
+    Tests for the :func:`~django_analyses.views.utils.get_file_response`
+    function.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "data.bin"
+        self.path.write_bytes(bytes(range(100)))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def get_response(self, **headers):
+        request = APIRequestFactory().get("/", **headers)
+        return get_file_response(request, self.path)
+
+    def test_full_response(self):
+        response = self.get_response()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        content = b"".join(response.streaming_content)
+        self.assertEqual(content, bytes(range(100)))
+        response.close()
+
+    def test_range_response(self):
+        response = self.get_response(HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/100")
+        self.assertEqual(response["Content-Length"], "10")
+        content = b"".join(response.streaming_content)
+        self.assertEqual(content, bytes(range(10, 20)))
+
+    def test_open_and_suffix_ranges(self):
+        response = self.get_response(HTTP_RANGE="bytes=95-")
+        content = b"".join(response.streaming_content)
+        self.assertEqual(content, bytes(range(95, 100)))
+        response = self.get_response(HTTP_RANGE="bytes=-3")
+        self.assertEqual(response["Content-Range"], "bytes 97-99/100")
+
+    def test_unsatisfiable_range(self):
+        response = self.get_response(HTTP_RANGE="bytes=200-300")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */100")
+
+
+class HtmlReprResponseTestCase(SimpleTestCase):
+    """
+    Tests for the
+    :func:`~django_analyses.views.utils.get_html_repr_response` function.
+
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = Path(self.temp_dir.name) / "aseg.stats"
+        path.write_text("# stats")
+        self.renders = []
+        self.instance = SimpleNamespace(
+            value=str(path), _repr_html_=self.render
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def render(self):
+        self.renders.append(True)
+        return "<div>preview</div>"
+
+    def get_response(self, **headers):
+        request = APIRequestFactory().get("/", **headers)
+        return get_html_repr_response(request, self.instance)
+
+    def test_conditional_request(self):
+        response = self.get_response()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+        etag = response["ETag"]
+        response = self.get_response(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(len(self.renders), 1)